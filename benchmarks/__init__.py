@@ -0,0 +1,3 @@
+"""
+Micro-benchmarks for the engine hot paths: python -m benchmarks --help
+"""
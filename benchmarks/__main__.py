@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+from .cases import all_cases
+from .harness import REGRESSION_TOLERANCE, Result, compare, measure, save_baseline
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+
+
+def _variance_results(sims: int, reps: int) -> list[Result]:
+	# Collapse-risk strategies, rated by effective samples per second (engine/variance.py)
+	from engine.variance import benchmark_strategies
+
+	return [
+		Result(
+			name=f"collapse_ess/{row['strategy']}",
+			ops_per_sec=row["ess_per_sec"],
+			mean=row["ess_per_sec"],
+			stdev_pct=0.0,
+			samples=reps,
+			loops=1,
+		)
+		for row in benchmark_strategies(sims=sims, reps=reps)
+	]
+
+
+def main() -> None:
+	p = argparse.ArgumentParser(
+		prog="python -m benchmarks", description="Engine hot-path benchmarks."
+	)
+	p.add_argument("-k", "--filter", type=str, default="", help="Only run cases containing this.")
+	p.add_argument("--quick", action="store_true", help="Fewer samples; skip the slow cases.")
+	p.add_argument("--repeats", type=int, default=7, help="Samples per case.")
+	p.add_argument("--min-time", type=float, default=0.1, help="Minimum seconds per sample.")
+	p.add_argument(
+		"--variance", action="store_true", help="Also rate collapse strategies by ESS/sec."
+	)
+	p.add_argument(
+		"--save",
+		nargs="?",
+		const=str(DEFAULT_BASELINE),
+		default=None,
+		help="Save results as a baseline JSON (default: benchmarks/baseline.json).",
+	)
+	p.add_argument(
+		"--compare",
+		nargs="?",
+		const=str(DEFAULT_BASELINE),
+		default=None,
+		help="Compare against a baseline JSON; exits 1 on regressions.",
+	)
+	p.add_argument(
+		"--tolerance",
+		type=float,
+		default=REGRESSION_TOLERANCE,
+		help="Slowdown (fraction) that counts as a regression with --compare.",
+	)
+	p.add_argument("--list", action="store_true", help="List case names and exit.")
+	args = p.parse_args()
+
+	cases = [c for c in all_cases() if args.filter in c.name]
+	if args.quick:
+		cases = [c for c in cases if not c.slow]
+	if args.list:
+		for c in cases:
+			print(c.name)
+		return
+
+	repeats = 3 if args.quick else args.repeats
+	min_time = min(args.min_time, 0.05) if args.quick else args.min_time
+
+	print(f"{'case':<44} {'ops/sec':>14} {'+/-':>7} {'samples':>8}")
+	results: list[Result] = []
+	for case in cases:
+		r = measure(case, repeats=repeats, min_time=min_time)
+		results.append(r)
+		print(f"{r.name:<44} {r.ops_per_sec:>14,.1f} {r.stdev_pct:>6.1f}% {r.samples:>4}x{r.loops}")
+
+	if args.variance:
+		for r in _variance_results(sims=200, reps=5 if args.quick else 30):
+			results.append(r)
+			print(f"{r.name:<44} {r.ops_per_sec:>14,.1f} {'-':>7} {r.samples:>8}")
+
+	if args.compare:
+		lines, regressed = compare(Path(args.compare), results, tolerance=args.tolerance)
+		print(f"\nvs {args.compare}")
+		for line in lines:
+			print(line)
+		if regressed:
+			print(f"\n{len(regressed)} regression(s) beyond {args.tolerance:.0%}")
+
+	if args.save:
+		save_baseline(Path(args.save), results)
+		print(f"- {args.save}")
+
+	if args.compare and regressed:
+		sys.exit(1)
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import contextlib
+import json
+import random
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+from engine.bracket import build_empty_bracket, bracket_to_json, load_bracket, write_bracket
+from engine.duel import render_duel_card
+from engine.ensemble import RealityEnsemble
+from engine.generate import generate_brackets
+from engine.matchups import load_matchup_table
+from engine.packed import pack_bracket, unpack_bracket
+from engine.persona import profile_from_seed
+from engine.pool import (
+	aggregate_pool,
+	render_office_summary_card,
+	render_superlatives_card,
+	summarize_pool,
+	superlatives,
+)
+from engine.roast import select_roast_lines
+from engine.score import score_bracket
+from engine.share import render_share_card
+from engine.simulate import pick_winner
+from engine.teams import load_teams
+
+from .harness import Case
+
+ROOT = Path(__file__).resolve().parent.parent
+DATA = ROOT / "data" / "teams.json"
+
+POOL_SIZES = (24, 1_000, 100_000)
+SCORE_SIMS = (100, 400, 1600)
+
+
+def _env() -> dict[str, Any]:
+	teams = load_teams(DATA)
+	table = load_matchup_table(DATA, teams)
+	return {"teams": teams, "table": table}
+
+
+def _completed(seed: int, table) -> Any:
+	# run.py owns _complete_bracket; it is importable when running from the repo root
+	from run import _complete_bracket
+
+	bracket = build_empty_bracket(list(table.teams))
+	_complete_bracket(bracket, seed=seed, table=table)
+	return bracket
+
+
+def _pool_rows(n: int) -> list[dict[str, Any]]:
+	rng = random.Random(n)
+	keys = ["overconfidence", "chaos_addiction", "brand_bias", "narrative_bias", "collapse_risk"]
+	archetypes = ["Chaos Goblin", "Quiet Assassin", "Social Copycat", "Brand Worshipper"]
+	rows = [
+		{
+			"seed": i,
+			"archetype": rng.choice(archetypes),
+			"headline": "ANNOYINGLY STABLE.",
+			"shareability_score": rng.random(),
+			"breakdown": {},
+			"scores": {k: rng.random() for k in keys},
+		}
+		for i in range(n)
+	]
+	return sorted(rows, key=lambda r: r["shareability_score"], reverse=True)
+
+
+def _pick_winner_cases(env: dict[str, Any]) -> list[Case]:
+	teams = env["teams"]
+	table = env["table"]
+	pairs = [(teams[i], teams[j]) for i in range(0, 64, 2) for j in (i + 1,)]
+	profile = profile_from_seed(42)
+
+	def make(mode: str, with_profile: bool, with_table: bool) -> Callable[[], Callable[[], Any]]:
+		def setup() -> Callable[[], Any]:
+			rng = random.Random(1)
+			prof = profile if with_profile else None
+			tbl = table if with_table else None
+
+			def run() -> None:
+				for a, b in pairs:
+					pick_winner(a, b, rng, 1, mode=mode, profile=prof, table=tbl)
+
+			return run
+
+		return setup
+
+	cases = []
+	for mode, with_profile in (("reality", False), ("bracket", False), ("bracket", True)):
+		for with_table in (False, True):
+			label = mode + ("+profile" if with_profile else "") + ("+table" if with_table else "")
+			setup = make(mode, with_profile, with_table)
+			cases.append(Case(f"pick_winner/{label}", setup, ops=len(pairs)))
+	return cases
+
+
+def _generation_cases(env: dict[str, Any]) -> list[Case]:
+	table = env["table"]
+
+	def complete() -> Callable[[], Any]:
+		seeds = iter(range(10**9))
+		return lambda: _completed(next(seeds), table)
+
+	def batch() -> Callable[[], Any]:
+		return lambda: generate_brackets(range(1000, 1256), table)
+
+	return [
+		Case("generate/_complete_bracket", complete),
+		Case("generate/generate_brackets[256]", batch, ops=256),
+	]
+
+
+def _score_cases(env: dict[str, Any]) -> list[Case]:
+	teams = env["teams"]
+	table = env["table"]
+	bracket = _completed(7, table)
+
+	def mc(sims: int) -> Callable[[], Callable[[], Any]]:
+		def setup() -> Callable[[], Any]:
+			return lambda: score_bracket(bracket, random.Random(1337), sims=sims, table=table)
+
+		return setup
+
+	def shared() -> Callable[[], Any]:
+		ens = RealityEnsemble.simulate(teams, random.Random(1337), sims=400, table=table)
+		return lambda: score_bracket(
+			bracket, random.Random(1337), sims=400, ensemble=ens, table=table
+		)
+
+	def exact() -> Callable[[], Any]:
+		return lambda: score_bracket(bracket, random.Random(1337), method="exact", table=table)
+
+	def adaptive() -> Callable[[], Any]:
+		return lambda: score_bracket(
+			bracket, random.Random(1337), sims=400, method="adaptive", table=table
+		)
+
+	cases = [Case(f"score_bracket/mc[sims={s}]", mc(s), slow=s > 400) for s in SCORE_SIMS]
+	cases += [
+		Case("score_bracket/mc+ensemble[400]", shared),
+		Case("score_bracket/exact", exact),
+		Case("score_bracket/adaptive[<=400]", adaptive),
+	]
+	return cases
+
+
+def _pool_cases(env: dict[str, Any]) -> list[Case]:
+	def make(fn: Callable[[list[dict[str, Any]]], Any], n: int) -> Callable[[], Callable[[], Any]]:
+		def setup() -> Callable[[], Any]:
+			rows = _pool_rows(n)
+			return lambda: fn(rows)
+
+		return setup
+
+	cases = []
+	for n in POOL_SIZES:
+		slow = n >= 100_000
+		cases.append(Case(f"pool/summarize_pool[n={n}]", make(summarize_pool, n), slow=slow))
+		cases.append(Case(f"pool/superlatives[n={n}]", make(superlatives, n), slow=slow))
+		cases.append(Case(f"pool/aggregate_pool[n={n}]", make(aggregate_pool, n), slow=slow))
+	return cases
+
+
+def _render_cases(env: dict[str, Any]) -> list[Case]:
+	table = env["table"]
+	report = score_bracket(_completed(7, table), random.Random(1337), method="exact", table=table)
+	roast_lines = select_roast_lines(report.reasons, "normal")
+	rows = _pool_rows(24)
+	summary = summarize_pool(rows)
+
+	return [
+		Case(
+			"render/share_card",
+			lambda: lambda: render_share_card(report.archetype, report.scores, roast_lines),
+		),
+		Case("render/pool_card", lambda: lambda: render_office_summary_card(summary)),
+		Case("render/superlatives_card", lambda: lambda: render_superlatives_card(summary)),
+		Case("render/duel_card", lambda: lambda: render_duel_card(rows[0], rows[1])),
+	]
+
+
+def _json_cases(env: dict[str, Any]) -> list[Case]:
+	teams = env["teams"]
+	table = env["table"]
+	bracket = _completed(7, table)
+
+	def dumps_loads() -> Callable[[], Any]:
+		return lambda: json.loads(json.dumps(bracket_to_json(bracket), indent=2))
+
+	@contextlib.contextmanager
+	def file_round_trip() -> Iterator[Callable[[], Any]]:
+		with tempfile.TemporaryDirectory(prefix="signal-bench-") as tmp:
+			path = Path(tmp) / "bracket.json"
+
+			def run() -> None:
+				write_bracket(bracket, path)
+				load_bracket(path, teams)
+
+			yield run
+
+	def packed_round_trip() -> Callable[[], Any]:
+		return lambda: unpack_bracket(pack_bracket(bracket, table.teams))
+
+	return [
+		Case("bracket_json/dumps+loads", dumps_loads),
+		Case("bracket_json/write+load", file_round_trip),
+		Case("bracket_json/pack+unpack", packed_round_trip),
+	]
+
+
+def all_cases() -> list[Case]:
+	env = _env()
+	return (
+		_pick_winner_cases(env)
+		+ _generation_cases(env)
+		+ _score_cases(env)
+		+ _pool_cases(env)
+		+ _render_cases(env)
+		+ _json_cases(env)
+	)
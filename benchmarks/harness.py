@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import contextlib
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, ContextManager, Optional
+
+# Default regression threshold for --compare: median ops/sec down by more than 10%
+REGRESSION_TOLERANCE = 0.10
+
+
+@dataclass
+class Case:
+	"""
+	name: "group/case", e.g. "pick_winner/bracket+profile"
+	setup: builds the state once and returns the callable that is timed, or a context
+		manager yielding it (exited after timing, e.g. to remove temporary files)
+	ops: operations done by one call (ops/sec counts these, e.g. seeds per batch)
+	"""
+
+	name: str
+	setup: Callable[[], Callable[[], Any] | ContextManager[Callable[[], Any]]]
+	ops: int = 1
+	slow: bool = False
+
+
+@dataclass
+class Result:
+	name: str
+	ops_per_sec: float  # median over samples
+	mean: float
+	stdev_pct: float
+	samples: int
+	loops: int  # calls per sample
+
+	def to_dict(self) -> dict[str, Any]:
+		return {
+			"ops_per_sec": self.ops_per_sec,
+			"mean": self.mean,
+			"stdev_pct": self.stdev_pct,
+			"samples": self.samples,
+			"loops": self.loops,
+		}
+
+
+def _sample(
+	case: Case, fn: Callable[[], Any], repeats: int, min_time: float, warmup: float
+) -> tuple[list[float], int]:
+	# (ops/sec per sample, calls per sample)
+	deadline = time.perf_counter() + warmup
+	fn()
+	while time.perf_counter() < deadline:
+		fn()
+
+	loops = 1
+	while True:
+		start = time.perf_counter()
+		for _ in range(loops):
+			fn()
+		elapsed = time.perf_counter() - start
+		if elapsed >= min_time or loops >= 1 << 20:
+			break
+		loops *= 2 if elapsed <= 0 else max(2, min(10, int(min_time / elapsed) + 1))
+
+	rates: list[float] = []
+	gc_was_enabled = gc.isenabled()
+	gc.disable()
+	try:
+		for _ in range(repeats):
+			start = time.perf_counter()
+			for _ in range(loops):
+				fn()
+			elapsed = time.perf_counter() - start
+			rates.append(loops * case.ops / elapsed)
+	finally:
+		if gc_was_enabled:
+			gc.enable()
+	return rates, loops
+
+
+def measure(case: Case, repeats: int = 7, min_time: float = 0.1, warmup: float = 0.05) -> Result:
+	"""
+	Warms up, picks a loop count so one sample takes at least `min_time` seconds,
+	then takes `repeats` samples. GC is paused while timing, as in timeit.
+	"""
+	made = case.setup()
+	if not isinstance(made, contextlib.AbstractContextManager):
+		made = contextlib.nullcontext(made)
+	with made as fn:
+		rates, loops = _sample(case, fn, repeats, min_time, warmup)
+
+	mean = statistics.fmean(rates)
+	stdev = statistics.stdev(rates) if len(rates) > 1 else 0.0
+	return Result(
+		name=case.name,
+		ops_per_sec=statistics.median(rates),
+		mean=mean,
+		stdev_pct=100.0 * stdev / mean if mean else 0.0,
+		samples=len(rates),
+		loops=loops,
+	)
+
+
+def environment() -> dict[str, str]:
+	return {
+		"python": sys.version.split()[0],
+		"implementation": platform.python_implementation(),
+		"machine": platform.machine(),
+		"platform": platform.platform(),
+	}
+
+
+def save_baseline(path: Path, results: list[Result]) -> None:
+	payload = {"environment": environment(), "results": {r.name: r.to_dict() for r in results}}
+	path.parent.mkdir(parents=True, exist_ok=True)
+	path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+
+def compare(
+	path: Path, results: list[Result], tolerance: float = REGRESSION_TOLERANCE
+) -> tuple[list[str], list[str]]:
+	"""
+	Returns (report lines, names of cases that regressed beyond `tolerance`).
+	A case only counts as regressed if the drop is also larger than its sample noise.
+	"""
+	baseline = json.loads(path.read_text(encoding="utf-8"))["results"]
+	lines: list[str] = []
+	regressed: list[str] = []
+	for r in results:
+		base: Optional[dict[str, Any]] = baseline.get(r.name)
+		if base is None:
+			lines.append(f"{r.name:<44} {'new':>10}")
+			continue
+		change = r.ops_per_sec / base["ops_per_sec"] - 1.0
+		noise = max(r.stdev_pct, base.get("stdev_pct", 0.0)) / 100.0
+		flag = ""
+		if change < -tolerance and -change > noise:
+			flag = "  REGRESSION"
+			regressed.append(r.name)
+		elif change > tolerance and change > noise:
+			flag = "  faster"
+		lines.append(f"{r.name:<44} {change * 100:>+9.1f}%{flag}")
+	return lines, regressed
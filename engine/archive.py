@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import json
+import mmap
+import struct
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Iterator, Optional, Sequence
+
+from .packed import TOTAL_SLOTS, PackedBracket, PickMatrix, unpack_bracket
+from .score import report_from_scores
+from .types import Bracket, SignalReport, Team
+
+# Pool archive: one file per pool instead of four files per seed.
+#
+# Layout (little-endian):
+#   header   magic, version, team count, record count, first seed, team blob length, R1 field
+#   teams    JSON team table (same fields as data/teams.json), padded to 8 bytes
+#   records  fixed-width, one per seed, in ascending seed order:
+#            seed, 63 winner indices, archetype code, 5 scores, shareability
+
+MAGIC = b"SMMPOOL\x00"
+VERSION = 1
+
+_HEADER = struct.Struct("<8sHHQqI64s")
+_RECORD = struct.Struct("<q63sB5dd")
+
+SCORE_KEYS = ["overconfidence", "chaos_addiction", "narrative_bias", "brand_bias", "collapse_risk"]
+
+ARCHETYPES = [
+	"Chaos Goblin",
+	"Narrative Romantic",
+	"Brand Worshipper",
+	"Spreadsheet Liar",
+	"Quiet Assassin",
+	"Social Copycat",
+]
+
+
+def _pad8(n: int) -> int:
+	return (n + 7) & ~7
+
+
+@dataclass(frozen=True)
+class ArchiveRecord:
+	seed: int
+	packed: PackedBracket
+	archetype: str
+	scores: dict[str, float]
+	shareability: float
+
+
+class PoolArchiveWriter:
+	"""
+	Appends records in ascending seed order; the record count is patched in on close().
+	"""
+
+	def __init__(self, path: str | Path, teams: Sequence[Team], field: bytes) -> None:
+		self.path = Path(path)
+		self.path.parent.mkdir(parents=True, exist_ok=True)
+		self.teams = tuple(teams)
+		self.field = field
+		self.count = 0
+		self.first_seed = 0
+		self._last_seed: Optional[int] = None
+
+		blob = json.dumps([asdict(t) for t in self.teams], separators=(",", ":")).encode("utf-8")
+		self._blob_len = len(blob)
+		self._fh = open(self.path, "wb")
+		self._fh.write(self._header())
+		self._fh.write(blob)
+		self._fh.write(b"\x00" * (_pad8(_HEADER.size + len(blob)) - _HEADER.size - len(blob)))
+
+	def _header(self) -> bytes:
+		return _HEADER.pack(
+			MAGIC, VERSION, len(self.teams), self.count, self.first_seed, self._blob_len, self.field
+		)
+
+	def add(
+		self, seed: int, packed: PackedBracket, report: SignalReport, shareability: float
+	) -> None:
+		if packed.teams != self.teams or packed.field != self.field:
+			raise ValueError("Bracket was packed against a different team table or field")
+		if self._last_seed is not None and seed <= self._last_seed:
+			raise ValueError(
+				f"Seeds must be added in ascending order (got {seed} after {self._last_seed})"
+			)
+		if self._last_seed is None:
+			self.first_seed = seed
+		self._last_seed = seed
+
+		self._fh.write(
+			_RECORD.pack(
+				seed,
+				packed.winners,
+				ARCHETYPES.index(report.archetype),
+				*(float(report.scores[k]) for k in SCORE_KEYS),
+				float(shareability),
+			)
+		)
+		self.count += 1
+
+	def close(self) -> None:
+		if self._fh.closed:
+			return
+		self._fh.seek(0)
+		self._fh.write(self._header())
+		self._fh.close()
+
+	def __enter__(self) -> "PoolArchiveWriter":
+		return self
+
+	def __exit__(self, *exc) -> None:
+		self.close()
+
+
+class PoolArchive:
+	"""
+	Read-only, memory-mapped view of a pool archive.
+	Looking up a seed reads one fixed-width record; nothing else is parsed.
+	"""
+
+	def __init__(self, path: str | Path) -> None:
+		self.path = Path(path)
+		self._fh = open(self.path, "rb")
+		self._mm = mmap.mmap(self._fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+		header = _HEADER.unpack_from(self._mm, 0)
+		magic, version, n_teams, count, first_seed, blob_len, field = header
+		if magic != MAGIC:
+			raise ValueError(f"{self.path} is not a pool archive")
+		if version != VERSION:
+			raise ValueError(f"Unsupported pool archive version: {version}")
+
+		blob = self._mm[_HEADER.size : _HEADER.size + blob_len]
+		self.teams = tuple(Team(**item) for item in json.loads(blob.decode("utf-8")))
+		if len(self.teams) != n_teams:
+			raise ValueError(f"Expected {n_teams} teams in archive, got {len(self.teams)}")
+		self.field = bytes(field)
+		self.count = count
+		self.first_seed = first_seed
+		self._start = _pad8(_HEADER.size + blob_len)
+
+	def __len__(self) -> int:
+		return self.count
+
+	def _seed_at(self, i: int) -> int:
+		return struct.unpack_from("<q", self._mm, self._start + i * _RECORD.size)[0]
+
+	def _position(self, seed: int) -> int:
+		# Pools use consecutive seeds, so the record is normally at seed - first_seed.
+		i = seed - self.first_seed
+		if 0 <= i < self.count and self._seed_at(i) == seed:
+			return i
+		lo, hi = 0, self.count
+		while lo < hi:
+			mid = (lo + hi) // 2
+			if self._seed_at(mid) < seed:
+				lo = mid + 1
+			else:
+				hi = mid
+		if lo < self.count and self._seed_at(lo) == seed:
+			return lo
+		raise KeyError(seed)
+
+	def _record_at(self, i: int) -> ArchiveRecord:
+		seed, winners, code, *values = _RECORD.unpack_from(self._mm, self._start + i * _RECORD.size)
+		shareability = values.pop()
+		return ArchiveRecord(
+			seed=seed,
+			packed=PackedBracket(self.teams, self.field, winners[:TOTAL_SLOTS]),
+			archetype=ARCHETYPES[code],
+			scores=dict(zip(SCORE_KEYS, values)),
+			shareability=shareability,
+		)
+
+	def __contains__(self, seed: int) -> bool:
+		try:
+			self._position(seed)
+		except KeyError:
+			return False
+		return True
+
+	def record(self, seed: int) -> ArchiveRecord:
+		return self._record_at(self._position(seed))
+
+	def bracket(self, seed: int) -> Bracket:
+		return unpack_bracket(self.record(seed).packed)
+
+	def report(self, seed: int) -> SignalReport:
+		rec = self.record(seed)
+		return report_from_scores(rec.packed, rec.scores)
+
+	def __iter__(self) -> Iterator[ArchiveRecord]:
+		for i in range(self.count):
+			yield self._record_at(i)
+
+	def pick_matrix(self) -> PickMatrix:
+		"""
+		Every record's picks as one (records x 63) PickMatrix, in seed order.
+		"""
+		view = memoryview(self._mm)[self._start : self._start + self.count * _RECORD.size]
+		seeds: list[int] = []
+		data = bytearray()
+		for seed, winners, *_rest in _RECORD.iter_unpack(view):
+			seeds.append(seed)
+			data += winners
+		view.release()
+		return PickMatrix(self.teams, self.field, seeds, data)
+
+	def iter_brackets(self) -> Iterator[tuple[int, Bracket]]:
+		"""
+		Streams (seed, Bracket) in seed order, like calling load_bracket per seed.
+		"""
+		for rec in self:
+			yield rec.seed, unpack_bracket(rec.packed)
+
+	def close(self) -> None:
+		self._mm.close()
+		self._fh.close()
+
+	def __enter__(self) -> "PoolArchive":
+		return self
+
+	def __exit__(self, *exc) -> None:
+		self.close()
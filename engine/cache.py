@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+# Content-addressed store for per-seed artifacts.
+#
+# An entry lives at <root>/<stage>/<key[:2]>/<key>.json, where key hashes everything the
+# stage's output depends on. The roast stage is keyed by the score stage's output (the
+# report itself), so changing --roast reuses the bracket and report and redoes only the rest.
+
+ENGINE_VERSION = "0.1.0"
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+DEFAULT_MAX_AGE = 30 * 24 * 3600.0
+
+
+@lru_cache(maxsize=None)
+def _sources_digest(paths: tuple[Path, ...]) -> str:
+	h = hashlib.sha256()
+	for p in paths:
+		h.update(p.name.encode("utf-8"))
+		h.update(p.read_bytes())
+	return h.hexdigest()
+
+
+def engine_version(extra_sources: Iterable[str | Path] = ()) -> str:
+	"""
+	ENGINE_VERSION plus a hash of the engine sources (and any extra files, e.g. run.py),
+	so editing the code invalidates the cache without anyone bumping a number.
+	"""
+	sources = sorted(Path(__file__).resolve().parent.glob("*.py"))
+	sources += [Path(p).resolve() for p in extra_sources]
+	return f"{ENGINE_VERSION}+{_sources_digest(tuple(sources))[:16]}"
+
+
+class ArtifactCache:
+	"""
+	JSON entries keyed by content hash, evicted by age and then by total size (oldest first).
+	Writes are atomic (temp file + rename), so worker processes can share one cache directory.
+	"""
+
+	def __init__(
+		self,
+		root: str | Path,
+		version: str,
+		max_bytes: int = DEFAULT_MAX_BYTES,
+		max_age: float = DEFAULT_MAX_AGE,
+	) -> None:
+		self.root = Path(root)
+		self.version = version
+		self.max_bytes = max_bytes
+		self.max_age = max_age
+
+	def key(self, *parts: Any) -> str:
+		blob = json.dumps([self.version, *parts], separators=(",", ":"))
+		return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+	def _path(self, stage: str, key: str) -> Path:
+		return self.root / stage / key[:2] / f"{key}.json"
+
+	def get(self, stage: str, key: str) -> Optional[dict[str, Any]]:
+		path = self._path(stage, key)
+		try:
+			entry = json.loads(path.read_text(encoding="utf-8"))
+		except (FileNotFoundError, json.JSONDecodeError):
+			return None
+		# Reads refresh the mtime, which is what eviction goes by
+		try:
+			os.utime(path)
+		except OSError:
+			pass
+		return entry
+
+	def put(self, stage: str, key: str, entry: dict[str, Any]) -> None:
+		path = self._path(stage, key)
+		path.parent.mkdir(parents=True, exist_ok=True)
+		tmp = path.with_suffix(f".{os.getpid()}.tmp")
+		tmp.write_text(json.dumps(entry, separators=(",", ":")), encoding="utf-8")
+		os.replace(tmp, path)
+
+	def prune(self) -> tuple[int, int]:
+		"""
+		Drops entries older than max_age, then the least recently used ones until the
+		cache fits in max_bytes. Returns (entries removed, bytes kept).
+		"""
+		if not self.root.exists():
+			return 0, 0
+		now = time.time()
+		removed = 0
+		entries: list[tuple[float, int, Path]] = []
+		for path in self.root.glob("*/*/*.json"):
+			try:
+				st = path.stat()
+			except FileNotFoundError:
+				continue
+			if now - st.st_mtime > self.max_age:
+				path.unlink(missing_ok=True)
+				removed += 1
+			else:
+				entries.append((st.st_mtime, st.st_size, path))
+
+		total = sum(size for _, size, _ in entries)
+		entries.sort()
+		for _, size, path in entries:
+			if total <= self.max_bytes:
+				break
+			path.unlink(missing_ok=True)
+			total -= size
+			removed += 1
+		return removed, total
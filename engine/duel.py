@@ -1,5 +1,25 @@
 from __future__ import annotations
 
+import heapq
+import math
+from typing import Callable, Optional, Sequence
+
+# The four duel axes, in card order
+DUEL_METRICS = ("chaos", "brand", "survive", "danger")
+
+# Pair distances over the duel axes
+CONTRAST_METRICS = ("euclidean", "manhattan", "chebyshev")
+
+# Search directions for extreme points: the four axes and the eight sign diagonals
+# (+-1 on every axis, up to overall sign). For manhattan and chebyshev the farthest pair
+# is extreme along one of these, so the candidate pass alone is usually exact.
+_DIRECTIONS = [tuple(1.0 if i == axis else 0.0 for i in range(4)) for axis in range(4)] + [
+    (1.0, s1, s2, s3) for s1 in (1.0, -1.0) for s2 in (1.0, -1.0) for s3 in (1.0, -1.0)
+]
+
+DEFAULT_DUEL_HEADLINE = "DUEL: SAFE-AND-SURE vs SAFE-AND-DEAD"
+CONTRAST_DUEL_HEADLINE = "DUEL: MAXIMUM CONTRAST"
+
 
 def _clamp01(x: float) -> float:
     return max(0.0, min(1.0, x))
@@ -17,7 +37,100 @@ def _winner(a: float, b: float) -> str:
     return "LEFT" if a > b else "RIGHT"
 
 
-def render_duel_card(left: dict, right: dict) -> str:
+def duel_vector(scores: dict) -> tuple[float, float, float, float]:
+    """
+    (chaos, brand, survive, danger) as the duel card computes them from a row's scores.
+    """
+    chaos = float(scores.get("chaos_addiction", 0.0))
+    brand = float(scores.get("brand_bias", 0.0))
+    survive = 1.0 - float(scores.get("collapse_risk", 0.0))
+    danger = float(scores.get("overconfidence", 0.0)) * (1.0 + chaos)
+    return chaos, brand, survive, danger
+
+
+def _metric(name: str) -> Callable[[Sequence[float], Sequence[float]], float]:
+    if name == "euclidean":
+        return lambda a, b: math.sqrt(sum((x - y) * (x - y) for x, y in zip(a, b)))
+    if name == "manhattan":
+        return lambda a, b: sum(abs(x - y) for x, y in zip(a, b))
+    if name == "chebyshev":
+        return lambda a, b: max(abs(x - y) for x, y in zip(a, b))
+    raise ValueError(f"Unknown contrast metric: {name} (one of: {', '.join(CONTRAST_METRICS)})")
+
+
+def contrast_pairs(
+    vecs: Sequence[Sequence[float]],
+    keys: Sequence[int],
+    k: int = 1,
+    metric: str = "euclidean",
+    extremes: Optional[int] = None,
+) -> list[tuple[float, int, int]]:
+    """
+    The k most contrasting pairs among duel vectors: [(distance, i, j)] as indices into
+    `vecs`, farthest first, with keys[i] < keys[j]. `keys` (seeds) break ties, so the
+    result does not depend on the order of the input.
+
+    Candidates are the `extremes` points at each end of every search direction; their pairs
+    give a working k-th distance d. Any pair at least d apart has both ends at least
+    d - R from the centre (R = the largest distance from the centre), so only points that
+    far out are searched exactly. The result is exact for every metric.
+    """
+    dist = _metric(metric)
+    n = len(vecs)
+    if n < 2 or k < 1:
+        return []
+    k = min(k, n * (n - 1) // 2)
+
+    # Extreme points on the projected axes (ties to the lower key)
+    m = extremes if extremes is not None else max(4, k)
+    order = sorted(range(n), key=keys.__getitem__)
+    candidates: set[int] = set()
+    for d0, d1, d2, d3 in _DIRECTIONS:
+        proj = [d0 * a + d1 * b + d2 * c + d3 * e for a, b, c, e in vecs]
+        candidates.update(heapq.nsmallest(m, order, key=proj.__getitem__))
+        candidates.update(heapq.nlargest(m, order, key=proj.__getitem__))
+
+    # Centre of the bounding box, and how far out each point sits
+    centre = [(min(v[a] for v in vecs) + max(v[a] for v in vecs)) / 2.0 for a in range(4)]
+    radius = [dist(v, centre) for v in vecs]
+    reach = max(radius)
+
+    def best_pairs(ids: list[int]) -> list[tuple[float, int, int]]:
+        ids = sorted(ids, key=keys.__getitem__)
+        # Min-heap of the k best; the weakest (closest, then highest keys) sits on top
+        heap: list[tuple[float, int, int, int, int]] = []
+        for x, i in enumerate(ids):
+            vi = vecs[i]
+            ki = -keys[i]
+            for j in ids[x + 1 :]:
+                item = (dist(vi, vecs[j]), ki, -keys[j], i, j)
+                if len(heap) < k:
+                    heapq.heappush(heap, item)
+                elif item > heap[0]:
+                    heapq.heapreplace(heap, item)
+        heap.sort(reverse=True)
+        return [(d, i, j) for d, _ki, _kj, i, j in heap]
+
+    pairs = best_pairs(list(candidates))
+    floor = pairs[-1][0] - reach if len(pairs) == k else -math.inf
+    outer = [i for i in range(n) if radius[i] >= floor - 1e-12]
+    if not candidates.issuperset(outer):
+        pairs = best_pairs(outer)
+    return pairs
+
+
+def contrast_rows(
+    rows: list[dict], k: int = 1, metric: str = "euclidean"
+) -> list[tuple[float, dict, dict]]:
+    """
+    contrast_pairs over leaderboard rows: [(distance, row, row)], lower seed first.
+    """
+    vecs = [duel_vector(r["scores"]) for r in rows]
+    seeds = [int(r["seed"]) for r in rows]
+    return [(d, rows[i], rows[j]) for d, i, j in contrast_pairs(vecs, seeds, k, metric)]
+
+
+def render_duel_card(left: dict, right: dict, headline: str = DEFAULT_DUEL_HEADLINE) -> str:
     """
     left/right:
       {
@@ -48,17 +161,8 @@ def render_duel_card(left: dict, right: dict) -> str:
     Rs = R["scores"]
 
     # Core metrics
-    chaos_L = float(Ls.get("chaos_addiction", 0.0))
-    chaos_R = float(Rs.get("chaos_addiction", 0.0))
-
-    brand_L = float(Ls.get("brand_bias", 0.0))
-    brand_R = float(Rs.get("brand_bias", 0.0))
-
-    survive_L = 1.0 - float(Ls.get("collapse_risk", 0.0))
-    survive_R = 1.0 - float(Rs.get("collapse_risk", 0.0))
-
-    danger_L = float(Ls.get("overconfidence", 0.0)) * (1.0 + chaos_L)
-    danger_R = float(Rs.get("overconfidence", 0.0)) * (1.0 + chaos_R)
+    chaos_L, brand_L, survive_L, danger_L = duel_vector(Ls)
+    chaos_R, brand_R, survive_R, danger_R = duel_vector(Rs)
 
     # Winners
     w_chaos = _winner(chaos_L, chaos_R)
@@ -69,8 +173,6 @@ def render_duel_card(left: dict, right: dict) -> str:
     def crown(side: str, w: str) -> str:
         return "👑" if w == side else "  " if w != "TIE" else "🤝"
 
-    headline = "DUEL: SAFE-AND-SURE vs SAFE-AND-DEAD"
-
     lines = []
     lines.append(top())
     lines.append(line("              SIGNAL MADNESS — DUEL           "))
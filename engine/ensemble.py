@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import random
+from typing import Iterator, Optional
+
+from .matchups import MatchupTable
+from .packed import NO_PICK, SLOT_WEIGHTS, PackedBracket, field_from_teams, play_out, slot_index
+from .types import Bracket, Team
+from .variance import uniform_streams
+
+
+class RealityEnsemble:
+	"""
+	A fixed set of simulated "realities", shared by every bracket in a run.
+
+	Each reality is stored as 63 bytes of winner team indices (into `teams`) in
+	round-major slot order. Scoring a bracket against the ensemble is a weighted
+	comparison of its picks with every stored reality; no games are re-simulated.
+	"""
+
+	def __init__(
+		self, teams: tuple[Team, ...], field: bytes, rows: list[bytes], strategy: str = "plain"
+	) -> None:
+		self.teams = teams
+		self.field = field
+		self.rows = rows
+		# How the rows were drawn (variance.STRATEGIES)
+		self.strategy = strategy
+		self.index = {t.id: i for i, t in enumerate(self.teams)}
+
+	def __len__(self) -> int:
+		return len(self.rows)
+
+	@classmethod
+	def simulate(
+		cls,
+		teams: list[Team],
+		rng: random.Random,
+		sims: int,
+		table: Optional[MatchupTable] = None,
+		strategy: str = "plain",
+	) -> "RealityEnsemble":
+		"""
+		Runs max(80, sims) reality-mode tournaments. With strategy="plain" the rng is
+		consumed exactly like score._estimate_collapse_risk, so results match a per-bracket
+		run with the same rng; other strategies (see variance.py) drive the same games with
+		variance-reduced uniforms.
+		"""
+		if table is None:
+			table = MatchupTable(teams)
+		field = field_from_teams(table.teams)
+		n = max(80, sims)
+		if strategy == "plain":
+			rows = [play_out(field, rng, table, mode="reality") for _ in range(n)]
+		else:
+			streams = uniform_streams(strategy, n, rng)
+			rows = [play_out(field, src, table, mode="reality") for src in streams]
+		return cls(table.teams, field, rows, strategy)
+
+	def covers(self, bracket: Bracket) -> bool:
+		"""
+		True if the bracket's Round 1 field is the one this ensemble simulated.
+		"""
+		r1 = [g for g in bracket.games if g.round == 1]
+		if len(r1) * 2 != len(self.field):
+			return False
+		for g, ia, ib in zip(r1, self.field[0::2], self.field[1::2]):
+			if g.team_a.id != self.teams[ia].id or g.team_b.id != self.teams[ib].id:
+				return False
+		return True
+
+	def covers_packed(self, packed: PackedBracket) -> bool:
+		return packed.teams == self.teams and packed.field == self.field
+
+	def pick_vector(self, bracket: Bracket) -> bytes:
+		picks = bytearray([NO_PICK] * len(SLOT_WEIGHTS))
+		for g in bracket.games:
+			if g.winner is not None:
+				picks[slot_index(g.slot)] = self.index[g.winner.id]
+		return bytes(picks)
+
+	def collapse_risk(self, bracket: Bracket) -> float:
+		return self.collapse_risk_picks(self.pick_vector(bracket))
+
+	def survivals(self, picks: bytes) -> Iterator[float]:
+		"""
+		Survival fraction of a 63-slot pick vector in each stored reality, in order.
+		"""
+		possible = 0.0
+		for w, p in zip(SLOT_WEIGHTS, picks):
+			if p != NO_PICK:
+				possible += w
+
+		for row in self.rows:
+			if possible <= 0:
+				yield 0.0
+				continue
+			matched = 0.0
+			for w, p, x in zip(SLOT_WEIGHTS, picks, row):
+				if p == x:
+					matched += w
+			yield matched / possible
+
+	def slot_frequencies(self) -> dict[int, dict[int, float]]:
+		"""
+		Share of stored realities in which each team won each slot (pos -> team -> share),
+		the sampled counterpart of score.slot_distributions.
+		"""
+		n = len(self.rows)
+		out: dict[int, dict[int, float]] = {}
+		for pos in range(len(SLOT_WEIGHTS)):
+			counts: dict[int, int] = {}
+			for row in self.rows:
+				counts[row[pos]] = counts.get(row[pos], 0) + 1
+			out[pos] = {team: c / n for team, c in counts.items()}
+		return out
+
+	def collapse_risk_picks(self, picks: bytes) -> float:
+		"""
+		1 - mean survival fraction over the stored realities, for a 63-slot pick vector.
+		"""
+		survivals = list(self.survivals(picks))
+		avg_survival = sum(survivals) / len(survivals)
+		return max(0.0, min(1.0, 1.0 - avg_survival))
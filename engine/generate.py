@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import math
+import random
+from typing import Sequence
+
+from .matchups import MatchupTable
+from .packed import ROUND_GAMES, TOTAL_ROUNDS, TOTAL_SLOTS, PickMatrix, field_from_teams
+from .persona import persona_matrix
+
+# Seeds generated together; bounds memory (one random.Random per seed in flight)
+DEFAULT_BLOCK = 4096
+
+
+def _pair_constants(table: MatchupTable) -> tuple[list[bool], list[float], list[float], list[int]]:
+	"""
+	Per ordered pair k = a * n + b, the matchup facts pick_winner derives from the teams:
+	favorite is a, hype gap, brand gap, and the R1 underdog hype nudge (+1/-1/0).
+	"""
+	teams = table.teams
+	fav_a: list[bool] = []
+	hype_gap: list[float] = []
+	brand_gap: list[float] = []
+	r1_nudge: list[int] = []
+	for a in teams:
+		for b in teams:
+			fav_a.append(a.seed < b.seed)
+			# Not simply "not favorite": on equal seeds both checks pick team_b
+			und_a = a.seed > b.seed
+			hype_gap.append(a.hype - b.hype)
+			brand_gap.append(a.brand_code - b.brand_code)
+			underdog = a if und_a else b
+			r1_nudge.append(0 if underdog.hype <= 0.70 else 1 if und_a else -1)
+	return fav_a, hype_gap, brand_gap, r1_nudge
+
+
+def generate_brackets(
+	seeds: Sequence[int],
+	table: MatchupTable,
+	block: int = DEFAULT_BLOCK,
+) -> PickMatrix:
+	"""
+	Bracket-mode picks for a whole seed range, one round at a time across all seeds.
+
+	Builds the (seeds x 4) persona matrix, applies the risk/contrarian/narrative/brand
+	logit nudges from table-driven per-pair constants, and writes 63 winner indices per
+	seed. Each seed's picks equal what run._complete_bracket produces for that seed.
+	The clamp/logit/sigmoid helpers of pick_winner are inlined: their call overhead was
+	most of the run time.
+	"""
+	seeds = list(seeds)
+	n = table.n
+	base = table.base
+	chaos_by_round = table.chaos["bracket"]
+	fav_a, hype_gap, brand_gap, r1_nudge = _pair_constants(table)
+	field = field_from_teams(table.teams)
+	log, exp = math.log, math.exp
+	# simulate._logit's clamp
+	lo, hi = 1e-9, 1.0 - 1e-9
+
+	data = bytearray(len(seeds) * TOTAL_SLOTS)
+	for start in range(0, len(seeds), block):
+		chunk = seeds[start : start + block]
+		personas = persona_matrix(chunk)
+		rngs = [random.Random(seed).random for seed in chunk]
+		current = [field for _ in chunk]
+
+		offset = 0
+		for rnd in range(1, TOTAL_ROUNDS + 1):
+			chaos_by_pair = chaos_by_round[rnd]
+			games = ROUND_GAMES[rnd]
+			early = rnd <= 2
+			first = rnd == 1
+			for row, (rnd_u, persona, teams_in) in enumerate(zip(rngs, personas, current)):
+				risk, narrative, brand, contrarian = persona
+				push = (risk - 0.5) * 1.25
+				contra = (contrarian - 0.5) * 0.30
+				narr_w = narrative - 0.5
+				brand_w = brand - 0.5
+
+				winners = bytearray(games)
+				for g in range(games):
+					ia = teams_in[2 * g]
+					ib = teams_in[2 * g + 1]
+					k = ia * n + ib
+					chaos = chaos_by_pair[k]
+
+					# Same arithmetic, in the same order, as
+					# pick_winner(mode="bracket", profile=...)
+					p_a = base[k] + (-chaos + (chaos - -chaos) * rnd_u()) * 0.18
+					p_a = 0.0 if p_a < 0.0 else 1.0 if p_a > 1.0 else p_a
+					p_a = lo if p_a < lo else hi if p_a > hi else p_a
+					z = log(p_a / (1.0 - p_a))
+					if fav_a[k]:
+						if early:
+							z -= push
+						z -= contra
+					else:
+						if early:
+							z += push
+						z += contra
+					z += hype_gap[k] * narr_w * 0.70
+					z += brand_gap[k] * brand_w * 0.70
+					# Already in [0, 1]: no clamp needed
+					p_a = 1.0 / (1.0 + exp(-z))
+
+					if first and r1_nudge[k]:
+						p_a += 0.04 * r1_nudge[k]
+						p_a = 0.0 if p_a < 0.0 else 1.0 if p_a > 1.0 else p_a
+
+					winners[g] = ia if rnd_u() < p_a else ib
+
+				base_row = (start + row) * TOTAL_SLOTS + offset
+				data[base_row : base_row + games] = winners
+				current[row] = winners
+			offset += games
+
+	return PickMatrix(table.teams, field, seeds, data)
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from collections import Counter
+from typing import Optional
+
+from .ensemble import RealityEnsemble
+from .matchups import MatchupTable
+from .packed import (
+	NO_PICK,
+	ROUND_GAMES,
+	ROUND_OFFSETS,
+	SLOT_ROUNDS,
+	SLOT_WEIGHTS,
+	TOTAL_SLOTS,
+	PackedBracket,
+	child_slots,
+	pack_bracket,
+	slot_index,
+)
+from .score import _clamp01, _pick_terms, _report_from, slot_distributions
+from .simulate import _tag_mask, tags_from_mask
+from .types import Bracket, SignalReport
+
+
+def parent_slot(pos: int) -> Optional[int]:
+	"""
+	The later-round slot that slot `pos`'s winner plays in (None for the final).
+	"""
+	rnd = SLOT_ROUNDS[pos]
+	if rnd == 6:
+		return None
+	game = pos - ROUND_OFFSETS[rnd]
+	return ROUND_OFFSETS[rnd + 1] + game // 2
+
+
+class IncrementalScorer:
+	"""
+	Keeps per-slot contributions of a scored bracket so that changing one pick only
+	recomputes the slots it touches.
+
+	Per slot: the bias terms (upset weight, brand pull, narrative pull, favorite
+	confidence), the reason tags and P(picked team wins slot). Those probabilities come
+	from the exact DP (score.slot_distributions) and do not depend on the picks, so
+	report() matches score_packed(..., method="exact"). With an ensemble they are its
+	per-slot win shares instead, which gives the ensemble's Monte Carlo estimate
+	up to float rounding.
+	"""
+
+	def __init__(
+		self,
+		packed: PackedBracket,
+		table: MatchupTable,
+		ensemble: Optional[RealityEnsemble] = None,
+	) -> None:
+		if packed.teams != table.teams:
+			raise ValueError("Bracket was packed against a different team table")
+		self.teams = packed.teams
+		self.field = packed.field
+		self.table = table
+		self._winners = bytearray(packed.winners)
+
+		if ensemble is not None and ensemble.covers_packed(packed):
+			self._slot_probs = ensemble.slot_frequencies()
+		else:
+			self._slot_probs = slot_distributions(packed.field, packed.teams, table)
+
+		self._terms: list = [None] * TOTAL_SLOTS
+		self._tags: list[list[str]] = [[] for _ in range(TOTAL_SLOTS)]
+		self._tag_counts: Counter = Counter()
+		for pos in range(TOTAL_SLOTS):
+			self._refresh(pos)
+
+	@classmethod
+	def from_bracket(
+		cls,
+		bracket: Bracket,
+		table: MatchupTable,
+		ensemble: Optional[RealityEnsemble] = None,
+	) -> "IncrementalScorer":
+		return cls(pack_bracket(bracket, table.teams), table, ensemble)
+
+	@property
+	def packed(self) -> PackedBracket:
+		return PackedBracket(self.teams, self.field, bytes(self._winners))
+
+	def _matchup(self, pos: int) -> Optional[tuple[int, int]]:
+		if pos < ROUND_GAMES[1]:
+			return self.field[2 * pos], self.field[2 * pos + 1]
+		left, right = child_slots(pos)
+		a = self._winners[left]
+		b = self._winners[right]
+		if a == NO_PICK or b == NO_PICK:
+			return None
+		return a, b
+
+	def _refresh(self, pos: int) -> None:
+		"""
+		Recomputes one slot's contributions from its current matchup and pick.
+		"""
+		self._tag_counts.subtract(self._tags[pos])
+		self._terms[pos] = None
+		self._tags[pos] = []
+
+		w = self._winners[pos]
+		matchup = self._matchup(pos)
+		if w == NO_PICK or matchup is None:
+			return
+		a = self.teams[matchup[0]]
+		b = self.teams[matchup[1]]
+		rnd = SLOT_ROUNDS[pos]
+		self._terms[pos] = _pick_terms(a, b, self.teams[w], rnd)
+		self._tags[pos] = tags_from_mask(_tag_mask(a, b, self.teams[w], rnd))
+		self._tag_counts.update(self._tags[pos])
+
+	def set_pick(self, slot: str | int, team_id: str) -> list[int]:
+		"""
+		Sets the winner of `slot` ("R2-G03" or a slot position) to the team with `team_id`.
+		Later picks of the team that was replaced move to the new team, as in a bracket UI.
+		Filling an empty slot of a partial bracket picks nothing later on.
+		Returns the slot positions whose contributions were recomputed.
+		"""
+		pos = slot_index(slot) if isinstance(slot, str) else slot
+		new = self.table.index[team_id]
+		matchup = self._matchup(pos)
+		if matchup is None or new not in matchup:
+			raise ValueError(f"Team {team_id} does not play in slot {slot}")
+
+		old = self._winners[pos]
+		if new == old:
+			return []
+
+		changed = []
+		cur: Optional[int] = pos
+		while cur is not None:
+			# An empty slot replaces no later picks: NO_PICK there means "not picked yet"
+			replaced = cur == pos or (old != NO_PICK and self._winners[cur] == old)
+			if replaced:
+				self._winners[cur] = new
+			self._refresh(cur)
+			changed.append(cur)
+			if not replaced:
+				# This slot's matchup changed but its pick did not: nothing later is affected.
+				break
+			cur = parent_slot(cur)
+		return changed
+
+	def collapse_risk(self) -> float:
+		matched = 0.0
+		possible = 0.0
+		for pos, dist in self._slot_probs.items():
+			pick = self._winners[pos]
+			if pick != NO_PICK:
+				possible += SLOT_WEIGHTS[pos]
+				matched += SLOT_WEIGHTS[pos] * dist.get(pick, 0.0)
+		if possible <= 0:
+			return 1.0
+		return _clamp01(1.0 - matched / possible)
+
+	def report(self) -> SignalReport:
+		terms = [t for t in self._terms if t is not None]
+		if not terms:
+			raise ValueError("Bracket has no winners yet. Generate picks first.")
+		tag_counts = +self._tag_counts  # drop zero counts left by subtract()
+		return _report_from(terms, tag_counts, self.collapse_risk())
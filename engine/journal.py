@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+JOURNAL_VERSION = 1
+
+# Append-only progress journal for pool runs.
+#
+# Line 1 is a header with the run settings; every further line is one completed seed
+# ({"seed": ..., "row": <leaderboard row>, ...}). Lines are flushed and fsync'ed in
+# batches, so a crash loses at most the last batch, and a torn last line is ignored
+# (and cut off) when the journal is reopened for --resume.
+
+
+class JournalMismatch(ValueError):
+	"""
+	The journal on disk was written by a run with different settings.
+	"""
+
+
+def _scan(path: Path) -> tuple[dict[str, Any] | None, list[dict[str, Any]], int]:
+	# (header, records, byte offset just past the last complete record)
+	header = None
+	records: list[dict[str, Any]] = []
+	good = 0
+	with open(path, "rb") as fh:
+		for line in fh:
+			if not line.endswith(b"\n"):
+				break
+			try:
+				item = json.loads(line)
+			except ValueError:
+				break
+			if header is None:
+				header = item
+			else:
+				records.append(item)
+			good += len(line)
+	return header, records, good
+
+
+def read_journal(path: str | Path, settings: dict[str, Any] | None = None) -> list[dict[str, Any]]:
+	"""
+	Completed-seed records, oldest first. With `settings`, raises JournalMismatch unless
+	the journal was written with exactly these settings.
+	"""
+	header, records, _good = _scan(Path(path))
+	if header is None or header.get("journal") != JOURNAL_VERSION:
+		raise JournalMismatch(f"Not a run journal (or an unsupported version): {path}")
+	if settings is not None and header["settings"] != settings:
+		old = header["settings"]
+		changed = sorted(k for k in set(settings) | set(old) if settings.get(k) != old.get(k))
+		raise JournalMismatch(
+			f"Journal {path} was written with different settings: {', '.join(changed)}"
+		)
+	return records
+
+
+def latest_by_seed(records: list[dict[str, Any]]) -> dict[int, dict[str, Any]]:
+	"""
+	seed -> its last record (a seed redone after a resume is journaled again).
+	"""
+	return {rec["seed"]: rec for rec in records}
+
+
+class RunJournal:
+	"""
+	Appends one JSON line per completed seed.
+
+	fsync runs every `batch` records or `interval` seconds, whichever comes first, and on
+	close(). With resume=True an existing journal is kept (its torn tail cut off) and
+	appended to; otherwise a fresh journal with the settings header replaces it.
+	"""
+
+	def __init__(
+		self,
+		path: str | Path,
+		settings: dict[str, Any],
+		resume: bool = False,
+		batch: int = 256,
+		interval: float = 1.0,
+	) -> None:
+		self.path = Path(path)
+		self.batch = max(1, batch)
+		self.interval = interval
+		self.pending = 0
+		self.synced = 0
+		self._last_sync = time.monotonic()
+
+		if resume and self.path.exists():
+			_header, _records, good = _scan(self.path)
+			self._fh = open(self.path, "r+b")
+			self._fh.truncate(good)
+			self._fh.seek(good)
+		else:
+			self.path.parent.mkdir(parents=True, exist_ok=True)
+			self._fh = open(self.path, "wb")
+			self._write({"journal": JOURNAL_VERSION, "settings": settings})
+			self.sync()
+
+	def _write(self, item: dict[str, Any]) -> None:
+		self._fh.write(json.dumps(item, separators=(",", ":")).encode("utf-8") + b"\n")
+
+	def append(self, record: dict[str, Any]) -> None:
+		self._write(record)
+		self.pending += 1
+		if self.pending >= self.batch or time.monotonic() - self._last_sync >= self.interval:
+			self.sync()
+
+	def sync(self) -> None:
+		self._fh.flush()
+		os.fsync(self._fh.fileno())
+		self.synced += self.pending
+		self.pending = 0
+		self._last_sync = time.monotonic()
+
+	def close(self) -> None:
+		if not self._fh.closed:
+			self.sync()
+			self._fh.close()
+
+	def __enter__(self) -> "RunJournal":
+		return self
+
+	def __exit__(self, *exc) -> None:
+		self.close()
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from array import array
+from pathlib import Path
+from typing import Optional, Sequence
+
+from .simulate import ROUND_CHAOS_MULT, _base_prob, _chaos_amp, _expected_clamped
+from .teams import load_teams, teams_digest
+from .types import Team
+
+MODES = ("bracket", "reality")
+
+
+class MatchupTable:
+	"""
+	Precomputed per-matchup inputs of pick_winner for one team field.
+
+	For every ordered pair (a, b), stored at a * n + b with team indices from `teams`:
+	- base[k]: win probability of a before chaos noise
+	- chaos[mode][round][k]: chaos half-width for that round and mode
+	- win_prob[round][k]: exact reality-mode win probability (chaos integrated out)
+	"""
+
+	def __init__(self, teams: Sequence[Team], digest: str = "") -> None:
+		self.teams = tuple(teams)
+		self.digest = digest
+		self.n = len(self.teams)
+		self.index = {t.id: i for i, t in enumerate(self.teams)}
+
+		self.base = array("d")
+		for a in self.teams:
+			for b in self.teams:
+				self.base.append(_base_prob(a, b))
+
+		self.chaos: dict[str, dict[int, array]] = {}
+		for mode in MODES:
+			self.chaos[mode] = {}
+			for rnd in ROUND_CHAOS_MULT:
+				self.chaos[mode][rnd] = array(
+					"d", (_chaos_amp(a, b, rnd, mode) for a in self.teams for b in self.teams)
+				)
+
+		self.win_prob: dict[int, array] = {}
+		for rnd in ROUND_CHAOS_MULT:
+			chaos = self.chaos["reality"][rnd]
+			self.win_prob[rnd] = array(
+				"d", (_expected_clamped(p, c) for p, c in zip(self.base, chaos))
+			)
+
+	def key(self, team_a: Team, team_b: Team) -> int:
+		return self.index[team_a.id] * self.n + self.index[team_b.id]
+
+	def lookup(self, team_a: Team, team_b: Team, round_num: int, mode: str) -> tuple[float, float]:
+		"""
+		Returns (base win probability of team_a, chaos half-width).
+		"""
+		k = self.key(team_a, team_b)
+		return self.base[k], self.chaos[mode][round_num][k]
+
+
+_TABLES: dict[str, MatchupTable] = {}
+
+
+def load_matchup_table(path: str | Path, teams: Optional[list[Team]] = None) -> MatchupTable:
+	"""
+	Returns the table for the teams file at `path`, cached by its content hash.
+	Editing the file changes the hash, so the next call rebuilds the table.
+	"""
+	digest = teams_digest(path)
+	table = _TABLES.get(digest)
+	if table is None:
+		table = MatchupTable(teams if teams is not None else load_teams(path), digest)
+		_TABLES.clear()
+		_TABLES[digest] = table
+	return table
@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+from .bracket import _pair_first_round
+from .matchups import MatchupTable
+from .simulate import _tag_mask, pick_winners_batch, tags_from_mask
+from .types import Bracket, Game, Team
+
+TOTAL_ROUNDS = 6
+TOTAL_SLOTS = 63
+
+# Sentinel for "no pick in this slot" (team indices are 0..63)
+NO_PICK = 255
+
+# Slots are numbered round-major: R1-G01 = 0 ... R1-G32 = 31, R2-G01 = 32 ... R6-G01 = 62
+ROUND_GAMES = {1: 32, 2: 16, 3: 8, 4: 4, 5: 2, 6: 1}
+ROUND_OFFSETS = {1: 0, 2: 32, 3: 48, 4: 56, 5: 60, 6: 62}
+
+SLOT_ROUNDS = bytes(rnd for rnd in range(1, TOTAL_ROUNDS + 1) for _ in range(ROUND_GAMES[rnd]))
+
+# Collapse-risk weight per slot: later rounds count more
+SLOT_WEIGHTS = [0.7 + (rnd * 0.25) for rnd in SLOT_ROUNDS]
+
+
+def slot_index(slot: str) -> int:
+	"""
+	Maps "R3-G04" to its position in round-major slot order.
+	"""
+	rnd = int(slot[1 : slot.index("-")])
+	game = int(slot[slot.index("G") + 1 :])
+	return ROUND_OFFSETS[rnd] + game - 1
+
+
+def slot_name(pos: int) -> str:
+	rnd = SLOT_ROUNDS[pos]
+	return f"R{rnd}-G{pos - ROUND_OFFSETS[rnd] + 1:02d}"
+
+
+def child_slots(pos: int) -> tuple[int, int]:
+	"""
+	The two earlier-round slots whose winners meet in slot `pos` (round 2+).
+	"""
+	rnd = SLOT_ROUNDS[pos]
+	game = pos - ROUND_OFFSETS[rnd]
+	left = ROUND_OFFSETS[rnd - 1] + 2 * game
+	return left, left + 1
+
+
+_FIELDS: dict[bytes, bytes] = {}
+
+
+def _intern_field(field: bytes) -> bytes:
+	# Every bracket of a pool shares the same Round 1 field; keep one copy of it.
+	return _FIELDS.setdefault(field, field)
+
+
+@dataclass(frozen=True, slots=True)
+class PackedBracket:
+	"""
+	A bracket as 63 winner indices next to a shared team table.
+
+	teams: shared team table (the same tuple object for a whole pool)
+	field: 64 team indices; Round 1 game g is field[2g] vs field[2g + 1]
+	winners: 63 winner indices in slot order, NO_PICK where a game has no pick
+	"""
+
+	teams: tuple[Team, ...]
+	field: bytes
+	winners: bytes
+
+	def matchup(self, pos: int) -> Optional[tuple[int, int]]:
+		"""
+		(team_a, team_b) indices for slot `pos`, or None if an earlier pick is missing.
+		"""
+		if pos < ROUND_GAMES[1]:
+			return self.field[2 * pos], self.field[2 * pos + 1]
+		left, right = child_slots(pos)
+		a = self.winners[left]
+		b = self.winners[right]
+		if a == NO_PICK or b == NO_PICK:
+			return None
+		return a, b
+
+	def is_complete(self) -> bool:
+		return NO_PICK not in self.winners
+
+	def to_bits(self) -> int:
+		"""
+		63-bit form: bit s is set when slot s went to its team_b. Needs a complete bracket.
+		"""
+		if not self.is_complete():
+			raise ValueError("Only complete brackets can be packed to bits")
+		bits = 0
+		for pos in range(TOTAL_SLOTS):
+			a, b = self.matchup(pos)  # type: ignore[misc]
+			if self.winners[pos] == b:
+				bits |= 1 << pos
+		return bits
+
+	@classmethod
+	def from_bits(cls, teams: tuple[Team, ...], field: bytes, bits: int) -> "PackedBracket":
+		winners = bytearray()
+		for pos in range(TOTAL_SLOTS):
+			if pos < ROUND_GAMES[1]:
+				a, b = field[2 * pos], field[2 * pos + 1]
+			else:
+				left, right = child_slots(pos)
+				a, b = winners[left], winners[right]
+			winners.append(b if bits >> pos & 1 else a)
+		return cls(teams, _intern_field(bytes(field)), bytes(winners))
+
+
+@dataclass
+class PickMatrix:
+	"""
+	Picks of many brackets sharing one team table and field: a (brackets x 63) byte
+	matrix, row-major, one row of winner indices per seed.
+	"""
+
+	teams: tuple[Team, ...]
+	field: bytes
+	seeds: list[int]
+	data: bytearray
+
+	def __len__(self) -> int:
+		return len(self.seeds)
+
+	def row(self, i: int) -> bytes:
+		return bytes(self.data[i * TOTAL_SLOTS : (i + 1) * TOTAL_SLOTS])
+
+	def packed(self, i: int) -> PackedBracket:
+		return PackedBracket(self.teams, self.field, self.row(i))
+
+
+def field_from_teams(teams: Sequence[Team]) -> bytes:
+	"""
+	Round 1 field (as team indices) that build_empty_bracket produces for these teams.
+	"""
+	index = {t.id: i for i, t in enumerate(teams)}
+	field = bytearray()
+	for a, b in _pair_first_round(list(teams)):
+		field.append(index[a.id])
+		field.append(index[b.id])
+	return _intern_field(bytes(field))
+
+
+def pack_bracket(bracket: Bracket, teams: Sequence[Team]) -> PackedBracket:
+	"""
+	Packs a Bracket against the team table `teams` (pass the same tuple for a whole pool).
+	"""
+	table = teams if isinstance(teams, tuple) else tuple(teams)
+	index = {t.id: i for i, t in enumerate(table)}
+
+	r1 = [g for g in bracket.games if g.round == 1]
+	if len(r1) != ROUND_GAMES[1]:
+		raise ValueError(f"Expected {ROUND_GAMES[1]} Round 1 games, got {len(r1)}")
+	field = bytearray()
+	for g in r1:
+		field.append(index[g.team_a.id])
+		field.append(index[g.team_b.id])
+
+	winners = bytearray([NO_PICK] * TOTAL_SLOTS)
+	for g in bracket.games:
+		if g.winner is not None:
+			winners[slot_index(g.slot)] = index[g.winner.id]
+
+	return PackedBracket(table, _intern_field(bytes(field)), bytes(winners))
+
+
+def unpack_bracket(packed: PackedBracket) -> Bracket:
+	"""
+	Rebuilds the Bracket. Games appear once both teams are known; reason_tags are
+	recomputed from the matchup and the pick, exactly as pick_winner derives them.
+	"""
+	teams = packed.teams
+	games: list[Game] = []
+	for pos in range(TOTAL_SLOTS):
+		matchup = packed.matchup(pos)
+		if matchup is None:
+			continue
+		a = teams[matchup[0]]
+		b = teams[matchup[1]]
+		rnd = SLOT_ROUNDS[pos]
+		w = packed.winners[pos]
+		winner = None if w == NO_PICK else teams[w]
+		tags = [] if winner is None else tags_from_mask(_tag_mask(a, b, winner, rnd))
+		games.append(
+			Game(slot=slot_name(pos), round=rnd, team_a=a, team_b=b, winner=winner, reason_tags=tags)
+		)
+	return Bracket(games=games)
+
+
+def play_out(
+	field: bytes,
+	rng: random.Random,
+	table: MatchupTable,
+	mode: str = "reality",
+) -> bytes:
+	"""
+	Simulates a whole tournament from a Round 1 field and returns the 63 winners.
+	"""
+	winners = bytearray()
+	idx_a = field[0::2]
+	idx_b = field[1::2]
+	for rnd in range(1, TOTAL_ROUNDS + 1):
+		round_winners, _masks = pick_winners_batch(idx_a, idx_b, rnd, rng, mode=mode, table=table)
+		winners.extend(round_winners)
+		idx_a, idx_b = round_winners[0::2], round_winners[1::2]
+	return bytes(winners)
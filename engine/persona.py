@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import random
 from dataclasses import dataclass
+from typing import Iterable
 
 
 @dataclass(frozen=True)
@@ -26,3 +27,14 @@ def profile_from_seed(seed: int) -> PickerProfile:
         brand_loyalty=round(brand, 3),
         contrarian=round(contrarian, 3),
     )
+
+
+def persona_matrix(seeds: Iterable[int]) -> list[tuple[float, float, float, float]]:
+    """
+    One row per seed: (risk_tolerance, narrative_chasing, brand_loyalty, contrarian).
+    """
+    rows = []
+    for seed in seeds:
+        p = profile_from_seed(seed)
+        rows.append((p.risk_tolerance, p.narrative_chasing, p.brand_loyalty, p.contrarian))
+    return rows
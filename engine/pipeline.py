@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import queue
+import threading
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Optional, Sequence
+
+# Thread-per-stage pipeline with bounded queues.
+#
+# Each stage runs in its own thread and hands items downstream through a queue of
+# limited depth, so a slow stage blocks the ones before it (backpressure) instead of
+# letting work pile up in memory. One thread per stage keeps items in source order.
+# Threads overlap CPU work with file I/O (writes release the GIL); for more CPU,
+# feed the pipeline from the --workers process pool.
+
+_DONE = object()
+
+
+class _Failed:
+	__slots__ = ("exc",)
+
+	def __init__(self, exc: BaseException) -> None:
+		self.exc = exc
+
+
+def _put(q: queue.Queue, item: Any, stop: threading.Event) -> bool:
+	# Blocking put that gives up once the pipeline is torn down
+	while not stop.is_set():
+		try:
+			q.put(item, timeout=0.1)
+			return True
+		except queue.Full:
+			continue
+	return False
+
+
+def _feed(source: Iterable[Any], out: queue.Queue, stop: threading.Event) -> None:
+	try:
+		for item in source:
+			if not _put(out, item, stop):
+				return
+	except BaseException as exc:
+		_put(out, _Failed(exc), stop)
+		return
+	_put(out, _DONE, stop)
+
+
+def _work(
+	fn: Callable[[Any], Any], inq: queue.Queue, out: queue.Queue, stop: threading.Event
+) -> None:
+	while True:
+		try:
+			item = inq.get(timeout=0.1)
+		except queue.Empty:
+			if stop.is_set():
+				return
+			continue
+		if item is _DONE or isinstance(item, _Failed):
+			_put(out, item, stop)
+			return
+		try:
+			result = fn(item)
+		except BaseException as exc:
+			_put(out, _Failed(exc), stop)
+			return
+		if not _put(out, result, stop):
+			return
+
+
+def pipelined(
+	source: Iterable[Any],
+	stages: Sequence[Callable[[Any], Any]],
+	depth: int = 64,
+) -> Iterator[Any]:
+	"""
+	Runs `source` through `stages` (one thread each) and yields the results in source order.
+	Every hand-off queue holds at most `depth` items. An exception in any stage is
+	re-raised here; closing the generator early stops all stage threads.
+	"""
+	if depth < 1:
+		raise ValueError("Queue depth must be at least 1")
+	stop = threading.Event()
+	queues = [queue.Queue(maxsize=depth) for _ in range(len(stages) + 1)]
+	threads = [threading.Thread(target=_feed, args=(source, queues[0], stop), daemon=True)]
+	for i, fn in enumerate(stages):
+		threads.append(
+			threading.Thread(target=_work, args=(fn, queues[i], queues[i + 1], stop), daemon=True)
+		)
+	for t in threads:
+		t.start()
+
+	out = queues[-1]
+	try:
+		while True:
+			item = out.get()
+			if item is _DONE:
+				return
+			if isinstance(item, _Failed):
+				raise item.exc
+			yield item
+	finally:
+		stop.set()
+		for t in threads:
+			t.join()
+
+
+class BatchWriter:
+	"""
+	Dedicated writer thread for text files.
+
+	submit() queues a write and returns at once; it blocks only when `depth` writes are
+	already pending. The thread drains up to `batch` queued writes per wake-up. close()
+	waits for every pending write and re-raises the first write error, if any.
+	"""
+
+	def __init__(self, depth: int = 256, batch: int = 64) -> None:
+		if depth < 1:
+			raise ValueError("Write queue depth must be at least 1")
+		self.batch = max(1, batch)
+		self.files_written = 0
+		self.bytes_written = 0
+		self._queue: queue.Queue = queue.Queue(maxsize=depth)
+		self._error: Optional[BaseException] = None
+		self._dirs: set[Path] = set()
+		self._thread = threading.Thread(target=self._run, name="signal-writer", daemon=True)
+		self._thread.start()
+
+	def submit(self, path: Path, text: str) -> None:
+		if self._error is not None:
+			raise self._error
+		self._queue.put((path, text))
+
+	def _write(self, path: Path, text: str) -> None:
+		parent = path.parent
+		if parent not in self._dirs:
+			parent.mkdir(parents=True, exist_ok=True)
+			self._dirs.add(parent)
+		data = text.encode("utf-8")
+		path.write_bytes(data)
+		self.files_written += 1
+		self.bytes_written += len(data)
+
+	def _run(self) -> None:
+		while True:
+			jobs = [self._queue.get()]
+			while len(jobs) < self.batch:
+				try:
+					jobs.append(self._queue.get_nowait())
+				except queue.Empty:
+					break
+			for job in jobs:
+				if job is _DONE:
+					return
+				if self._error is None:
+					# After a failure keep draining so submit() never blocks forever
+					try:
+						self._write(*job)
+					except BaseException as exc:
+						self._error = exc
+
+	def close(self) -> None:
+		if self._thread.is_alive():
+			self._queue.put(_DONE)
+			self._thread.join()
+		if self._error is not None:
+			raise self._error
+
+	def __enter__(self) -> "BatchWriter":
+		return self
+
+	def __exit__(self, *exc) -> None:
+		self.close()
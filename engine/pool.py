@@ -1,13 +1,24 @@
 from __future__ import annotations
 
+import heapq
+import math
 from collections import Counter
-from typing import Any
+from typing import TYPE_CHECKING, Any, Iterable, Optional
+
+if TYPE_CHECKING:
+    from .popularity import PoolPicks
+
+
+SCORE_KEYS = ["overconfidence", "chaos_addiction", "narrative_bias", "brand_bias", "collapse_risk"]
 
 
 def _percentile(values: list[float], p: float) -> float:
-    if not values:
+    return _percentile_sorted(sorted(values), p)
+
+
+def _percentile_sorted(xs: list[float], p: float) -> float:
+    if not xs:
         return 0.0
-    xs = sorted(values)
     if len(xs) == 1:
         return xs[0]
     k = (len(xs) - 1) * p
@@ -19,20 +30,48 @@ def _percentile(values: list[float], p: float) -> float:
 
 
 def pool_thresholds(results: list[dict[str, Any]]) -> dict[str, float]:
-    keys = ["overconfidence", "chaos_addiction", "narrative_bias", "brand_bias", "collapse_risk"]
-    vals = {k: [float(r["scores"].get(k, 0.0)) for r in results] for k in keys}
+    vals = {k: sorted(float(r["scores"].get(k, 0.0)) for r in results) for k in SCORE_KEYS}
+    return _thresholds_from_sorted(vals)
+
 
+def _thresholds_from_sorted(vals: dict[str, list[float]]) -> dict[str, float]:
     return {
-        "oc_p75": _percentile(vals["overconfidence"], 0.75),
-        "chaos_p75": _percentile(vals["chaos_addiction"], 0.75),
-        "narr_p75": _percentile(vals["narrative_bias"], 0.75),
-        "brand_p75": _percentile(vals["brand_bias"], 0.75),
-        "collapse_p25": _percentile(vals["collapse_risk"], 0.25),
-        "collapse_p75": _percentile(vals["collapse_risk"], 0.75),
-        "chaos_p25": _percentile(vals["chaos_addiction"], 0.25),
+        "oc_p75": _percentile_sorted(vals["overconfidence"], 0.75),
+        "chaos_p75": _percentile_sorted(vals["chaos_addiction"], 0.75),
+        "narr_p75": _percentile_sorted(vals["narrative_bias"], 0.75),
+        "brand_p75": _percentile_sorted(vals["brand_bias"], 0.75),
+        "collapse_p25": _percentile_sorted(vals["collapse_risk"], 0.25),
+        "collapse_p75": _percentile_sorted(vals["collapse_risk"], 0.75),
+        "chaos_p25": _percentile_sorted(vals["chaos_addiction"], 0.25),
     }
 
 
+def pool_archetype(scores: dict[str, float], t: dict[str, float]) -> str:
+    oc = float(scores.get("overconfidence", 0.0))
+    chaos = float(scores.get("chaos_addiction", 0.0))
+    brand = float(scores.get("brand_bias", 0.0))
+    narr = float(scores.get("narrative_bias", 0.0))
+    collapse = float(scores.get("collapse_risk", 0.0))
+
+    # Standout archetypes relative to pool
+    if chaos >= t["chaos_p75"]:
+        return "Chaos Goblin"
+    if narr >= t["narr_p75"]:
+        return "Narrative Romantic"
+    if brand >= t["brand_p75"]:
+        return "Brand Worshipper"
+
+    # Paradox archetype: high OC + low chaos (relative)
+    if oc >= t["oc_p75"] and chaos <= t["chaos_p25"]:
+        return "Spreadsheet Liar"
+
+    # Stability archetype: low collapse (relative)
+    if collapse <= t["collapse_p25"]:
+        return "Quiet Assassin"
+
+    return "Social Copycat"
+
+
 def superlatives(results: list[dict[str, Any]]) -> dict[str, Any]:
     def best(key: str):
         return max(results, key=lambda r: float(r["scores"].get(key, 0.0)))
@@ -46,16 +85,27 @@ def superlatives(results: list[dict[str, Any]]) -> dict[str, Any]:
     most_oc = best("overconfidence")
     quietest = worst("collapse_risk")
 
-    def safe_but_dead_score(r):
-        s = r["scores"]
-        return (
-            float(s.get("overconfidence", 0.0)) * 0.6
-            + (1.0 - float(s.get("chaos_addiction", 0.0))) * 0.4
-            + float(s.get("collapse_risk", 0.0)) * 0.6
-        )
+    safest_but_dead = max(results, key=_safe_but_dead_score)
+    return _superlatives_from(most_chaos, most_narr, most_brand, most_oc, quietest, safest_but_dead)
 
-    safest_but_dead = max(results, key=safe_but_dead_score)
 
+def _safe_but_dead_score(r: dict[str, Any]) -> float:
+    s = r["scores"]
+    return (
+        float(s.get("overconfidence", 0.0)) * 0.6
+        + (1.0 - float(s.get("chaos_addiction", 0.0))) * 0.4
+        + float(s.get("collapse_risk", 0.0)) * 0.6
+    )
+
+
+def _superlatives_from(
+    most_chaos: dict[str, Any],
+    most_narr: dict[str, Any],
+    most_brand: dict[str, Any],
+    most_oc: dict[str, Any],
+    quietest: dict[str, Any],
+    safest_but_dead: dict[str, Any],
+) -> dict[str, Any]:
     return {
         "most_chaos": {
             "seed": most_chaos["seed"],
@@ -85,12 +135,36 @@ def superlatives(results: list[dict[str, Any]]) -> dict[str, Any]:
         "safest_but_dead": {
             "seed": safest_but_dead["seed"],
             "archetype": safest_but_dead["archetype"],
-            "value": safe_but_dead_score(safest_but_dead),
+            "value": _safe_but_dead_score(safest_but_dead),
         },
     }
 
 
-def summarize_pool(results: list[dict[str, Any]]) -> dict[str, Any]:
+def add_popularity(
+    summary: dict[str, Any], picks: "PoolPicks", rows: Iterable[dict[str, Any]]
+) -> dict[str, Any]:
+    """
+    Adds pick popularity to a pool summary, plus the most_unique / most_chalk
+    superlatives (highest / lowest leverage) when `picks` has leverage scores.
+    `rows` must contain the holders' rows.
+    """
+    summary["popularity"] = picks.summary()
+    holders = {"most_unique": picks.most_unique(), "most_chalk": picks.most_chalk()}
+    wanted = {seed for seed in holders.values() if seed is not None}
+    found = {r["seed"]: r for r in rows if r["seed"] in wanted}
+    for name, seed in holders.items():
+        if seed in found:
+            summary["superlatives"][name] = {
+                "seed": seed,
+                "archetype": found[seed]["archetype"],
+                "value": round(picks.leverage[seed], 2),
+            }
+    return summary
+
+
+def summarize_pool(
+    results: list[dict[str, Any]], picks: Optional["PoolPicks"] = None
+) -> dict[str, Any]:
     """
     results items: {seed, archetype, headline, shareability_score, scores, ...}
     """
@@ -104,8 +178,7 @@ def summarize_pool(results: list[dict[str, Any]]) -> dict[str, Any]:
     ]
 
     avg = {}
-    keys = ["overconfidence", "chaos_addiction", "narrative_bias", "brand_bias", "collapse_risk"]
-    for k in keys:
+    for k in SCORE_KEYS:
         avg[k] = round(sum(float(r["scores"].get(k, 0.0)) for r in results) / n, 3)
 
     top3 = sorted(results, key=lambda r: r["shareability_score"], reverse=True)[:3]
@@ -113,7 +186,7 @@ def summarize_pool(results: list[dict[str, Any]]) -> dict[str, Any]:
     thresholds = pool_thresholds(results)
     supers = superlatives(results)
 
-    return {
+    summary = {
         "n": n,
         "distribution": dist,
         "avg_scores": avg,
@@ -121,6 +194,434 @@ def summarize_pool(results: list[dict[str, Any]]) -> dict[str, Any]:
         "thresholds": thresholds,
         "superlatives": supers,
     }
+    if picks is not None:
+        add_popularity(summary, picks, results)
+    return summary
+
+
+class PoolAggregator:
+    """
+    Pool finalization in one pass over the rows: thresholds are computed once, then a
+    single fused loop relabels each row (pool_archetype) and tracks the distribution,
+    top 3 and superlatives.
+
+    finalize() returns exactly what summarize_pool gives after relabeling every row,
+    including tie-breaks: the first row wins among equal maxima/minima, and the top 3
+    keep input order among equal shareability scores.
+    """
+
+    def __init__(self) -> None:
+        self.rows: list[dict[str, Any]] = []
+        self.columns: dict[str, list[float]] = {k: [] for k in SCORE_KEYS}
+
+    def add(self, row: dict[str, Any]) -> None:
+        self.rows.append(row)
+        scores = row["scores"]
+        for k in SCORE_KEYS:
+            self.columns[k].append(float(scores.get(k, 0.0)))
+
+    def extend(self, rows: list[dict[str, Any]]) -> None:
+        for row in rows:
+            self.add(row)
+
+    def finalize(self, picks: Optional["PoolPicks"] = None) -> dict[str, Any]:
+        rows = self.rows
+        cols = self.columns
+        n = max(1, len(rows))
+        thresholds = _thresholds_from_sorted({k: sorted(v) for k, v in cols.items()})
+
+        counts: Counter[str] = Counter()
+        top3: list[dict[str, Any]] = []
+        chaos = cols["chaos_addiction"]
+        narr = cols["narrative_bias"]
+        brand = cols["brand_bias"]
+        oc = cols["overconfidence"]
+        collapse = cols["collapse_risk"]
+        i_chaos = i_narr = i_brand = i_oc = i_quiet = i_safe = 0
+        best_safe = float("-inf")
+
+        for i, row in enumerate(rows):
+            archetype = pool_archetype(row["scores"], thresholds)
+            row["archetype"] = archetype
+            counts[archetype] += 1
+
+            # Strict comparisons: the first row wins ties, like max()/min()
+            if chaos[i] > chaos[i_chaos]:
+                i_chaos = i
+            if narr[i] > narr[i_narr]:
+                i_narr = i
+            if brand[i] > brand[i_brand]:
+                i_brand = i
+            if oc[i] > oc[i_oc]:
+                i_oc = i
+            if collapse[i] < collapse[i_quiet]:
+                i_quiet = i
+            safe = _safe_but_dead_score(row)
+            if safe > best_safe:
+                best_safe = safe
+                i_safe = i
+
+            # Top 3 by shareability; a later row only displaces on a strictly higher score
+            share = row["shareability_score"]
+            if len(top3) < 3 or share > top3[-1]["shareability_score"]:
+                pos = len(top3)
+                while pos > 0 and share > top3[pos - 1]["shareability_score"]:
+                    pos -= 1
+                top3.insert(pos, row)
+                del top3[3:]
+
+        dist = [
+            {"archetype": k, "count": v, "pct": round((v / n) * 100, 1)}
+            for k, v in counts.most_common()
+        ]
+        avg = {k: round(sum(cols[k]) / n, 3) for k in SCORE_KEYS}
+
+        supers = {}
+        if rows:
+            supers = _superlatives_from(
+                rows[i_chaos], rows[i_narr], rows[i_brand], rows[i_oc], rows[i_quiet], rows[i_safe]
+            )
+
+        summary = {
+            "n": n,
+            "distribution": dist,
+            "avg_scores": avg,
+            "top3": top3,
+            "thresholds": thresholds,
+            "superlatives": supers,
+        }
+        if picks is not None and rows:
+            add_popularity(summary, picks, rows)
+        return summary
+
+
+def aggregate_pool(
+    results: list[dict[str, Any]], picks: Optional["PoolPicks"] = None
+) -> dict[str, Any]:
+    """
+    Relabels every row's archetype relative to the pool and returns the pool summary
+    (with pick popularity when `picks` is given).
+    """
+    agg = PoolAggregator()
+    agg.extend(results)
+    return agg.finalize(picks)
+
+
+class QuantileSketch:
+    """
+    KLL-style quantile sketch over floats.
+
+    Values are kept verbatim until there are more than `exact_limit` of them, so small
+    pools get exactly the same percentiles as _percentile. Beyond that, levels of at
+    most k items are compacted pairwise (level h items weigh 2**h), which bounds memory
+    at O(k log(n / k)) with rank error around log2(n / k) / k. Compaction alternates
+    which half it keeps, so results are deterministic. Sketches merge level by level.
+    """
+
+    def __init__(self, k: int = 1024, exact_limit: int = 65536) -> None:
+        self.k = k
+        self.exact_limit = exact_limit
+        self.n = 0
+        self.levels: list[list[float]] = [[]]
+        self._flip: list[bool] = [False]
+
+    def exact(self) -> bool:
+        return len(self.levels) == 1
+
+    def add(self, x: float) -> None:
+        self.levels[0].append(x)
+        self.n += 1
+        if len(self.levels[0]) > self._capacity(0):
+            self._compress()
+
+    def _capacity(self, h: int) -> int:
+        return self.exact_limit if self.exact() else self.k
+
+    def _compress(self) -> None:
+        h = 0
+        while h < len(self.levels):
+            items = self.levels[h]
+            if len(items) > self._capacity(h):
+                if h + 1 == len(self.levels):
+                    self.levels.append([])
+                    self._flip.append(False)
+                items.sort()
+                keep = items.pop() if len(items) % 2 else None
+                offset = int(self._flip[h])
+                self._flip[h] = not self._flip[h]
+                self.levels[h + 1].extend(items[offset::2])
+                self.levels[h] = [] if keep is None else [keep]
+            h += 1
+
+    def merge(self, other: "QuantileSketch") -> None:
+        while len(self.levels) < len(other.levels):
+            self.levels.append([])
+            self._flip.append(False)
+        for h, items in enumerate(other.levels):
+            self.levels[h].extend(items)
+        self.n += other.n
+        self._compress()
+
+    def quantile(self, p: float) -> float:
+        if self.exact():
+            return _percentile_sorted(sorted(self.levels[0]), p)
+        weighted = sorted((x, 1 << h) for h, items in enumerate(self.levels) for x in items)
+        target = p * (self.total_weight() - 1)
+        seen = 0
+        for x, w in weighted:
+            seen += w
+            if seen > target:
+                return x
+        return weighted[-1][0]
+
+    def total_weight(self) -> int:
+        return sum(len(items) << h for h, items in enumerate(self.levels))
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"k": self.k, "exact_limit": self.exact_limit, "n": self.n, "levels": self.levels}
+
+    @classmethod
+    def from_dict(cls, d: dict[str, Any]) -> "QuantileSketch":
+        sketch = cls(k=d["k"], exact_limit=d["exact_limit"])
+        sketch.n = d["n"]
+        sketch.levels = [list(items) for items in d["levels"]]
+        sketch._flip = [False] * len(sketch.levels)
+        return sketch
+
+
+def _add_partial(partials: list[float], x: float) -> None:
+    # Shewchuk's non-overlapping partials (as in math.fsum): an exact running sum
+    i = 0
+    for y in partials:
+        if abs(x) < abs(y):
+            x, y = y, x
+        hi = x + y
+        lo = y - (hi - x)
+        if lo:
+            partials[i] = lo
+            i += 1
+        x = hi
+    partials[i:] = [x]
+
+
+# Streaming superlatives: (name, score key, True for the largest value)
+_SUPERLATIVE_KEYS = [
+    ("most_chaos", "chaos_addiction", True),
+    ("most_narrative", "narrative_bias", True),
+    ("most_brand", "brand_bias", True),
+    ("most_overconfident", "overconfidence", True),
+    ("quiet_assassin", "collapse_risk", False),
+]
+
+
+def relabel_row(row: dict[str, Any], t: dict[str, float]) -> dict[str, Any]:
+    """
+    Copy of a leaderboard row with its archetype relabeled against pool thresholds `t`.
+    """
+    return {**row, "archetype": pool_archetype(row["scores"], t)}
+
+
+def _rank_key(row: dict[str, Any]) -> tuple[float, int]:
+    # Position in the leaderboard (shareability desc, then seed asc), as a max-key
+    return (float(row["shareability_score"]), -int(row["seed"]))
+
+
+class PoolAccumulator:
+    """
+    Streaming, mergeable pool statistics: takes one leaderboard row at a time and keeps
+    running sums, archetype counts, a QuantileSketch per score, and bounded top-k heaps
+    for shareability and each superlative. Its memory stays bounded (beyond exact_limit
+    values per score). Only --merge-shards relies on that: a single pool run still keeps
+    every row for leaderboard.json.
+
+    Ties resolve as the in-memory aggregator resolves them on a leaderboard sorted by
+    shareability (desc) then seed, so shards merged in any order give the same winners.
+    Merging is exact for counts, sums, top-k and (below exact_limit) the quantiles.
+    Sums are kept as exact partials (math.fsum), so averages are correctly rounded
+    whatever the shard split; a plain left-to-right float sum can differ in the last bit.
+
+    Archetypes are relabeled relative to the whole pool, so the relabeled distribution
+    needs a second pass over the rows once thresholds are known (RelabelCounts).
+    """
+
+    def __init__(self, top_k: int = 3, sketch_k: int = 1024, exact_limit: int = 65536) -> None:
+        self.top_k = top_k
+        self.n = 0
+        self.sums: dict[str, list[float]] = {k: [] for k in SCORE_KEYS}
+        self.counts: Counter[str] = Counter()
+        self.sketches = {k: QuantileSketch(sketch_k, exact_limit) for k in SCORE_KEYS}
+        # Min-heaps of (key, seed, row) holding the k largest keys
+        self.heaps: dict[str, list[tuple[Any, int, dict[str, Any]]]] = {
+            name: [] for name in ["top", "safest_but_dead"] + [s[0] for s in _SUPERLATIVE_KEYS]
+        }
+
+    def _push(self, name: str, key: Any, row: dict[str, Any]) -> None:
+        heap = self.heaps[name]
+        item = (key, -int(row["seed"]), row)
+        if len(heap) < self.top_k:
+            heapq.heappush(heap, item)
+        elif item[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, item)
+
+    def add(self, row: dict[str, Any]) -> None:
+        scores = row["scores"]
+        self.n += 1
+        for k in SCORE_KEYS:
+            x = float(scores.get(k, 0.0))
+            _add_partial(self.sums[k], x)
+            self.sketches[k].add(x)
+        self.counts[row["archetype"]] += 1
+
+        rank = _rank_key(row)
+        self._push("top", rank, row)
+        for name, key, largest in _SUPERLATIVE_KEYS:
+            x = float(scores.get(key, 0.0))
+            self._push(name, ((x if largest else -x),) + rank, row)
+        self._push("safest_but_dead", (_safe_but_dead_score(row),) + rank, row)
+
+    def merge(self, other: "PoolAccumulator") -> None:
+        self.n += other.n
+        for k in SCORE_KEYS:
+            for x in other.sums[k]:
+                _add_partial(self.sums[k], x)
+            self.sketches[k].merge(other.sketches[k])
+        self.counts.update(other.counts)
+        for name, heap in other.heaps.items():
+            for key, _neg_seed, row in heap:
+                self._push(name, key, row)
+
+    def thresholds(self) -> dict[str, float]:
+        q = self.sketches
+        return {
+            "oc_p75": q["overconfidence"].quantile(0.75),
+            "chaos_p75": q["chaos_addiction"].quantile(0.75),
+            "narr_p75": q["narrative_bias"].quantile(0.75),
+            "brand_p75": q["brand_bias"].quantile(0.75),
+            "collapse_p25": q["collapse_risk"].quantile(0.25),
+            "collapse_p75": q["collapse_risk"].quantile(0.75),
+            "chaos_p25": q["chaos_addiction"].quantile(0.25),
+        }
+
+    def _best(self, name: str) -> list[dict[str, Any]]:
+        return [row for _key, _neg_seed, row in sorted(self.heaps[name], reverse=True)]
+
+    def holder(self, name: str, thresholds: Optional[dict[str, float]] = None) -> dict[str, Any]:
+        """
+        The row holding superlative `name` ("top" = most shareable), relabeled.
+        """
+        t = thresholds if thresholds is not None else self.thresholds()
+        return relabel_row(self._best(name)[0], t)
+
+    def top_rows(self) -> list[dict[str, Any]]:
+        t = self.thresholds()
+        return [relabel_row(row, t) for row in self._best("top")]
+
+    def summary(self, relabeled: Optional["RelabelCounts"] = None) -> dict[str, Any]:
+        """
+        Pool summary in the shape of summarize_pool. Rows it returns are relabeled copies.
+        Without `relabeled` (the second pass), the distribution uses the rows' own labels.
+        """
+        n = max(1, self.n)
+        t = self.thresholds()
+
+        if relabeled is not None:
+            items = relabeled.most_common()
+        else:
+            items = self.counts.most_common()
+        dist = [
+            {"archetype": k, "count": v, "pct": round((v / n) * 100, 1)}
+            for k, v in items
+        ]
+
+        supers = {}
+        if self.n:
+            holders = {name: self.holder(name, t) for name in self.heaps}
+            supers = _superlatives_from(
+                holders["most_chaos"],
+                holders["most_narrative"],
+                holders["most_brand"],
+                holders["most_overconfident"],
+                holders["quiet_assassin"],
+                holders["safest_but_dead"],
+            )
+
+        return {
+            "n": n,
+            "distribution": dist,
+            "avg_scores": {k: round(math.fsum(self.sums[k]) / n, 3) for k in SCORE_KEYS},
+            "top3": [relabel_row(row, t) for row in self._best("top")[:3]],
+            "thresholds": t,
+            "superlatives": supers,
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "top_k": self.top_k,
+            "n": self.n,
+            "sums": self.sums,
+            "counts": dict(self.counts),
+            "sketches": {k: s.to_dict() for k, s in self.sketches.items()},
+            "heaps": {name: [row for _k, _s, row in heap] for name, heap in self.heaps.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, d: dict[str, Any]) -> "PoolAccumulator":
+        acc = cls(top_k=d["top_k"])
+        acc.n = d["n"]
+        acc.sums = {k: list(v) for k, v in d["sums"].items()}
+        acc.counts = Counter(d["counts"])
+        acc.sketches = {k: QuantileSketch.from_dict(s) for k, s in d["sketches"].items()}
+        # Rebuild the heap keys from the rows themselves
+        for name, rows in d["heaps"].items():
+            for row in rows:
+                acc._push(name, acc._heap_key(name, row), row)
+        return acc
+
+    @staticmethod
+    def _heap_key(name: str, row: dict[str, Any]) -> Any:
+        rank = _rank_key(row)
+        if name == "top":
+            return rank
+        if name == "safest_but_dead":
+            return (_safe_but_dead_score(row),) + rank
+        for sup_name, key, largest in _SUPERLATIVE_KEYS:
+            if sup_name == name:
+                x = float(row["scores"].get(key, 0.0))
+                return ((x if largest else -x),) + rank
+        raise KeyError(name)
+
+
+class RelabelCounts:
+    """
+    Second pass: archetype counts after relabeling against the pool's thresholds.
+    Ties in the distribution order by each label's first leaderboard appearance, as
+    Counter.most_common does on the sorted leaderboard; mergeable across shards.
+    """
+
+    def __init__(self, thresholds: dict[str, float]) -> None:
+        self.thresholds = thresholds
+        self.counts: dict[str, int] = {}
+        self.first: dict[str, tuple[float, int]] = {}
+
+    def add(self, row: dict[str, Any]) -> None:
+        label = pool_archetype(row["scores"], self.thresholds)
+        self.counts[label] = self.counts.get(label, 0) + 1
+        rank = _rank_key(row)
+        if label not in self.first or rank > self.first[label]:
+            self.first[label] = rank
+
+    def merge(self, other: "RelabelCounts") -> None:
+        for label, c in other.counts.items():
+            self.counts[label] = self.counts.get(label, 0) + c
+            if label not in self.first or other.first[label] > self.first[label]:
+                self.first[label] = other.first[label]
+
+    def most_common(self) -> list[tuple[str, int]]:
+        return sorted(
+            self.counts.items(),
+            key=lambda kv: (kv[1], self.first[kv[0]]),
+            reverse=True,
+        )
 
 
 def render_office_summary_card(summary: dict[str, Any]) -> str:
@@ -220,6 +721,11 @@ def render_superlatives_card(summary: dict[str, Any]) -> str:
             f"  🥷 Quiet Assassin: seed {s['quiet_assassin']['seed']} (collapse {s['quiet_assassin']['value']:.2f})"
         )
     )
+    if "most_unique" in s:
+        # Leverage: bits of surprise against the pool's consensus picks
+        uniq, chalk = s["most_unique"], s["most_chalk"]
+        lines.append(line(f"  🦄 Most Unique: seed {uniq['seed']} ({uniq['value']:.1f} bits)"))
+        lines.append(line(f"  📋 Most Chalk: seed {chalk['seed']} ({chalk['value']:.1f} bits)"))
     lines.append(mid())
     lines.append(
         line(
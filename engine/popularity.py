@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import math
+import operator
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from .packed import ROUND_GAMES, ROUND_OFFSETS, TOTAL_SLOTS, PickMatrix, child_slots
+from .types import Team
+
+# Pick popularity: how much of the pool picked each team in each of the 63 slots.
+#
+# Counting is one pass per slot over a column of the (brackets x 63) PickMatrix, which
+# is a strided bytes slice, so Counter runs over it in C. A bracket's leverage is the
+# information content of its picks under the pool's consensus,
+#
+#   leverage = sum over slots of -log2(share of the pool making the same pick)
+#
+# in bits: 0 for a bracket that made the most popular pick everywhere in a unanimous
+# pool, large for brackets that went their own way.
+
+
+class PickPopularity:
+	"""
+	Per-slot pick counts over a pool: counts[slot][team] brackets picked `team` in `slot`.
+	Mergeable, so shards can count their own brackets and combine.
+	"""
+
+	def __init__(
+		self, teams: tuple[Team, ...], field: bytes, brackets: int, counts: list[list[int]]
+	) -> None:
+		self.teams = teams
+		self.field = field
+		self.brackets = brackets
+		self.counts = counts
+
+	@classmethod
+	def empty(cls, teams: tuple[Team, ...], field: bytes) -> "PickPopularity":
+		return cls(teams, field, 0, [[0] * len(teams) for _ in range(TOTAL_SLOTS)])
+
+	@classmethod
+	def from_picks(cls, picks: PickMatrix) -> "PickPopularity":
+		pop = cls.empty(picks.teams, picks.field)
+		pop.add(picks)
+		return pop
+
+	def add(self, picks: PickMatrix) -> None:
+		data = bytes(picks.data)
+		for pos in range(TOTAL_SLOTS):
+			row = self.counts[pos]
+			for team, n in Counter(data[pos::TOTAL_SLOTS]).items():
+				row[team] += n
+		self.brackets += len(picks)
+
+	def merge(self, other: "PickPopularity") -> None:
+		if other.teams != self.teams or other.field != self.field:
+			raise ValueError("Pick counts were taken against a different team table or field")
+		for mine, theirs in zip(self.counts, other.counts):
+			for team, n in enumerate(theirs):
+				mine[team] += n
+		self.brackets += other.brackets
+
+	def share(self, pos: int, team: int) -> float:
+		return self.counts[pos][team] / self.brackets if self.brackets else 0.0
+
+	def chalk(self) -> bytes:
+		"""
+		The consensus bracket: in Round 1 the more picked team of each game, then in every
+		later slot the more picked of the two teams the consensus sent there (ties to the
+		upper line of the bracket). Always a valid bracket, unlike the per-slot favourites.
+		"""
+		winners = bytearray(TOTAL_SLOTS)
+		for pos in range(TOTAL_SLOTS):
+			if pos < ROUND_GAMES[1]:
+				a, b = self.field[2 * pos], self.field[2 * pos + 1]
+			else:
+				left, right = child_slots(pos)
+				a, b = winners[left], winners[right]
+			row = self.counts[pos]
+			winners[pos] = b if row[b] > row[a] else a
+		return bytes(winners)
+
+	def leverage(self, picks: PickMatrix) -> list[float]:
+		"""
+		Leverage in bits of every bracket in `picks`, in row order. Summed slot by slot
+		across all brackets at once (one lookup table per slot).
+		"""
+		data = bytes(picks.data)
+		totals = [0.0] * len(picks)
+		for pos in range(TOTAL_SLOTS):
+			row = self.counts[pos]
+			table = [-math.log2(n / self.brackets) if n else 0.0 for n in row]
+			table += [0.0] * (256 - len(table))
+			bits = map(table.__getitem__, data[pos::TOTAL_SLOTS])
+			totals = list(map(operator.add, totals, bits))
+		return totals
+
+	def to_dict(self) -> dict[str, Any]:
+		return {"brackets": self.brackets, "counts": self.counts}
+
+	@classmethod
+	def from_dict(
+		cls, teams: tuple[Team, ...], field: bytes, d: dict[str, Any]
+	) -> "PickPopularity":
+		return cls(teams, field, int(d["brackets"]), [list(row) for row in d["counts"]])
+
+	def to_record(self) -> dict[str, Any]:
+		"""
+		The counts plus the team ids they are indexed by and the chalk bracket (team ids in
+		slot order), for a pool's pick_popularity.json.
+		"""
+		return {
+			"teams": [t.id for t in self.teams],
+			"chalk_bracket": [self.teams[t].id for t in self.chalk()],
+			**self.to_dict(),
+		}
+
+	@classmethod
+	def from_record(
+		cls, teams: tuple[Team, ...], field: bytes, d: dict[str, Any]
+	) -> Optional["PickPopularity"]:
+		# None when the counts were taken against another team table
+		if d.get("teams") != [t.id for t in teams]:
+			return None
+		return cls.from_dict(teams, field, d)
+
+
+@dataclass
+class PoolPicks:
+	"""
+	A pool's pick popularity plus each bracket's leverage (seed -> bits).
+	"""
+
+	popularity: PickPopularity
+	leverage: dict[int, float] = field(default_factory=dict)
+
+	def most_unique(self) -> Optional[int]:
+		# Highest leverage; ties to the lower seed
+		if not self.leverage:
+			return None
+		return max(self.leverage.items(), key=lambda kv: (kv[1], -kv[0]))[0]
+
+	def most_chalk(self) -> Optional[int]:
+		if not self.leverage:
+			return None
+		return min(self.leverage.items(), key=lambda kv: (kv[1], kv[0]))[0]
+
+	def summary(self) -> dict[str, Any]:
+		pop = self.popularity
+		teams = pop.teams
+		chalk = pop.chalk()
+		champion = ROUND_OFFSETS[6]
+		final_four = chalk[ROUND_OFFSETS[4] : ROUND_OFFSETS[4] + ROUND_GAMES[4]]
+		champs = sorted(
+			((n, team) for team, n in enumerate(pop.counts[champion]) if n),
+			key=lambda t: (-t[0], t[1]),
+		)[:5]
+		out: dict[str, Any] = {
+			"brackets": pop.brackets,
+			"chalk_champion": teams[chalk[champion]].name,
+			"chalk_final_four": [teams[t].name for t in final_four],
+			"champion_shares": [
+				{"team": teams[t].name, "share": round(n / pop.brackets, 3)} for n, t in champs
+			],
+		}
+		if self.leverage:
+			values = self.leverage.values()
+			out["avg_leverage_bits"] = round(math.fsum(values) / len(self.leverage), 2)
+		return out
+
+
+def pool_picks(picks: PickMatrix, popularity: Optional[PickPopularity] = None) -> PoolPicks:
+	"""
+	Counts `picks` (or uses `popularity`, e.g. merged shard counts) and scores every
+	bracket of `picks` against it.
+	"""
+	pop = popularity if popularity is not None else PickPopularity.from_picks(picks)
+	return PoolPicks(pop, dict(zip(picks.seeds, pop.leverage(picks))))
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import cProfile
+import io
+import json
+import pstats
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+# --profile support: cProfile for CPU, tracemalloc for memory.
+#
+# MemoryProfile hooks into TIMINGS stages (engine/timings.py): every stage gets its
+# peak traced memory, and the coarse phases also get their top allocation sites.
+
+PHASES = ("seeds", "pool_summary", "sharepack")
+
+
+def _snapshot() -> tracemalloc.Snapshot:
+	# Leave out tracemalloc's own bookkeeping
+	return tracemalloc.take_snapshot().filter_traces(
+		[
+			tracemalloc.Filter(False, tracemalloc.__file__),
+			tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+		]
+	)
+
+
+class CpuProfile:
+	def __init__(self) -> None:
+		self.profiler = cProfile.Profile()
+
+	def __enter__(self) -> "CpuProfile":
+		self.profiler.enable()
+		return self
+
+	def __exit__(self, *exc) -> None:
+		self.profiler.disable()
+
+	def write(self, out_dir: Path, top: int = 30) -> list[Path]:
+		out_dir.mkdir(parents=True, exist_ok=True)
+		stats_path = out_dir / "cpu.pstats"
+		self.profiler.dump_stats(str(stats_path))
+
+		buf = io.StringIO()
+		stats = pstats.Stats(str(stats_path), stream=buf).strip_dirs()
+		buf.write(f"Top {top} functions by cumulative time\n")
+		stats.sort_stats("cumulative").print_stats(top)
+		buf.write(f"\nTop {top} functions by own time\n")
+		stats.sort_stats("tottime").print_stats(top)
+		table_path = out_dir / "cpu_top.txt"
+		table_path.write_text(buf.getvalue(), encoding="utf-8")
+		return [stats_path, table_path]
+
+
+class MemoryProfile:
+	"""
+	Peak traced memory per stage (above the memory live when the stage started), and the
+	top allocation sites of each phase in PHASES, as growth between its start and end.
+	Nested stages keep their parents' peaks intact.
+	"""
+
+	def __init__(self, frames: int = 1, top: int = 15) -> None:
+		self.frames = frames
+		self.top = top
+		self.peaks: dict[str, int] = {}
+		self.sites: dict[str, list[dict[str, Any]]] = {}
+		self._stack: list[list[Any]] = []  # [name, start bytes, peak seen, snapshot or None]
+
+	def __enter__(self) -> "MemoryProfile":
+		tracemalloc.start(self.frames)
+		return self
+
+	def __exit__(self, *exc) -> None:
+		self.total_peak = tracemalloc.get_traced_memory()[1]
+		tracemalloc.stop()
+
+	def enter(self, name: str) -> None:
+		current, peak = tracemalloc.get_traced_memory()
+		if self._stack:
+			parent = self._stack[-1]
+			parent[2] = max(parent[2], peak)
+		tracemalloc.reset_peak()
+		snap = _snapshot() if name in PHASES else None
+		self._stack.append([name, current, current, snap])
+
+	def exit(self, name: str) -> None:
+		entry = self._stack.pop()
+		peak = max(entry[2], tracemalloc.get_traced_memory()[1])
+		self.peaks[name] = max(self.peaks.get(name, 0), peak - entry[1])
+		if self._stack:
+			parent = self._stack[-1]
+			parent[2] = max(parent[2], peak)
+		if entry[3] is not None:
+			diff = _snapshot().compare_to(entry[3], "lineno")
+			self.sites[name] = [
+				{
+					"site": str(stat.traceback),
+					"size_kib": round(stat.size_diff / 1024, 1),
+					"count": stat.count_diff,
+				}
+				for stat in diff[: self.top]
+			]
+
+	def write(self, out_dir: Path) -> list[Path]:
+		out_dir.mkdir(parents=True, exist_ok=True)
+		report = {
+			"total_peak_kib": round(getattr(self, "total_peak", 0) / 1024, 1),
+			"stage_peak_kib": {
+				name: round(b / 1024, 1)
+				for name, b in sorted(self.peaks.items(), key=lambda kv: -kv[1])
+			},
+			"phase_top_sites": self.sites,
+		}
+		json_path = out_dir / "memory.json"
+		json_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+		lines = [
+			f"Total traced peak: {report['total_peak_kib']:.1f} KiB",
+			"",
+			"Peak per stage (KiB)",
+		]
+		for name, kib in report["stage_peak_kib"].items():
+			lines.append(f"  {name:<16} {kib:>12.1f}")
+		for phase, sites in self.sites.items():
+			lines.append("")
+			lines.append(f"Top allocation sites: {phase} (growth)")
+			for s in sites:
+				lines.append(f"  {s['size_kib']:>10.1f} KiB {s['count']:>8} blocks  {s['site']}")
+		table_path = out_dir / "memory_top.txt"
+		table_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+		return [json_path, table_path]
+
+
+def start_profile(kind: str) -> Any:
+	if kind == "cpu":
+		return CpuProfile()
+	if kind == "mem":
+		return MemoryProfile()
+	raise ValueError(f"Unknown profile kind: {kind}")
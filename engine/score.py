@@ -1,10 +1,50 @@
 from __future__ import annotations
 
+import math
 import random
+import time
 from collections import Counter
-
-from .simulate import pick_winner
+from itertools import islice
+from typing import Any, Iterator, Optional, Sequence
+
+from .ensemble import RealityEnsemble
+from .matchups import MatchupTable
+from .packed import (
+	NO_PICK,
+	ROUND_OFFSETS,
+	SLOT_ROUNDS,
+	SLOT_WEIGHTS,
+	TOTAL_SLOTS,
+	PackedBracket,
+	slot_index,
+	unpack_bracket,
+)
+from .simulate import _tag_mask, pick_winner, tags_from_mask, win_probability
+from .timings import TIMINGS
 from .types import Bracket, SignalReport, Team
+from .variance import GROUP_SIZES
+
+
+COLLAPSE_METHODS = ("mc", "exact", "adaptive")
+
+# Key order of SignalReport.scores as score_bracket builds it
+REPORT_SCORE_ORDER = (
+	"overconfidence",
+	"chaos_addiction",
+	"brand_bias",
+	"narrative_bias",
+	"collapse_risk",
+)
+
+# Adaptive collapse MC: 95% confidence interval, and a floor before the CI is trusted
+# (in tournaments, and in independent pair/batch means for variance-reduced ensembles)
+ADAPTIVE_Z = 1.96
+ADAPTIVE_MIN_SIMS = 30
+ADAPTIVE_MIN_GROUPS = 10
+
+# Exact collapse: a pick of a team outside the field still counts toward `possible` (the
+# Monte Carlo path scores it as a miss), but no team index ever matches it
+_OFF_FIELD = NO_PICK - 1
 
 
 def _clamp01(x: float) -> float:
@@ -55,62 +95,60 @@ def _archetype(scores: dict[str, float]) -> str:
 	return "Social Copycat"
 
 
-def score_bracket(bracket: Bracket, rng: random.Random, sims: int = 400) -> SignalReport:
+def _pick_terms(
+	team_a: Team, team_b: Team, winner: Team, rnd: int
+) -> tuple[float, float, float, Optional[float]]:
 	"""
-	Scores a completed bracket (must have winners for all games in rounds 1..6).
-	If bracket is partially filled, scores based on available picks and estimates risk.
+	One pick's contribution to the bias aggregates:
+	(upset weight, brand pull, narrative pull, favorite confidence or None if not a favorite).
 	"""
-	played = [g for g in bracket.games if g.winner is not None]
-	if not played:
-		raise ValueError("Bracket has no winners yet. Generate picks first.")
-
+	loser = team_b if winner is team_a else team_a
+	gap = _seed_gap(team_a, team_b)
+	is_upset = winner.seed > loser.seed
+
+	# Round weight: later upsets are "bolder"
+	round_w = 0.65 + (rnd * 0.10)
+
+	if is_upset:
+		upset_weight = _clamp01((gap / 15.0) * round_w)
+	else:
+		upset_weight = 0.0
+
+	# Brand bias proxy: picking higher brand_code when it's not justified by momentum
+	brand_pull = winner.brand_code - loser.brand_code
+	momentum_pull = winner.momentum - loser.momentum
+	brand_pick = _clamp01(0.5 + (brand_pull - 0.5 * momentum_pull))
+
+	# Narrative bias: choosing hype over momentum
+	hype_pull = winner.hype - loser.hype
+	narrative_pick = _clamp01(0.5 + (hype_pull - 0.6 * momentum_pull))
+
+	# Overconfidence: picking favorites repeatedly with low chaos tolerance
+	favored = winner.seed < loser.seed
+	confidence = None
+	if favored:
+		confidence = _clamp01(0.55 + (gap / 18.0) - winner.chaos * 0.25)
+
+	return upset_weight, brand_pick, narrative_pick, confidence
+
+
+def _report_from(
+	terms: list[tuple[float, float, float, Optional[float]]],
+	tag_counts: Counter,
+	collapse_risk: float,
+	collapse_stats: Optional[dict[str, Any]] = None,
+) -> SignalReport:
 	# Upset addiction: count upsets weighted by seed gap and round importance
-	upset_weights: list[float] = []
-	brand_favorite_picks: list[float] = []
-	narrative_picks: list[float] = []
-	favorite_confidence: list[float] = []
-
-	tag_counts = Counter()
-	for g in played:
-		winner, loser = _winner_and_loser(g)
-		gap = _seed_gap(g.team_a, g.team_b)
-		is_upset = winner.seed > loser.seed
-
-		# Round weight: later upsets are "bolder"
-		round_w = 0.65 + (g.round * 0.10)
-
-		if is_upset:
-			upset_weights.append(_clamp01((gap / 15.0) * round_w))
-		else:
-			upset_weights.append(0.0)
-
-		# Brand bias proxy: picking higher brand_code when it's not justified by momentum
-		brand_pull = winner.brand_code - loser.brand_code
-		momentum_pull = winner.momentum - loser.momentum
-		brand_favorite_picks.append(_clamp01(0.5 + (brand_pull - 0.5 * momentum_pull)))
-
-		# Narrative bias: choosing hype over momentum
-		hype_pull = winner.hype - loser.hype
-		narrative_picks.append(_clamp01(0.5 + (hype_pull - 0.6 * momentum_pull)))
-
-		# Overconfidence: picking favorites repeatedly with low chaos tolerance
-		favored = winner.seed < loser.seed
-		if favored:
-			favorite_confidence.append(_clamp01(0.55 + (gap / 18.0) - winner.chaos * 0.25))
-
-		for t in (g.reason_tags or []):
-			tag_counts[t] += 1
+	upset_weights = [t[0] for t in terms]
+	brand_favorite_picks = [t[1] for t in terms]
+	narrative_picks = [t[2] for t in terms]
+	favorite_confidence = [t[3] for t in terms if t[3] is not None]
 
 	chaos_addiction = _clamp01(_avg(upset_weights) * 1.35)
 	brand_bias = _clamp01(_avg(brand_favorite_picks))
 	narrative_bias = _clamp01(_avg(narrative_picks))
 	overconfidence = _clamp01(_avg(favorite_confidence) if favorite_confidence else 0.45)
 
-	# Collapse risk: estimate via Monte Carlo vs a simulated "reality"
-	# We simulate tournament outcomes and measure mismatch depth.
-	# If your bracket disagrees early, you "die" early.
-	collapse_risk = _estimate_collapse_risk(bracket, rng, sims=sims)
-
 	scores = {
 		"overconfidence": overconfidence,
 		"chaos_addiction": chaos_addiction,
@@ -122,13 +160,189 @@ def score_bracket(bracket: Bracket, rng: random.Random, sims: int = 400) -> Sign
 	archetype = _archetype(scores)
 	reasons = _reasons_from(scores, tag_counts)
 
-	return SignalReport(scores=scores, archetype=archetype, reasons=reasons)
+	return SignalReport(
+		scores=scores, archetype=archetype, reasons=reasons, collapse_stats=collapse_stats
+	)
+
+
+def score_bracket(
+	bracket: Bracket,
+	rng: random.Random,
+	sims: int = 400,
+	method: str = "mc",
+	ensemble: Optional[RealityEnsemble] = None,
+	table: Optional[MatchupTable] = None,
+	tol: float = 0.01,
+	time_budget: Optional[float] = None,
+) -> SignalReport:
+	"""
+	Scores a completed bracket (must have winners for all games in rounds 1..6).
+	If bracket is partially filled, scores based on available picks and estimates risk.
+	method: "mc" samples collapse risk with `sims` tournaments, "exact" computes it
+	without sampling (rng and sims are ignored for the collapse term), "adaptive"
+	samples until the CI half-width is <= tol (at most `sims`, within `time_budget` s).
+	ensemble: pre-simulated realities shared across brackets; used instead of rng in "mc".
+	table: precomputed matchup inputs for this field (optional, same results).
+	"""
+	if method not in COLLAPSE_METHODS:
+		raise ValueError(f"Unknown collapse method: {method}")
+
+	played = [g for g in bracket.games if g.winner is not None]
+	if not played:
+		raise ValueError("Bracket has no winners yet. Generate picks first.")
+
+	with TIMINGS.stage("score.bias"):
+		terms = []
+		tag_counts = Counter()
+		for g in played:
+			winner, _loser = _winner_and_loser(g)
+			terms.append(_pick_terms(g.team_a, g.team_b, winner, g.round))
+			for t in (g.reason_tags or []):
+				tag_counts[t] += 1
+
+	# Collapse risk: estimate via Monte Carlo vs a simulated "reality"
+	# We simulate tournament outcomes and measure mismatch depth.
+	# If your bracket disagrees early, you "die" early.
+	collapse_stats = None
+	with TIMINGS.stage("score.collapse"):
+		if method == "exact":
+			collapse_risk = _exact_collapse_risk(bracket, table=table)
+		elif method == "adaptive":
+			collapse_risk, collapse_stats = _adaptive_collapse_risk(
+				bracket, rng, sims, tol, time_budget, ensemble=ensemble, table=table
+			)
+			TIMINGS.count("collapse_sims", collapse_stats["sims"])
+		else:
+			collapse_risk = _estimate_collapse_risk(
+				bracket, rng, sims=sims, ensemble=ensemble, table=table
+			)
+			if TIMINGS.enabled:
+				shared = ensemble is not None and ensemble.covers(bracket)
+				TIMINGS.count("collapse_sims", len(ensemble.rows) if shared else sims)
+
+	return _report_from(terms, tag_counts, collapse_risk, collapse_stats)
+
+
+def score_packed(
+	packed: PackedBracket,
+	rng: random.Random,
+	sims: int = 400,
+	method: str = "mc",
+	ensemble: Optional[RealityEnsemble] = None,
+	table: Optional[MatchupTable] = None,
+	tol: float = 0.01,
+	time_budget: Optional[float] = None,
+) -> SignalReport:
+	"""
+	score_bracket for a PackedBracket, without building the Game graph.
+	Gives the same report as score_bracket(unpack_bracket(packed), ...).
+	"""
+	if method not in COLLAPSE_METHODS:
+		raise ValueError(f"Unknown collapse method: {method}")
 
+	terms, tag_counts = _packed_terms(packed)
+	if not terms:
+		raise ValueError("Bracket has no winners yet. Generate picks first.")
 
-def _estimate_collapse_risk(bracket: Bracket, rng: random.Random, sims: int) -> float:
+	collapse_stats = None
+	if method == "exact":
+		lookup = table if table is not None and table.teams == packed.teams else None
+		collapse_risk = _exact_collapse_core(packed.field, packed.winners, packed.teams, lookup)
+	elif method == "adaptive":
+		collapse_risk, collapse_stats = _adaptive_collapse_risk(
+			unpack_bracket(packed), rng, sims, tol, time_budget, ensemble=ensemble, table=table
+		)
+	elif ensemble is not None and ensemble.covers_packed(packed):
+		collapse_risk = ensemble.collapse_risk_picks(packed.winners)
+	else:
+		collapse_risk = _estimate_collapse_risk(unpack_bracket(packed), rng, sims=sims, table=table)
+
+	return _report_from(terms, tag_counts, collapse_risk, collapse_stats)
+
+
+def _estimate_collapse_risk(
+	bracket: Bracket,
+	rng: random.Random,
+	sims: int,
+	ensemble: Optional[RealityEnsemble] = None,
+	table: Optional[MatchupTable] = None,
+) -> float:
 	"""
 	Simulate plausible "realities" and compute how early your bracket diverges.
 	Outputs 0..1 where 1 = collapses early often.
+	With an ensemble covering this bracket's field, its stored realities are reused.
+	"""
+	if ensemble is not None and ensemble.covers(bracket):
+		return ensemble.collapse_risk(bracket)
+
+	survivals = list(islice(_survival_samples(bracket, rng, table), max(80, sims)))
+
+	avg_survival = sum(survivals) / len(survivals)
+	return _clamp01(1.0 - avg_survival)
+
+
+def _adaptive_collapse_risk(
+	bracket: Bracket,
+	rng: random.Random,
+	sims: int,
+	tol: float,
+	time_budget: Optional[float] = None,
+	ensemble: Optional[RealityEnsemble] = None,
+	table: Optional[MatchupTable] = None,
+) -> tuple[float, dict[str, Any]]:
+	"""
+	Monte Carlo that stops once the 95% CI half-width of the mean survival is <= tol.
+	`sims` is a hard cap and `time_budget` (seconds) a soft per-bracket limit.
+	With a variance-reduced ensemble the CI is taken over antithetic pair means or
+	stratified/qmc batch means, and the run only stops on whole pairs or batches.
+	Returns (collapse risk, {"sims", "ci_half_width", "stopped"}).
+	"""
+	group = 1
+	if ensemble is not None and ensemble.covers(bracket):
+		samples = ensemble.survivals(ensemble.pick_vector(bracket))
+		group = GROUP_SIZES[ensemble.strategy]
+	else:
+		samples = _survival_samples(bracket, rng, table)
+
+	start = time.perf_counter()
+	cap = max(group, sims - sims % group)
+	samples = islice(samples, cap)
+	n = 0
+	k = 0
+	mean = 0.0
+	m2 = 0.0
+	half_width = float("inf")
+	stopped = "cap"
+
+	# Welford running mean/variance of the per-group (per-tournament when plain) survival
+	while len(chunk := list(islice(samples, group))) == group:
+		x = sum(chunk) / group
+		n += group
+		k += 1
+		delta = x - mean
+		mean += delta / k
+		m2 += delta * (x - mean)
+
+		if k >= 2:
+			half_width = ADAPTIVE_Z * math.sqrt(m2 / (k - 1) / k)
+		if n >= ADAPTIVE_MIN_SIMS and k >= ADAPTIVE_MIN_GROUPS and half_width <= tol:
+			stopped = "tol"
+			break
+		if time_budget is not None and time.perf_counter() - start >= time_budget:
+			stopped = "time"
+			break
+
+	stats = {"sims": n, "ci_half_width": half_width if k >= 2 else None, "stopped": stopped}
+	return _clamp01(1.0 - mean), stats
+
+
+def _survival_samples(
+	bracket: Bracket,
+	rng: random.Random,
+	table: Optional[MatchupTable] = None,
+) -> Iterator[float]:
+	"""
+	Endless stream of simulated survival fractions for this bracket.
 	"""
 	# Organize picks by slot
 	pick_by_slot: dict[str, str] = {}
@@ -148,7 +362,9 @@ def _estimate_collapse_risk(bracket: Bracket, rng: random.Random, sims: int) ->
 		Returns survival fraction 0..1 where 1 = matched all picked games.
 		Weighted by round so later matches count more.
 		"""
-		current = [(g.team_a, g.team_b, f"R1-G{idx:02d}") for idx, g in enumerate(r1_games, start=1)]
+		current = [
+			(g.team_a, g.team_b, f"R1-G{idx:02d}") for idx, g in enumerate(r1_games, start=1)
+		]
 		matched = 0.0
 		possible = 0.0
 
@@ -157,7 +373,7 @@ def _estimate_collapse_risk(bracket: Bracket, rng: random.Random, sims: int) ->
 			round_weight = 0.7 + (rnd * 0.25)
 
 			for i, (a, b, slot) in enumerate(current, start=1):
-				w, _tags = pick_winner(a, b, rng, rnd, mode="reality")
+				w, _tags = pick_winner(a, b, rng, rnd, mode="reality", table=table)
 				winners.append(w)
 
 				if slot in pick_by_slot:
@@ -180,12 +396,146 @@ def _estimate_collapse_risk(bracket: Bracket, rng: random.Random, sims: int) ->
 			return 0.0
 		return matched / possible
 
-	survivals = []
-	for _ in range(max(80, sims)):
-		survivals.append(simulate_one())
+	while True:
+		yield simulate_one()
 
-	avg_survival = sum(survivals) / len(survivals)
-	return _clamp01(1.0 - avg_survival)
+
+def _packed_terms(
+	packed: PackedBracket,
+) -> tuple[list[tuple[float, float, float, Optional[float]]], Counter]:
+	teams = packed.teams
+	terms = []
+	tag_counts = Counter()
+	for pos in range(TOTAL_SLOTS):
+		w = packed.winners[pos]
+		if w == NO_PICK:
+			continue
+		matchup = packed.matchup(pos)
+		if matchup is None:
+			continue
+		a = teams[matchup[0]]
+		b = teams[matchup[1]]
+		rnd = SLOT_ROUNDS[pos]
+		terms.append(_pick_terms(a, b, teams[w], rnd))
+		for t in tags_from_mask(_tag_mask(a, b, teams[w], rnd)):
+			tag_counts[t] += 1
+	return terms, tag_counts
+
+
+def report_from_scores(packed: PackedBracket, scores: dict[str, float]) -> SignalReport:
+	"""
+	Rebuilds the report of an already-scored packed bracket (archetype and reasons
+	follow from the scores and the picks), e.g. when reading back stored results.
+	"""
+	_terms, tag_counts = _packed_terms(packed)
+	# Same key order as score_bracket, so rebuilt rows serialize identically
+	scores = {k: scores[k] for k in REPORT_SCORE_ORDER}
+	return SignalReport(
+		scores=scores, archetype=_archetype(scores), reasons=_reasons_from(scores, tag_counts)
+	)
+
+
+def _exact_collapse_risk(bracket: Bracket, table: Optional[MatchupTable] = None) -> float:
+	"""
+	Same quantity as _estimate_collapse_risk with infinitely many sims.
+	`possible` does not depend on the simulated reality, so 1 - E[matched/possible]
+	only needs P(picked team wins slot). Those come from a DP over the bracket tree:
+	each slot carries a distribution over the teams that can occupy it.
+	"""
+	r1_games = [g for g in bracket.games if g.round == 1]
+	if len(r1_games) != 32:
+		r1_games = r1_games[:32]
+
+	# Work on team indices so the inner loop is plain dict/array access.
+	if table is not None:
+		teams = table.teams
+	else:
+		teams = tuple(t for g in r1_games for t in (g.team_a, g.team_b))
+	index = {t.id: i for i, t in enumerate(teams)}
+
+	missing = [t.id for g in r1_games for t in (g.team_a, g.team_b) if t.id not in index]
+	if missing:
+		raise ValueError(f"Round 1 teams not in the matchup table: {', '.join(missing)}")
+	field = [index[t.id] for g in r1_games for t in (g.team_a, g.team_b)]
+	picks = bytearray([NO_PICK] * TOTAL_SLOTS)
+	for g in bracket.games:
+		if g.winner is not None:
+			picks[slot_index(g.slot)] = index.get(g.winner.id, _OFF_FIELD)
+
+	return _exact_collapse_core(field, picks, teams, table)
+
+
+def _exact_collapse_core(
+	field: Sequence[int],
+	picks: Sequence[int],
+	teams: Sequence[Team],
+	table: Optional[MatchupTable],
+) -> float:
+	"""
+	field: Round 1 team indices (pairs); picks: winner index per slot (NO_PICK if none).
+	Indices point into `teams`, which must be table.teams when a table is given.
+	"""
+	matched = 0.0
+	possible = 0.0
+	for pos, dist in slot_distributions(field, teams, table).items():
+		pick = picks[pos]
+		if pick != NO_PICK:
+			round_weight = SLOT_WEIGHTS[pos]
+			possible += round_weight
+			matched += round_weight * dist.get(pick, 0.0)
+
+	if possible <= 0:
+		return 1.0
+	return _clamp01(1.0 - matched / possible)
+
+
+def slot_distributions(
+	field: Sequence[int],
+	teams: Sequence[Team],
+	table: Optional[MatchupTable] = None,
+) -> dict[int, dict[int, float]]:
+	"""
+	Exact reality-mode P(team wins slot) for every slot reachable from a Round 1 field,
+	keyed by slot position (in slot order), then team index. Independent of any picks.
+	"""
+	if table is not None:
+		win_prob = table.win_prob
+		n = table.n
+
+	out: dict[int, dict[int, float]] = {}
+
+	# (side_a distribution, side_b distribution, slot position); mirrors simulate_one()
+	current = [({field[j]: 1.0}, {field[j + 1]: 1.0}, j // 2) for j in range(0, len(field) - 1, 2)]
+
+	for rnd in range(1, 7):
+		winners: list[dict[int, float]] = []
+
+		for side_a, side_b, pos in current:
+			dist: dict[int, float] = {}
+			for a, pa in side_a.items():
+				for b, pb in side_b.items():
+					both = pa * pb
+					if table is not None:
+						q = win_prob[rnd][a * n + b]
+					else:
+						q = win_probability(teams[a], teams[b], rnd)
+					dist[a] = dist.get(a, 0.0) + both * q
+					dist[b] = dist.get(b, 0.0) + both * (1.0 - q)
+			winners.append(dist)
+			out[pos] = dist
+
+		next_current: list[tuple[dict[int, float], dict[int, float], int]] = []
+		for j in range(0, len(winners), 2):
+			if j + 1 >= len(winners):
+				break
+			next_pos = ROUND_OFFSETS[rnd + 1] + (j // 2)
+			next_current.append((winners[j], winners[j + 1], next_pos))
+		current = next_current
+
+		if not current:
+			break
+
+	return out
 
 
 def _reasons_from(scores: dict[str, float], tags) -> list[str]:
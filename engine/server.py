@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import OrderedDict, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Optional
+from urllib.parse import parse_qsl, urlsplit
+
+from .timings import _quantile
+
+# Local HTTP front end for a warm engine (run.py serve).
+#
+# A route takes the query parameters and returns (content type, body); it raises
+# ValueError for a bad request. Successful responses are cached by (path, query), so
+# repeated card requests are served without touching the engine.
+
+Route = Callable[[dict[str, str]], tuple[str, str]]
+
+LATENCY_WINDOW = 10_000
+
+
+class LRUCache:
+	"""
+	Thread-safe least-recently-used map with hit/miss counters.
+	"""
+
+	def __init__(self, maxsize: int) -> None:
+		self.maxsize = maxsize
+		self.hits = 0
+		self.misses = 0
+		self._data: OrderedDict[Any, Any] = OrderedDict()
+		self._lock = threading.Lock()
+
+	def get(self, key: Any) -> Optional[Any]:
+		with self._lock:
+			if key in self._data:
+				self._data.move_to_end(key)
+				self.hits += 1
+				return self._data[key]
+			self.misses += 1
+			return None
+
+	def put(self, key: Any, value: Any) -> None:
+		if self.maxsize <= 0:
+			return
+		with self._lock:
+			self._data[key] = value
+			self._data.move_to_end(key)
+			while len(self._data) > self.maxsize:
+				self._data.popitem(last=False)
+
+	def stats(self) -> dict[str, int]:
+		return {
+			"size": len(self._data),
+			"maxsize": self.maxsize,
+			"hits": self.hits,
+			"misses": self.misses,
+		}
+
+
+class Metrics:
+	def __init__(self) -> None:
+		self.started = time.time()
+		self.requests: dict[str, int] = {}
+		self.statuses: dict[str, int] = {}
+		self.latencies: dict[str, deque[float]] = {}
+		self._lock = threading.Lock()
+
+	def record(self, endpoint: str, status: int, seconds: float) -> None:
+		with self._lock:
+			self.requests[endpoint] = self.requests.get(endpoint, 0) + 1
+			self.statuses[str(status)] = self.statuses.get(str(status), 0) + 1
+			self.latencies.setdefault(endpoint, deque(maxlen=LATENCY_WINDOW)).append(seconds)
+
+	def snapshot(self) -> dict[str, Any]:
+		with self._lock:
+			latency = {}
+			for endpoint, window in self.latencies.items():
+				xs = sorted(window)
+				latency[endpoint] = {
+					"p50_ms": round(_quantile(xs, 0.50) * 1000.0, 3),
+					"p95_ms": round(_quantile(xs, 0.95) * 1000.0, 3),
+					"p99_ms": round(_quantile(xs, 0.99) * 1000.0, 3),
+					"max_ms": round(xs[-1] * 1000.0, 3),
+				}
+			return {
+				"uptime_seconds": round(time.time() - self.started, 1),
+				"requests": dict(self.requests),
+				"statuses": dict(self.statuses),
+				"latency": latency,
+			}
+
+
+def make_server(
+	routes: dict[str, Route],
+	port: int,
+	cache_size: int = 4096,
+	extra_metrics: Optional[Callable[[], dict[str, Any]]] = None,
+	quiet: bool = True,
+) -> ThreadingHTTPServer:
+	"""
+	Threaded server bound to 127.0.0.1 only. GET /metrics reports request counts,
+	per-endpoint latency percentiles, the response cache and `extra_metrics()`.
+	"""
+	cache = LRUCache(cache_size)
+	metrics = Metrics()
+
+	class Handler(BaseHTTPRequestHandler):
+		server_version = "SignalServe/1"
+
+		def do_GET(self) -> None:
+			start = time.perf_counter()
+			url = urlsplit(self.path)
+			endpoint = url.path.rstrip("/") or "/"
+			params = dict(parse_qsl(url.query))
+			status, ctype, body = self._dispatch(endpoint, params)
+
+			self.send_response(status)
+			self.send_header("Content-Type", ctype)
+			self.send_header("Content-Length", str(len(body)))
+			self.end_headers()
+			self.wfile.write(body)
+			known = endpoint in routes or endpoint == "/metrics"
+			metrics.record(endpoint if known else "other", status, time.perf_counter() - start)
+
+		def _dispatch(self, endpoint: str, params: dict[str, str]) -> tuple[int, str, bytes]:
+			if endpoint == "/metrics":
+				payload = metrics.snapshot()
+				payload["response_cache"] = cache.stats()
+				if extra_metrics is not None:
+					payload.update(extra_metrics())
+				return 200, "application/json", json.dumps(payload, indent=2).encode("utf-8")
+
+			route = routes.get(endpoint)
+			if route is None:
+				known = ", ".join(sorted([*routes, "/metrics"]))
+				message = f"Unknown endpoint {endpoint} (try {known})"
+				return 404, "text/plain; charset=utf-8", message.encode("utf-8")
+
+			key = (endpoint, tuple(sorted(params.items())))
+			hit = cache.get(key)
+			if hit is not None:
+				return hit
+			try:
+				ctype, text = route(params)
+			except ValueError as e:
+				return 400, "text/plain; charset=utf-8", str(e).encode("utf-8")
+			response = (200, ctype, text.encode("utf-8"))
+			cache.put(key, response)
+			return response
+
+		def log_message(self, format: str, *args: Any) -> None:
+			if not quiet:
+				super().log_message(format, *args)
+
+	server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+	server.daemon_threads = True
+	return server
@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from pathlib import Path
+from typing import Optional
+
+from .packed import (
+	ROUND_GAMES,
+	ROUND_OFFSETS,
+	SLOT_ROUNDS,
+	TOTAL_ROUNDS,
+	TOTAL_SLOTS,
+	PickMatrix,
+	slot_name,
+)
+
+# Bracket similarity by pick overlap.
+#
+# A bracket's picks are six 64-bit masks, one per round, of the teams it advances (bit =
+# the team's Round 1 field position). Two brackets agree on round r in
+# popcount(A_r & B_r) of its games_r slots, so
+#
+#   distance(A, B) = sum_r ROUND_POINTS[r] * (games_r - popcount(A_r & B_r))
+#
+# is the points at stake (standard 1-2-4-8-16-32 pool scoring) where they differ:
+# 0 for identical brackets, MAX_DISTANCE = 192 for brackets that share no pick.
+#
+# SimilarityIndex answers nearest-neighbour queries over a whole pool exactly with a
+# bit-sliced scan: for every slot and every team that can win it, one big-int bitset over
+# the pool's brackets. A query adds up its 63 matching bitsets in bit-sliced counters
+# (one bit-plane per similarity bit), so each step works on all brackets at once, then
+# walks the counter planes from the top bit down to select the k best.
+
+ROUND_POINTS = {1: 1, 2: 2, 3: 4, 4: 8, 5: 16, 6: 32}
+
+MAX_DISTANCE = sum(ROUND_POINTS[rnd] * ROUND_GAMES[rnd] for rnd in ROUND_POINTS)
+
+# Bit-planes needed to count up to MAX_DISTANCE
+_PLANES = MAX_DISTANCE.bit_length()
+
+_SLOT_LOG2_POINTS = [ROUND_POINTS[rnd].bit_length() - 1 for rnd in SLOT_ROUNDS]
+
+
+def round_masks(field: bytes, winners: bytes) -> tuple[int, ...]:
+	"""
+	The six advancing-team masks of a complete bracket (bit = Round 1 field position).
+	"""
+	position = {team: pos for pos, team in enumerate(field)}
+	masks = []
+	for rnd in range(1, TOTAL_ROUNDS + 1):
+		start = ROUND_OFFSETS[rnd]
+		mask = 0
+		for team in winners[start : start + ROUND_GAMES[rnd]]:
+			mask |= 1 << position[team]
+		masks.append(mask)
+	return tuple(masks)
+
+
+def mask_distance(a: tuple[int, ...], b: tuple[int, ...]) -> int:
+	return sum(
+		ROUND_POINTS[rnd] * (ROUND_GAMES[rnd] - (a[rnd - 1] & b[rnd - 1]).bit_count())
+		for rnd in range(1, TOTAL_ROUNDS + 1)
+	)
+
+
+def first_divergence(a: tuple[int, ...], b: tuple[int, ...]) -> Optional[int]:
+	"""
+	Earliest slot (round-major) where the two brackets pick different winners, or None.
+	A round r slot covers 2**r consecutive field positions, so the lowest differing bit
+	of the round's masks names the slot.
+	"""
+	for rnd in range(1, TOTAL_ROUNDS + 1):
+		diff = a[rnd - 1] ^ b[rnd - 1]
+		if diff:
+			low = (diff & -diff).bit_length() - 1
+			return ROUND_OFFSETS[rnd] + (low >> rnd)
+	return None
+
+
+def pick_diff(a: bytes, b: bytes) -> list[tuple[str, int, int]]:
+	"""
+	(slot name, winner in a, winner in b) for every slot where two pick rows differ.
+	"""
+	return [(slot_name(pos), a[pos], b[pos]) for pos in range(TOTAL_SLOTS) if a[pos] != b[pos]]
+
+
+def _set_bits(x: int, limit: int) -> list[int]:
+	# Lowest `limit` set bit positions of x, ascending
+	out = []
+	while x and len(out) < limit:
+		low = x & -x
+		out.append(low.bit_length() - 1)
+		x ^= low
+	return out
+
+
+class SimilarityIndex:
+	"""
+	Exact k-nearest-neighbour search by weighted pick overlap over a PickMatrix.
+
+	Memory is one bit per bracket for each (slot, possible winner) pair: 384 bitsets,
+	about 48 MB for a million brackets. Results are deterministic: equal distances are
+	ordered by position in the pool (seed order).
+	"""
+
+	def __init__(self, picks: PickMatrix) -> None:
+		self.picks = picks
+		self.n = len(picks)
+		self.all = (1 << self.n) - 1
+		self._masks: dict[int, tuple[int, ...]] = {}
+
+		# slot -> {team: bitset of brackets picking it}. Column s of the row-major matrix
+		# is data[s::63]; reversed, bracket i lands on bit i of int(..., 2).
+		data = bytes(picks.data)
+		self.columns: list[dict[int, int]] = []
+		for pos in range(TOTAL_SLOTS):
+			column = data[pos::TOTAL_SLOTS][::-1]
+			bitsets: dict[int, int] = {}
+			for team in set(column):
+				table = bytearray(b"0" * 256)
+				table[team] = ord("1")
+				bitsets[team] = int(column.translate(table), 2)
+			self.columns.append(bitsets)
+
+	def masks(self, i: int) -> tuple[int, ...]:
+		masks = self._masks.get(i)
+		if masks is None:
+			masks = self._masks[i] = round_masks(self.picks.field, self.picks.row(i))
+		return masks
+
+	def _similarity_planes(self, row: bytes) -> list[int]:
+		# Bit-sliced sum over slots of ROUND_POINTS[round] * [bracket agrees with row]
+		planes = [0] * _PLANES
+		for pos in range(TOTAL_SLOTS):
+			carry = self.columns[pos].get(row[pos], 0)
+			bit = _SLOT_LOG2_POINTS[pos]
+			while carry:
+				plane = planes[bit]
+				planes[bit] = plane ^ carry
+				carry &= plane
+				bit += 1
+		return planes
+
+	def nearest(
+		self, row: bytes, k: int = 10, exclude: Optional[int] = None
+	) -> list[tuple[int, int]]:
+		"""
+		The k brackets closest to pick row `row`: [(pool position, distance)], nearest first.
+		`exclude` drops one position (the query's own bracket).
+		"""
+		if len(row) != TOTAL_SLOTS:
+			raise ValueError(f"Expected {TOTAL_SLOTS} picks, got {len(row)}")
+		candidates = self.all
+		if exclude is not None:
+			candidates &= ~(1 << exclude)
+		k = min(k, candidates.bit_count())
+		if k <= 0:
+			return []
+
+		# Highest similarity first: take whole groups above the k-th value, then fill the
+		# remaining places from the tied group in pool order.
+		planes = self._similarity_planes(row)
+		chosen = 0
+		need = k
+		for plane in reversed(planes):
+			high = candidates & plane
+			count = high.bit_count()
+			if count >= need:
+				candidates = high
+			else:
+				chosen |= high
+				need -= count
+				candidates &= ~plane
+		positions = _set_bits(chosen, k) + _set_bits(candidates, need)
+
+		query = round_masks(self.picks.field, row)
+		hits = [(i, mask_distance(query, self.masks(i))) for i in positions]
+		hits.sort(key=lambda h: (h[1], h[0]))
+		return hits
+
+	def twins(self, i: int, k: int = 1) -> list[tuple[int, int]]:
+		"""
+		The k brackets closest to pool bracket i (other than itself).
+		"""
+		return self.nearest(self.picks.row(i), k, exclude=i)
+
+	def distance(self, i: int, j: int) -> int:
+		return mask_distance(self.masks(i), self.masks(j))
+
+	def divergence(self, i: int, j: int) -> Optional[int]:
+		return first_divergence(self.masks(i), self.masks(j))
+
+
+def main() -> None:
+	# Local imports: only the CLI needs the generator, archive reader and team data.
+	from .archive import PoolArchive
+	from .generate import generate_brackets
+	from .matchups import load_matchup_table
+	from .teams import load_teams
+
+	p = argparse.ArgumentParser(description="Nearest brackets by weighted pick overlap.")
+	p.add_argument("--archive", type=str, default="", help="Search a pool_archive.smm instead.")
+	p.add_argument("--seed", type=int, default=100, help="First seed of the pool.")
+	p.add_argument("--pool", type=int, default=10_000, help="Brackets in the pool.")
+	p.add_argument("--query", type=int, default=None, help="Seed to find twins for.")
+	p.add_argument("--k", type=int, default=5, help="Neighbours to list.")
+	p.add_argument("--queries", type=int, default=20, help="Random queries for the latency figure.")
+	args = p.parse_args()
+
+	start = time.perf_counter()
+	if args.archive:
+		with PoolArchive(args.archive) as archive:
+			picks = archive.pick_matrix()
+	else:
+		data = Path(__file__).resolve().parent.parent / "data" / "teams.json"
+		table = load_matchup_table(data, load_teams(data))
+		picks = generate_brackets(range(args.seed, args.seed + args.pool), table)
+	loaded = time.perf_counter()
+	index = SimilarityIndex(picks)
+	built = time.perf_counter()
+	print(f"{len(picks)} brackets: loaded {loaded - start:.2f}s, indexed {built - loaded:.2f}s")
+
+	query_seed = picks.seeds[0] if args.query is None else args.query
+	if query_seed not in picks.seeds:
+		raise SystemExit(f"Seed {query_seed} is not in the pool")
+	qi = picks.seeds.index(query_seed)
+	teams = picks.teams
+	print(f"\nBRACKET TWINS FOR SEED {query_seed}")
+	for i, dist in index.twins(qi, args.k):
+		pos = index.divergence(qi, i)
+		where = "identical" if pos is None else f"first split {slot_name(pos)}"
+		print(f"- seed {picks.seeds[i]:<10} distance {dist:>3}/{MAX_DISTANCE}  {where}")
+		if pos is not None:
+			a, b = picks.row(qi)[pos], picks.row(i)[pos]
+			print(f"    {teams[a].name} vs {teams[b].name}")
+
+	rng = random.Random(0)
+	sample = [rng.randrange(len(picks)) for _ in range(args.queries)]
+	start = time.perf_counter()
+	for i in sample:
+		index.twins(i, args.k)
+	per_query = (time.perf_counter() - start) / max(1, len(sample))
+	print(f"\n{per_query * 1000:.1f} ms per top-{args.k} query over {len(picks)} brackets")
+
+
+if __name__ == "__main__":
+	main()
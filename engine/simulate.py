@@ -2,12 +2,25 @@ from __future__ import annotations
 
 import math
 import random
+from array import array
+from typing import TYPE_CHECKING, Optional, Sequence
 
 from .types import Team
 
+if TYPE_CHECKING:
+	from .matchups import MatchupTable
+
 # Round multipliers: later rounds punish chaos more (harder to keep landing upsets)
 ROUND_CHAOS_MULT = {1: 1.15, 2: 1.05, 3: 0.95, 4: 0.85, 5: 0.75, 6: 0.65}
 
+# Packed reason tags (pick_winners_batch). "favorite" is the absence of TAG_UPSET.
+TAG_UPSET = 1
+TAG_MOMENTUM = 2
+TAG_HYPE = 4
+TAG_BRAND = 8
+TAG_CHOKE = 16
+TAG_BIG_UPSET = 32
+
 
 def _clamp01(x: float) -> float:
 	return max(0.0, min(1.0, x))
@@ -28,17 +41,9 @@ def _sigmoid(x: float) -> float:
 	return 1.0 / (1.0 + math.exp(-x))
 
 
-def pick_winner(
-	team_a: Team,
-	team_b: Team,
-	rng: random.Random,
-	round_num: int,
-	mode: str = "bracket",
-	profile=None,
-) -> tuple[Team, list[str]]:
+def _base_prob(team_a: Team, team_b: Team) -> float:
 	"""
-	Returns (winner, reason_tags).
-	Deterministic-ish with controlled randomness; built for "behavior", not truth.
+	Probability that team_a beats team_b before any chaos noise is injected.
 	"""
 	# Normalize seed advantage: lower seed number is better
 	seed_gap = team_b.seed - team_a.seed  # positive means A is higher seed (better)
@@ -60,6 +65,15 @@ def pick_winner(
 		+ 0.10 * (1.0 - seed_adv_a)
 	)
 
+	# Logistic probability from strength difference
+	diff = base_a - base_b
+	return 1.0 / (1.0 + math.exp(-4.2 * diff))
+
+
+def _chaos_amp(team_a: Team, team_b: Team, round_num: int, mode: str) -> float:
+	"""
+	Half-width of the uniform chaos draw for this matchup (before the 0.18 scale).
+	"""
 	# Chaos noise: average of both teams, scaled by round
 	chaos = (team_a.chaos + team_b.chaos) / 2.0
 	chaos *= ROUND_CHAOS_MULT.get(round_num, 1.0)
@@ -71,10 +85,58 @@ def pick_winner(
 		chaos *= 0.55
 	else:
 		chaos *= 1.00
+	return chaos
+
+
+def _expected_clamped(p: float, chaos: float) -> float:
+	"""
+	E[clamp01(p + U(-chaos, chaos) * 0.18)] in closed form.
+	"""
+	h = chaos * 0.18
+	if h <= 0.0:
+		return _clamp01(p)
+
+	def integral(y: float) -> float:
+		# Antiderivative of clamp01(y)
+		if y <= 0.0:
+			return 0.0
+		if y >= 1.0:
+			return y - 0.5
+		return 0.5 * y * y
+
+	return (integral(p + h) - integral(p - h)) / (2.0 * h)
+
+
+def win_probability(team_a: Team, team_b: Team, round_num: int) -> float:
+	"""
+	Exact probability that team_a beats team_b in reality mode.
+	Integrates the uniform chaos noise out of pick_winner instead of sampling it.
+	"""
+	p_a = _base_prob(team_a, team_b)
+	chaos = _chaos_amp(team_a, team_b, round_num, "reality")
+	return _expected_clamped(p_a, chaos)
+
+
+def pick_winner(
+	team_a: Team,
+	team_b: Team,
+	rng: random.Random,
+	round_num: int,
+	mode: str = "bracket",
+	profile=None,
+	table: Optional[MatchupTable] = None,
+) -> tuple[Team, list[str]]:
+	"""
+	Returns (winner, reason_tags).
+	Deterministic-ish with controlled randomness; built for "behavior", not truth.
+	With a MatchupTable the per-matchup inputs are looked up instead of recomputed.
+	"""
+	if table is not None:
+		p_a, chaos = table.lookup(team_a, team_b, round_num, mode)
+	else:
+		p_a = _base_prob(team_a, team_b)
+		chaos = _chaos_amp(team_a, team_b, round_num, mode)
 
-	# Logistic probability from strength difference
-	diff = base_a - base_b
-	p_a = 1.0 / (1.0 + math.exp(-4.2 * diff))
 	# Inject chaos
 	p_a = _clamp01(p_a + rng.uniform(-chaos, chaos) * 0.18)
 
@@ -154,3 +216,100 @@ def pick_winner(
 		tags.append("big_upset")
 
 	return winner, tags
+
+
+def _tag_mask(team_a: Team, team_b: Team, winner: Team, round_num: int) -> int:
+	"""
+	Bit-packed equivalent of the reason_tags built at the end of pick_winner.
+	"""
+	favorite = team_a if team_a.seed < team_b.seed else team_b
+	mask = 0 if winner is favorite else TAG_UPSET
+
+	dom = max(
+		(TAG_MOMENTUM, winner.momentum),
+		(TAG_HYPE, winner.hype),
+		(TAG_BRAND, winner.brand_code),
+		key=lambda x: x[1],
+	)[0]
+	mask |= dom
+
+	loser = team_b if winner is team_a else team_a
+	if loser.pressure > 0.75 and round_num >= 2:
+		mask |= TAG_CHOKE
+
+	if winner is not favorite and abs(team_a.seed - team_b.seed) >= 6:
+		mask |= TAG_BIG_UPSET
+
+	return mask
+
+
+def tags_from_mask(mask: int) -> list[str]:
+	"""
+	Expands a packed tag mask into the reason_tags list pick_winner would return.
+	"""
+	tags = ["upset" if mask & TAG_UPSET else "favorite"]
+	if mask & TAG_MOMENTUM:
+		tags.append("momentum")
+	elif mask & TAG_HYPE:
+		tags.append("hype")
+	elif mask & TAG_BRAND:
+		tags.append("brand")
+	if mask & TAG_CHOKE:
+		tags.append("choke")
+	if mask & TAG_BIG_UPSET:
+		tags.append("big_upset")
+	return tags
+
+
+def pick_winners_batch(
+	team_idx_a: Sequence[int],
+	team_idx_b: Sequence[int],
+	round_num: int,
+	rng: random.Random,
+	mode: str = "reality",
+	*,
+	table: MatchupTable,
+	with_tags: bool = False,
+) -> tuple[array, Optional[array]]:
+	"""
+	Resolves many games at once. Teams are given as indices into `table.teams`.
+	Returns (winner indices, packed tag masks or None).
+
+	Same probability model as pick_winner without a profile, and the rng is
+	consumed in the same order: resolving games in sequence with pick_winner
+	from the same rng state picks the same winners.
+	"""
+	if len(team_idx_a) != len(team_idx_b):
+		raise ValueError("team_idx_a and team_idx_b must have the same length")
+
+	rnd = rng.random
+	teams = table.teams
+	n = table.n
+	base = table.base
+	chaos_by_pair = table.chaos[mode][round_num]
+	underdog_nudge = mode == "bracket" and round_num == 1
+
+	winners = array("B")
+	masks = array("B") if with_tags else None
+
+	for ia, ib in zip(team_idx_a, team_idx_b):
+		k = ia * n + ib
+		chaos = chaos_by_pair[k]
+
+		# rng.uniform(-chaos, chaos), inlined
+		p_a = base[k] + (-chaos + (chaos - -chaos) * rnd()) * 0.18
+		p_a = 0.0 if p_a < 0.0 else 1.0 if p_a > 1.0 else p_a
+
+		if underdog_nudge:
+			a = teams[ia]
+			b = teams[ib]
+			underdog = a if a.seed > b.seed else b
+			if underdog.hype > 0.70:
+				p_a = _clamp01(p_a + 0.04) if underdog is a else _clamp01(p_a - 0.04)
+
+		w = ia if rnd() < p_a else ib
+		winners.append(w)
+		if masks is not None:
+			masks.append(_tag_mask(teams[ia], teams[ib], teams[w], round_num))
+
+	return winners, masks
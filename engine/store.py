@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import itertools
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
+
+from .score import REPORT_SCORE_ORDER
+
+# Optional SQLite store for pool results (stdlib sqlite3).
+#
+# One row per seed: the leaderboard row split into columns, with the score axes as REAL
+# columns and the shareability breakdown as JSON text; leverage_bits is NULL for rows
+# without pick popularity (shard runs). Every column a dashboard sorts or filters on is
+# indexed, with the seed as the tie-break, so top-k reads walk an index instead of
+# sorting the pool. Indexes are ascending: SQLite walks them backwards for
+# highest-first reads and only sorts within runs of equal values for the seed order.
+
+SCHEMA_VERSION = 1
+
+ORDER_COLUMNS = ("shareability",) + REPORT_SCORE_ORDER
+
+_COLUMNS = (
+	("seed", "archetype", "headline", "shareability")
+	+ REPORT_SCORE_ORDER
+	+ ("breakdown", "leverage_bits")
+)
+
+_TABLES = [
+	"CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)",
+	"CREATE TABLE IF NOT EXISTS results ("
+	"seed INTEGER PRIMARY KEY, archetype TEXT NOT NULL, headline TEXT NOT NULL, "
+	"shareability REAL NOT NULL, "
+	+ ", ".join(f"{axis} REAL NOT NULL" for axis in REPORT_SCORE_ORDER)
+	+ ", breakdown TEXT NOT NULL, leverage_bits REAL)",
+]
+
+# name -> indexed columns
+_INDEXES = {
+	"results_by_shareability": "shareability, seed",
+	"results_by_archetype": "archetype, shareability, seed",
+	**{f"results_by_{axis}": f"{axis}, seed" for axis in REPORT_SCORE_ORDER},
+}
+
+# Loading into an empty store without indexes and building them afterwards is several
+# times faster than keeping eight indexes up to date row by row.
+BULK_LOAD_MIN_ROWS = 50_000
+
+
+def _chunks(items: Iterable[tuple], size: int) -> Iterator[list[tuple]]:
+	it = iter(items)
+	while chunk := list(itertools.islice(it, size)):
+		yield chunk
+
+
+def _to_record(row: dict[str, Any]) -> tuple:
+	scores = row["scores"]
+	return (
+		row["seed"],
+		row["archetype"],
+		row["headline"],
+		row["shareability_score"],
+		*(scores[axis] for axis in REPORT_SCORE_ORDER),
+		json.dumps(row["breakdown"]),
+		row.get("leverage_bits"),
+	)
+
+
+def _to_row(record: sqlite3.Row) -> dict[str, Any]:
+	# Same keys, in the same order, as run.py's leaderboard rows
+	row = {
+		"seed": record["seed"],
+		"archetype": record["archetype"],
+		"headline": record["headline"],
+		"shareability_score": record["shareability"],
+		"breakdown": json.loads(record["breakdown"]),
+		"scores": {axis: record[axis] for axis in REPORT_SCORE_ORDER},
+	}
+	if record["leverage_bits"] is not None:
+		row["leverage_bits"] = record["leverage_bits"]
+	return row
+
+
+class ResultsStore:
+	"""
+	Pool leaderboard rows in SQLite, keyed by seed.
+
+	add_rows() inserts in batched transactions (a seed that is already stored is replaced);
+	clear() empties the store first when a new pool replaces the old one. top() and
+	by_seed() read through the indexes without loading the pool.
+	"""
+
+	def __init__(self, path: str | Path, readonly: bool = False) -> None:
+		self.path = Path(path)
+		if readonly:
+			if not self.path.exists():
+				raise FileNotFoundError(f"No results store at {self.path}")
+			self._db = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True)
+		else:
+			self.path.parent.mkdir(parents=True, exist_ok=True)
+			self._db = sqlite3.connect(self.path)
+			self._db.execute("PRAGMA journal_mode=WAL")
+			self._db.execute("PRAGMA synchronous=NORMAL")
+			with self._db:
+				for stmt in _TABLES:
+					self._db.execute(stmt)
+				self._create_indexes()
+				self._db.execute(
+					"INSERT OR IGNORE INTO meta (key, value) VALUES ('schema', ?)",
+					(str(SCHEMA_VERSION),),
+				)
+		self._db.row_factory = sqlite3.Row
+
+	def _create_indexes(self) -> None:
+		for name, columns in _INDEXES.items():
+			self._db.execute(f"CREATE INDEX IF NOT EXISTS {name} ON results ({columns})")
+
+	def _drop_indexes(self) -> None:
+		for name in _INDEXES:
+			self._db.execute(f"DROP INDEX IF EXISTS {name}")
+
+	def clear(self) -> None:
+		"""
+		Removes every stored row, so the next add_rows() holds one run's pool only.
+		"""
+		with self._db:
+			self._db.execute("DELETE FROM results")
+
+	def add_rows(self, rows: Iterable[dict[str, Any]], batch: int = 10_000) -> int:
+		"""
+		Inserts (or replaces) rows in transactions of `batch` rows; returns the row count.
+		"""
+		marks = ", ".join("?" * len(_COLUMNS))
+		sql = f"INSERT OR REPLACE INTO results ({', '.join(_COLUMNS)}) VALUES ({marks})"
+		bulk = False
+		if self.count() == 0:
+			rows = iter(rows)
+			head = [r for _, r in zip(range(BULK_LOAD_MIN_ROWS), rows)]
+			bulk = len(head) == BULK_LOAD_MIN_ROWS
+			rows = itertools.chain(head, rows)
+		if bulk:
+			with self._db:
+				self._drop_indexes()
+
+		n = 0
+		try:
+			for chunk in _chunks(map(_to_record, rows), batch):
+				with self._db:
+					self._db.executemany(sql, chunk)
+				n += len(chunk)
+		finally:
+			if bulk:
+				with self._db:
+					self._create_indexes()
+		return n
+
+	def count(self, archetype: Optional[str] = None) -> int:
+		if archetype is None:
+			return self._db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+		cur = self._db.execute("SELECT COUNT(*) FROM results WHERE archetype = ?", (archetype,))
+		return cur.fetchone()[0]
+
+	def archetypes(self) -> dict[str, int]:
+		"""
+		archetype -> number of brackets, most common first.
+		"""
+		cur = self._db.execute(
+			"SELECT archetype, COUNT(*) AS n FROM results "
+			"GROUP BY archetype ORDER BY n DESC, archetype"
+		)
+		return {r["archetype"]: r["n"] for r in cur}
+
+	def top(
+		self,
+		k: int = 10,
+		archetype: Optional[str] = None,
+		by: str = "shareability",
+		ascending: bool = False,
+	) -> list[dict[str, Any]]:
+		"""
+		The k best rows by `by` (shareability or a score axis), optionally one archetype only.
+		Ties go to the lower seed, as in leaderboard.json.
+		"""
+		if by not in ORDER_COLUMNS:
+			raise ValueError(f"Cannot order by {by!r} (one of: {', '.join(ORDER_COLUMNS)})")
+		direction = "ASC" if ascending else "DESC"
+		where = ""
+		params: list[Any] = []
+		if archetype is not None:
+			where = "WHERE archetype = ?"
+			params.append(archetype)
+		params.append(k)
+		cur = self._db.execute(
+			f"SELECT * FROM results {where} ORDER BY {by} {direction}, seed LIMIT ?", params
+		)
+		return [_to_row(r) for r in cur]
+
+	def by_seed(self, seed: int) -> Optional[dict[str, Any]]:
+		record = self._db.execute("SELECT * FROM results WHERE seed = ?", (seed,)).fetchone()
+		return None if record is None else _to_row(record)
+
+	def close(self) -> None:
+		self._db.close()
+
+	def __enter__(self) -> "ResultsStore":
+		return self
+
+	def __exit__(self, *exc) -> None:
+		self.close()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import json
 from pathlib import Path
 from typing import Iterable
@@ -32,6 +33,13 @@ def load_teams(path: str | Path) -> list[Team]:
 	return teams
 
 
+def teams_digest(path: str | Path) -> str:
+	"""
+	Content hash of a teams file; anything derived from the teams is keyed by it.
+	"""
+	return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
 def group_by_seed(teams: Iterable[Team]) -> dict[int, list[Team]]:
 	out: dict[int, list[Team]] = {}
 	for t in teams:
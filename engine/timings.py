@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Optional
+
+# Lightweight stage timers and counters.
+#
+# TIMINGS is process-wide. When disabled, stage() hands back a shared no-op context and
+# count() returns immediately, so the hooks can stay in hot paths. Worker processes
+# send snapshot()s back to the parent, which merge()s them. Updates take a lock, so
+# stage threads (--pipeline) can share it.
+
+
+class _Stage:
+	__slots__ = ("_timings", "_name", "_start")
+
+	def __init__(self, timings: "Timings", name: str) -> None:
+		self._timings = timings
+		self._name = name
+		self._start = 0.0
+
+	def __enter__(self) -> "_Stage":
+		if self._timings.memory is not None:
+			self._timings.memory.enter(self._name)
+		self._start = time.perf_counter()
+		return self
+
+	def __exit__(self, *exc) -> None:
+		self._timings.add_time(self._name, time.perf_counter() - self._start)
+		if self._timings.memory is not None:
+			self._timings.memory.exit(self._name)
+
+
+class _NoStage:
+	__slots__ = ()
+
+	def __enter__(self) -> "_NoStage":
+		return self
+
+	def __exit__(self, *exc) -> None:
+		return None
+
+
+_NO_STAGE = _NoStage()
+
+
+def _quantile(sorted_xs: list[float], p: float) -> float:
+	# Nearest-rank percentile
+	if not sorted_xs:
+		return 0.0
+	k = max(0, min(len(sorted_xs) - 1, int(round(p * len(sorted_xs) + 0.5)) - 1))
+	return sorted_xs[k]
+
+
+class Timings:
+	def __init__(self, enabled: bool = False) -> None:
+		self.enabled = enabled
+		# Optional stage hook with enter(name)/exit(name), e.g. profiling.MemoryProfile
+		self.memory: Optional[Any] = None
+		self._lock = threading.Lock()
+		self.reset()
+
+	def reset(self) -> None:
+		self.stages: dict[str, list[float]] = {}  # name -> [seconds, calls]
+		self.counters: dict[str, float] = {}
+		self.latencies: list[float] = []
+
+	def stage(self, name: str) -> Any:
+		"""
+		with TIMINGS.stage("score"): ...  (wall time and call count per stage name)
+		"""
+		if not self.enabled:
+			return _NO_STAGE
+		return _Stage(self, name)
+
+	def add_time(self, name: str, seconds: float) -> None:
+		with self._lock:
+			entry = self.stages.get(name)
+			if entry is None:
+				self.stages[name] = [seconds, 1]
+			else:
+				entry[0] += seconds
+				entry[1] += 1
+
+	def count(self, name: str, n: float = 1) -> None:
+		if self.enabled:
+			with self._lock:
+				self.counters[name] = self.counters.get(name, 0) + n
+
+	def record_latency(self, seconds: float) -> None:
+		if self.enabled:
+			self.latencies.append(seconds)
+
+	def snapshot(self) -> dict[str, Any]:
+		return {
+			"stages": {k: list(v) for k, v in self.stages.items()},
+			"counters": dict(self.counters),
+			"latencies": list(self.latencies),
+		}
+
+	def merge(self, snap: dict[str, Any]) -> None:
+		for name, (seconds, calls) in snap["stages"].items():
+			entry = self.stages.setdefault(name, [0.0, 0])
+			entry[0] += seconds
+			entry[1] += calls
+		for name, n in snap["counters"].items():
+			self.counters[name] = self.counters.get(name, 0) + n
+		self.latencies.extend(snap["latencies"])
+
+	def report(self, wall: Optional[float] = None, workers: int = 1) -> dict[str, Any]:
+		"""
+		Per-stage totals, counters, derived rates and the per-seed latency summary.
+		Stage seconds are summed over workers, so with --workers N they can exceed wall time.
+		"""
+		stages = {
+			name: {
+				"seconds": round(seconds, 6),
+				"calls": int(calls),
+				"mean_ms": round(seconds / calls * 1000.0, 4) if calls else 0.0,
+			}
+			for name, (seconds, calls) in sorted(self.stages.items(), key=lambda kv: -kv[1][0])
+		}
+		lat = sorted(self.latencies)
+		out: dict[str, Any] = {
+			"wall_seconds": None if wall is None else round(wall, 6),
+			"workers": workers,
+			"stages": stages,
+			"counters": {
+				k: (int(v) if float(v).is_integer() else v) for k, v in self.counters.items()
+			},
+			"seed_latency_ms": {
+				"count": len(lat),
+				"p50": round(_quantile(lat, 0.50) * 1000.0, 4),
+				"p95": round(_quantile(lat, 0.95) * 1000.0, 4),
+				"p99": round(_quantile(lat, 0.99) * 1000.0, 4),
+				"max": round(lat[-1] * 1000.0, 4) if lat else 0.0,
+			},
+		}
+
+		rates: dict[str, float] = {}
+		collapse = self.stages.get("score.collapse")
+		if collapse and collapse[0] > 0 and self.counters.get("collapse_sims"):
+			rates["collapse_sims_per_sec"] = round(self.counters["collapse_sims"] / collapse[0], 1)
+		generate = self.stages.get("generate")
+		if generate and generate[0] > 0 and self.counters.get("pick_winner_calls"):
+			calls = self.counters["pick_winner_calls"]
+			rates["pick_winner_per_sec"] = round(calls / generate[0], 1)
+		if wall and lat:
+			rates["seeds_per_sec"] = round(len(lat) / wall, 2)
+		out["rates"] = rates
+		return out
+
+
+TIMINGS = Timings()
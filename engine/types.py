@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Optional
 
 
 @dataclass(frozen=True)
@@ -36,3 +36,4 @@ class SignalReport:
 	scores: dict[str, float]
 	archetype: str
 	reasons: list[str]
+	collapse_stats: Optional[dict[str, Any]] = None  # adaptive MC: sims used, CI half-width
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import statistics
+import time
+from pathlib import Path
+from typing import Iterator
+
+from .packed import TOTAL_SLOTS
+
+# Each simulated game reads two uniforms (chaos noise, then the outcome roll).
+DRAWS_PER_TOURNAMENT = 2 * TOTAL_SLOTS
+
+# "plain" = independent draws. Common random numbers (every bracket of a pool scored
+# against the same realities) is what RealityEnsemble already does for any strategy.
+STRATEGIES = ("plain", "antithetic", "stratified", "qmc")
+
+# Tournaments per independent unit of each strategy's stream. Antithetic rows pair up and
+# stratified/qmc rows are not independent draws, so confidence intervals are taken over
+# pair or batch means instead of single tournaments.
+GROUP_SIZES = {"plain": 1, "antithetic": 2, "stratified": 8, "qmc": 8}
+
+
+class _Replay:
+	"""
+	Stands in for random.Random inside pick_winners_batch: replays a fixed list of uniforms.
+	"""
+
+	def __init__(self, values: list[float]) -> None:
+		self.random = iter(values).__next__
+
+
+def _primes(n: int) -> list[int]:
+	out: list[int] = []
+	k = 2
+	while len(out) < n:
+		if all(k % p for p in out if p * p <= k):
+			out.append(k)
+		k += 1
+	return out
+
+
+def uniform_streams(
+	strategy: str,
+	n: int,
+	rng: random.Random,
+	dims: int = DRAWS_PER_TOURNAMENT,
+) -> Iterator[_Replay]:
+	"""
+	Yields n draw sources, one per simulated tournament, each replaying `dims` uniforms.
+
+	antithetic: tournaments come in pairs (u, 1 - u)
+	stratified: Latin hypercube, every dimension hits each of the n strata exactly once
+	qmc: randomly shifted Kronecker lattice frac(shift + i * sqrt(prime)), a cheap
+	     low-discrepancy sequence that needs no direction-number tables
+	"""
+	if strategy == "plain":
+		for _ in range(n):
+			yield _Replay([rng.random() for _ in range(dims)])
+	elif strategy == "antithetic":
+		for i in range(0, n, 2):
+			u = [rng.random() for _ in range(dims)]
+			yield _Replay(u)
+			if i + 1 < n:
+				yield _Replay([1.0 - x for x in u])
+	elif strategy == "stratified":
+		columns: list[list[float]] = []
+		for _ in range(dims):
+			perm = list(range(n))
+			rng.shuffle(perm)
+			columns.append([(k + rng.random()) / n for k in perm])
+		for i in range(n):
+			yield _Replay([col[i] for col in columns])
+	elif strategy == "qmc":
+		alphas = [math.sqrt(p) % 1.0 for p in _primes(dims)]
+		shifts = [rng.random() for _ in range(dims)]
+		for i in range(1, n + 1):
+			yield _Replay([(s + i * a) % 1.0 for s, a in zip(shifts, alphas)])
+	else:
+		raise ValueError(f"Unknown variance-reduction strategy: {strategy}")
+
+
+def benchmark_strategies(
+	sims: int = 200, reps: int = 30, seeds: tuple[int, ...] = (1, 2, 3)
+) -> list[dict]:
+	"""
+	Effective sample size per second of each strategy's collapse-risk estimate.
+
+	ESS = (single-tournament variance of plain MC) / (variance of the estimate over `reps`
+	independent replications); RMSE is measured against the exact DP value.
+	"crn" compares the pairwise difference of two brackets under common vs independent draws.
+	"""
+	# Local imports: ensemble imports this module for the strategies themselves.
+	from .ensemble import RealityEnsemble
+	from .matchups import load_matchup_table
+	from .packed import PackedBracket, field_from_teams, play_out
+	from .score import _exact_collapse_core
+	from .teams import load_teams
+
+	data = Path(__file__).resolve().parent.parent / "data" / "teams.json"
+	teams = load_teams(data)
+	table = load_matchup_table(data, teams)
+
+	# Synthetic brackets: bracket-mode tournaments with different seeds
+	field = field_from_teams(table.teams)
+	picks = [
+		PackedBracket(
+			table.teams, field, play_out(field, random.Random(seed), table, mode="bracket")
+		)
+		for seed in seeds
+	]
+
+	def estimate(strategy: str, seed: int, p) -> float:
+		ens = RealityEnsemble.simulate(
+			teams, random.Random(seed), sims, table=table, strategy=strategy
+		)
+		return ens.collapse_risk_picks(p.winners)
+
+	rows: list[dict] = []
+	for strategy in STRATEGIES:
+		est: list[float] = []
+		errs: list[float] = []
+		start = time.perf_counter()
+		for p in picks:
+			exact = _exact_collapse_core(p.field, p.winners, p.teams, table)
+			for r in range(reps):
+				x = estimate(strategy, 10_000 + r, p)
+				est.append(x)
+				errs.append((x - exact) ** 2)
+		elapsed = time.perf_counter() - start
+		rmse = math.sqrt(sum(errs) / len(errs))
+		rows.append({"strategy": strategy, "est": est, "rmse": rmse, "secs": elapsed})
+
+	# Single-tournament variance of plain MC, from one long plain run per bracket
+	long_run = RealityEnsemble.simulate(teams, random.Random(99), 2000, table=table)
+	unit_var = statistics.fmean(
+		statistics.variance(list(long_run.survivals(p.winners))) for p in picks
+	)
+
+	out: list[dict] = []
+	n_est = len(seeds) * reps
+	for row in rows:
+		per_bracket = [row["est"][i * reps : (i + 1) * reps] for i in range(len(seeds))]
+		var = statistics.fmean(statistics.variance(xs) for xs in per_bracket)
+		ess = unit_var / var if var > 0 else float("inf")
+		out.append(
+			{
+				"strategy": row["strategy"],
+				"sims": max(80, sims),
+				"ess": ess,
+				"ess_per_sec": ess / (row["secs"] / n_est),
+				"rmse_vs_exact": row["rmse"],
+			}
+		)
+
+	# Common random numbers: variance of risk(b0) - risk(b1) with shared vs independent realities
+	common: list[float] = []
+	indep: list[float] = []
+	start = time.perf_counter()
+	for r in range(reps):
+		ens = RealityEnsemble.simulate(teams, random.Random(20_000 + r), sims, table=table)
+		common.append(
+			ens.collapse_risk_picks(picks[0].winners) - ens.collapse_risk_picks(picks[1].winners)
+		)
+	crn_secs = time.perf_counter() - start
+	for r in range(reps):
+		indep.append(
+			estimate("plain", 30_000 + r, picks[0]) - estimate("plain", 40_000 + r, picks[1])
+		)
+	gain = statistics.variance(indep) / max(statistics.variance(common), 1e-18)
+	out.append(
+		{
+			"strategy": "crn",
+			"sims": max(80, sims),
+			"ess": gain * max(80, sims),
+			"ess_per_sec": gain * max(80, sims) / (crn_secs / reps),
+			"rmse_vs_exact": None,
+		}
+	)
+	return out
+
+
+def main() -> None:
+	p = argparse.ArgumentParser(
+		description="Effective sample size per second of collapse-risk strategies."
+	)
+	p.add_argument("--sims", type=int, default=200, help="Tournaments per estimate.")
+	p.add_argument("--reps", type=int, default=30, help="Independent replications per strategy.")
+	args = p.parse_args()
+
+	print(f"{'strategy':<12} {'sims':>5} {'ESS':>9} {'ESS/sec':>11} {'RMSE':>9}")
+	for row in benchmark_strategies(sims=args.sims, reps=args.reps):
+		rmse = "-" if row["rmse_vs_exact"] is None else f"{row['rmse_vs_exact']:.5f}"
+		print(
+			f"{row['strategy']:<12} {row['sims']:>5} {row['ess']:>9.1f} "
+			f"{row['ess_per_sec']:>11.1f} {rmse:>9}"
+		)
+
+
+if __name__ == "__main__":
+	main()
@@ -1,34 +1,83 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
+import os
 import random
 import shutil
+import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
 from pathlib import Path
 
-from engine.bracket import build_empty_bracket, load_bracket, write_bracket
+from engine.archive import PoolArchive, PoolArchiveWriter
+from engine.bracket import bracket_to_json, build_empty_bracket, load_bracket, write_bracket
+from engine.cache import ArtifactCache, engine_version
 from engine.roast import select_roast_lines
 from engine.persona import profile_from_seed
-from engine.duel import render_duel_card
-from engine.pool import render_office_summary_card, render_superlatives_card, summarize_pool
+from engine.pipeline import BatchWriter, pipelined
+from engine.popularity import PickPopularity, PoolPicks, pool_picks
+from engine.duel import (
+	CONTRAST_DUEL_HEADLINE,
+	CONTRAST_METRICS,
+	DEFAULT_DUEL_HEADLINE,
+	contrast_pairs,
+	contrast_rows,
+	duel_vector,
+	render_duel_card,
+)
+from engine.ensemble import RealityEnsemble
+from engine.journal import JournalMismatch, RunJournal, latest_by_seed, read_journal
+from engine.matchups import MatchupTable, load_matchup_table
+from engine.packed import (
+	TOTAL_SLOTS,
+	PackedBracket,
+	PickMatrix,
+	field_from_teams,
+	pack_bracket,
+	unpack_bracket,
+)
+from engine.pool import (
+	PoolAccumulator,
+	RelabelCounts,
+	add_popularity,
+	aggregate_pool,
+	relabel_row,
+	render_office_summary_card,
+	render_superlatives_card,
+)
 from engine.post import build_post
 from engine.rank import score_shareability
-from engine.score import score_bracket
+from engine.profiling import start_profile
+from engine.server import LRUCache, make_server
+from engine.score import report_from_scores, score_bracket
 from engine.share import get_headline, render_share_card
 from engine.simulate import pick_winner
-from engine.teams import load_teams
+from engine.teams import load_teams, teams_digest
+from engine.timings import TIMINGS
+from engine.store import ORDER_COLUMNS, ResultsStore
+from engine.types import Bracket, SignalReport
 
 
 ROOT = Path(__file__).parent
 DATA = ROOT / "data" / "teams.json"
+JOURNAL_NAME = "run_journal.jsonl"
+STORE_NAME = "results.sqlite"
+# --merge-shards keeps only the pool's top rows, so its sharepack copy is named for that
+MERGED_LEADERBOARD_NAME = "leaderboard_top.json"
+# Pool-wide pick counts and chalk bracket, kept so --post-only can rebuild pick popularity
+POPULARITY_NAME = "pick_popularity.json"
+# Runner-up pairs listed in pool_summary.json with --duel contrast
+CONTRAST_PAIRS_LISTED = 5
 
 def _bar_ascii(x: float, width: int = 9) -> str:
 	n = int(round(max(0.0, min(1.0, x)) * width))
 	return "#" * n + "." * (width - n)
 
 
-def _write_report_md(report_path: Path, archetype: str, scores: dict[str, float], reasons: list[str]) -> None:
+def _report_md_text(archetype: str, scores: dict[str, float], reasons: list[str]) -> str:
 	lines = []
 	lines.append("# SIGNAL REPORT - MARCH MADNESS MADNESS")
 	lines.append("")
@@ -44,11 +93,17 @@ def _write_report_md(report_path: Path, archetype: str, scores: dict[str, float]
 		lines.append(f"- {r}")
 	lines.append("")
 	lines.append("> Built by Signal. Not a prediction engine. A personality test wearing a bracket mask.")
-	report_path.parent.mkdir(parents=True, exist_ok=True)
-	report_path.write_text("\n".join(lines), encoding="utf-8")
+	return "\n".join(lines)
 
 
-def _complete_bracket(bracket, seed: int) -> None:
+def _report_json_text(report: SignalReport) -> str:
+	payload = {"archetype": report.archetype, "scores": report.scores, "reasons": report.reasons}
+	if report.collapse_stats is not None:
+		payload["collapse"] = report.collapse_stats
+	return json.dumps(payload, indent=2)
+
+
+def _complete_bracket(bracket, seed: int, table=None) -> None:
 	"""
 	Given a bracket with Round 1 games present, simulate forward and append rounds 2..6.
 	"""
@@ -58,12 +113,15 @@ def _complete_bracket(bracket, seed: int) -> None:
 	# Round 1
 	r1 = [g for g in bracket.games if g.round == 1]
 	for g in r1:
-		w, tags = pick_winner(g.team_a, g.team_b, rng, 1, mode="bracket", profile=profile)
+		w, tags = pick_winner(
+			g.team_a, g.team_b, rng, 1, mode="bracket", profile=profile, table=table
+		)
 		g.winner = w
 		g.reason_tags = tags
 
 	winners = [g.winner for g in r1]
 	assert all(winners)
+	calls = len(r1)
 
 	total_rounds = 6
 	current_winners = winners  # type: ignore
@@ -79,18 +137,418 @@ def _complete_bracket(bracket, seed: int) -> None:
 			from engine.types import Game  # local import to avoid circular import warnings
 
 			game = Game(slot=slot, round=rnd, team_a=a, team_b=b, winner=None, reason_tags=[])
-			w, tags = pick_winner(a, b, rng, rnd, mode="bracket", profile=profile)
+			w, tags = pick_winner(a, b, rng, rnd, mode="bracket", profile=profile, table=table)
 			game.winner = w
 			game.reason_tags = tags
 			next_games.append(game)
 
 		bracket.games.extend(next_games)
+		calls += len(next_games)
 		current_winners = [g.winner for g in next_games]  # type: ignore
 		if len(current_winners) <= 1:
 			break
+	TIMINGS.count("pick_winner_calls", calls)
+
+
+def _build_ensemble(args: argparse.Namespace, teams, table) -> RealityEnsemble | None:
+	# Every bracket is scored against the same realities: simulate them once.
+	if args.collapse == "exact":
+		return None
+	with TIMINGS.stage("ensemble"):
+		ensemble = RealityEnsemble.simulate(
+			teams, random.Random(1337), sims=args.sims, table=table, strategy=args.variance
+		)
+	TIMINGS.count("reality_games", len(ensemble.rows) * TOTAL_SLOTS)
+	return ensemble
+
+
+@dataclass
+class _SeedContext:
+	args: argparse.Namespace
+	out_dir: Path
+	teams: list
+	table: MatchupTable
+	ensemble: RealityEnsemble | None
+	cache: ArtifactCache | None = None
+	# --pipeline: per-seed files go through the writer thread
+	writer: BatchWriter | None = None
+	# Hash of data/teams.json for the score cache keys, computed once per run
+	data_digest: str = ""
+
+	def __post_init__(self) -> None:
+		if self.cache is not None and not self.data_digest:
+			self.data_digest = teams_digest(DATA)
+
+
+def _build_cache(args: argparse.Namespace) -> ArtifactCache | None:
+	if not args.cache:
+		return None
+	return ArtifactCache(
+		ROOT / args.cache_dir,
+		version=engine_version([Path(__file__)]),
+		max_bytes=int(args.cache_max_mb * 1024 * 1024),
+		max_age=args.cache_max_age_days * 24 * 3600.0,
+	)
+
+
+def _score_key(ctx: _SeedContext, seed_i: int) -> str:
+	# Everything the bracket and its report depend on (not --roast)
+	args = ctx.args
+	assert ctx.cache is not None
+	return ctx.cache.key(
+		"score",
+		ctx.data_digest,
+		seed_i,
+		args.sims,
+		args.collapse,
+		args.collapse_tol,
+		args.collapse_budget_ms,
+		args.variance,
+	)
+
+
+def _bracket_stage(seed_i: int, ctx: _SeedContext, bracket_path: Path) -> Bracket:
+	with TIMINGS.stage("generate"):
+		return _generate_or_load(seed_i, ctx, bracket_path)
+
+
+def _save_bracket(bracket: Bracket, path: Path, writer: BatchWriter | None = None) -> None:
+	if writer is not None:
+		writer.submit(path, json.dumps(bracket_to_json(bracket), indent=2))
+		return
+	with TIMINGS.stage("write"):
+		write_bracket(bracket, path)
+	if TIMINGS.enabled:
+		TIMINGS.count("bytes_written", path.stat().st_size)
+
+
+def _generate_or_load(seed_i: int, ctx: _SeedContext, bracket_path: Path) -> Bracket:
+	args = ctx.args
+	teams = ctx.teams
+	table = ctx.table
+
+	if args.archive:
+		bracket = build_empty_bracket(teams)
+		_complete_bracket(bracket, seed=seed_i, table=table)
+	elif args.force or not bracket_path.exists():
+		bracket = build_empty_bracket(teams)
+		_complete_bracket(bracket, seed=seed_i, table=table)
+		_save_bracket(bracket, bracket_path, ctx.writer)
+	else:
+		try:
+			bracket = load_bracket(bracket_path, teams)
+		except (json.JSONDecodeError, KeyError, ValueError):
+			bracket = build_empty_bracket(teams)
+			_complete_bracket(bracket, seed=seed_i, table=table)
+			_save_bracket(bracket, bracket_path, ctx.writer)
+		else:
+			rounds_present = {g.round for g in bracket.games if g.winner is not None}
+			if 6 not in rounds_present:
+				_complete_bracket(bracket, seed=seed_i, table=table)
+				_save_bracket(bracket, bracket_path, ctx.writer)
+	return bracket
+
+
+def _score_stage(bracket: Bracket, ctx: _SeedContext) -> SignalReport:
+	args = ctx.args
+	with TIMINGS.stage("score"):
+		return score_bracket(
+			bracket,
+			rng=random.Random(1337),
+			sims=args.sims,
+			method=args.collapse,
+			ensemble=ctx.ensemble,
+			table=ctx.table,
+			tol=args.collapse_tol,
+			time_budget=args.collapse_budget_ms / 1000.0 if args.collapse_budget_ms > 0 else None,
+		)
+
+
+def _cached_score_stage(
+	seed_i: int, ctx: _SeedContext, bracket_path: Path
+) -> tuple[SignalReport, bytes]:
+	"""
+	Bracket + report through the cache. Returns (report, packed picks).
+	A bracket file that no longer matches the cached one (edited by hand) is a miss.
+	"""
+	args = ctx.args
+	cache = ctx.cache
+	assert cache is not None
+	key = _score_key(ctx, seed_i)
+	entry = cache.get("score", key)
+
+	if entry is not None and not args.archive and not args.force and bracket_path.exists():
+		if hashlib.sha256(bracket_path.read_bytes()).hexdigest() != entry["bracket_sha256"]:
+			entry = None
+
+	if entry is not None:
+		TIMINGS.count("cache_score_hits")
+		winners = bytes.fromhex(entry["winners"])
+		if not args.archive and (args.force or not bracket_path.exists()):
+			field = field_from_teams(ctx.table.teams)
+			bracket = unpack_bracket(PackedBracket(ctx.table.teams, field, winners))
+			_save_bracket(bracket, bracket_path, ctx.writer)
+		return SignalReport(**entry["report"]), winners
+
+	bracket = _bracket_stage(seed_i, ctx, bracket_path)
+	report = _score_stage(bracket, ctx)
+	winners = pack_bracket(bracket, ctx.table.teams).winners
+	if args.archive or ctx.writer is not None:
+		# Digest of the file write_bracket produces (not yet on disk with --pipeline), so a
+		# later per-file run can reuse it
+		text = json.dumps(bracket_to_json(bracket), indent=2)
+		bracket_sha = hashlib.sha256(text.encode("utf-8")).hexdigest()
+	else:
+		bracket_sha = hashlib.sha256(bracket_path.read_bytes()).hexdigest()
+	cache.put(
+		"score",
+		key,
+		{"winners": winners.hex(), "bracket_sha256": bracket_sha, "report": asdict(report)},
+	)
+	return report, winners
+
+
+def _roast_stage(report: SignalReport, roast: str) -> dict:
+	with TIMINGS.stage("roast_rank"):
+		roast_lines = select_roast_lines(report.reasons, roast)
+		headline = get_headline(report.archetype, report.scores)
+		rank = score_shareability(report.archetype, report.scores, headline, roast_lines)
+	with TIMINGS.stage("render"):
+		card = render_share_card(report.archetype, report.scores, roast_lines)
+	return {"roast_lines": roast_lines, "headline": headline, "rank": rank, "card": card}
+
+
+def _leaderboard_row(seed_i: int, report: SignalReport, staged: dict) -> dict:
+	rank = staged["rank"]
+	return {
+		"seed": seed_i,
+		"archetype": report.archetype,
+		"headline": staged["headline"],
+		"shareability_score": rank["score"],
+		"breakdown": rank["breakdown"],
+		"scores": report.scores,
+	}
+
+
+def _run_seed(seed_i: int, ctx: _SeedContext) -> tuple[dict, SignalReport, bytes, list[Path]]:
+	start = time.perf_counter()
+	outcome = _process_seed(seed_i, ctx)
+	TIMINGS.record_latency(time.perf_counter() - start)
+	TIMINGS.count("seeds")
+	return outcome
+
+
+def _process_seed(seed_i: int, ctx: _SeedContext) -> tuple[dict, SignalReport, bytes, list[Path]]:
+	"""
+	Generate (or load), score and render one seed.
+	Returns (leaderboard row, report, packed picks, paths written). Per-seed files are
+	skipped in archive mode; the caller stores the packed picks instead.
+	"""
+	return _finish_seed(seed_i, *_score_seed(seed_i, ctx), ctx)
+
+
+def _score_seed(seed_i: int, ctx: _SeedContext) -> tuple[SignalReport, bytes]:
+	"""
+	Bracket + report for one seed: (report, packed picks, or b"" outside pool/archive/cache
+	runs).
+	"""
+	bracket_path = ctx.out_dir / f"bracket_{seed_i}.json"
+	if ctx.cache is not None:
+		return _cached_score_stage(seed_i, ctx, bracket_path)
+	bracket = _bracket_stage(seed_i, ctx, bracket_path)
+	report = _score_stage(bracket, ctx)
+	keep = ctx.args.archive or ctx.args.pool
+	winners = pack_bracket(bracket, ctx.table.teams).winners if keep else b""
+	return report, winners
+
+
+def _finish_seed(
+	seed_i: int, report: SignalReport, winners: bytes, ctx: _SeedContext
+) -> tuple[dict, SignalReport, bytes, list[Path]]:
+	"""
+	Roast, rank and render a scored seed, then write (or queue) its report and card files.
+	"""
+	args = ctx.args
+	out_dir = ctx.out_dir
+
+	if ctx.cache is not None:
+		# Keyed by the report itself: a different bracket under the same seed is a miss here too
+		roast_key = ctx.cache.key("roast", asdict(report), args.roast)
+		staged = ctx.cache.get("roast", roast_key)
+		if staged is None:
+			staged = _roast_stage(report, args.roast)
+			ctx.cache.put("roast", roast_key, staged)
+		else:
+			TIMINGS.count("cache_roast_hits")
+	else:
+		staged = _roast_stage(report, args.roast)
+
+	row = _leaderboard_row(seed_i, report, staged)
+
+	if args.archive:
+		return row, report, winners, []
+
+	paths = _seed_paths(out_dir, seed_i)
+	_bracket_path, report_json, report_md, share_card = paths
+	files = [
+		(report_json, _report_json_text(report)),
+		(report_md, _report_md_text(report.archetype, report.scores, staged["roast_lines"])),
+		(share_card, staged["card"]),
+	]
+
+	if ctx.writer is not None:
+		for path, text in files:
+			ctx.writer.submit(path, text)
+		return row, report, winners, paths
+
+	with TIMINGS.stage("write"):
+		for path, text in files:
+			path.write_text(text, encoding="utf-8")
+	if TIMINGS.enabled:
+		TIMINGS.count("bytes_written", sum(p.stat().st_size for p in paths[1:]))
+	return row, report, winners, paths
+
+
+def _seed_paths(out_dir: Path, seed_i: int) -> list[Path]:
+	return [
+		out_dir / f"bracket_{seed_i}.json",
+		out_dir / f"signal_report_{seed_i}.json",
+		out_dir / f"signal_report_{seed_i}.md",
+		out_dir / f"share_card_{seed_i}.txt",
+	]
+
+
+def _journal_settings(args: argparse.Namespace, first_seed: int) -> dict:
+	# Everything a pool's rows depend on: --resume refuses a journal written with other settings
+	return {
+		"seed": first_seed,
+		"pool": args.pool,
+		"shard": args.shard,
+		"sims": args.sims,
+		"collapse": args.collapse,
+		"collapse_tol": args.collapse_tol,
+		"collapse_budget_ms": args.collapse_budget_ms,
+		"variance": args.variance,
+		"roast": args.roast,
+		"archive": args.archive,
+		"teams": teams_digest(DATA),
+		"engine": engine_version([Path(__file__)]),
+	}
+
+
+def _journal_record(row: dict, report: SignalReport, winners: bytes, archive: bool) -> dict:
+	# The picks feed the pool's pick popularity
+	record = {"seed": row["seed"], "row": row, "winners": winners.hex()}
+	if archive:
+		# The archive is rewritten on resume, so it needs the report back too
+		record["report"] = asdict(report)
+	return record
+
+
+def _resumable(args: argparse.Namespace, out_dir: Path, journal_path: Path, settings: dict) -> dict:
+	"""
+	seed -> journal record for seeds a --resume can skip. Outside archive mode a seed
+	counts only if all its files made it to disk.
+	"""
+	if not args.resume:
+		return {}
+	if not journal_path.exists():
+		print(f"[Signal] No journal at {journal_path}; starting from the first seed")
+		return {}
+	try:
+		done = latest_by_seed(read_journal(journal_path, settings))
+	except JournalMismatch as exc:
+		raise SystemExit(f"Cannot resume: {exc}")
+	if not args.archive:
+		done = {
+			seed_i: rec
+			for seed_i, rec in done.items()
+			if all(p.exists() for p in _seed_paths(out_dir, seed_i))
+		}
+	return done
+
+
+def _with_replayed(seeds: list[int], done: dict, outcomes, out_dir: Path, archive: bool):
+	"""
+	Outcomes for every seed in order: journaled seeds are replayed, the rest come from
+	`outcomes` (which covers exactly the seeds not in `done`, in order).
+	"""
+	for seed_i in seeds:
+		rec = done.get(seed_i)
+		if rec is None:
+			yield next(outcomes)
+		elif archive:
+			yield rec["row"], SignalReport(**rec["report"]), bytes.fromhex(rec["winners"]), []
+		else:
+			yield rec["row"], None, bytes.fromhex(rec["winners"]), _seed_paths(out_dir, seed_i)
 
 
-def build_sharepack(out_dir: Path, results_sorted: list[dict], summary: dict, duel_text: str) -> Path:
+def _run_seeds_pipelined(seeds: list[int], ctx: _SeedContext, depth: int):
+	"""
+	Seeds -> generate/score thread -> roast/render thread -> caller, with ctx.writer doing
+	the file writes on its own thread. Every hand-off is bounded by `depth`; outcomes
+	arrive in seed order, exactly as from the serial loop.
+	"""
+
+	def score(seed_i: int):
+		start = time.perf_counter()
+		return seed_i, start, *_score_seed(seed_i, ctx)
+
+	def finish(item):
+		seed_i, start, report, winners = item
+		outcome = _finish_seed(seed_i, report, winners, ctx)
+		TIMINGS.record_latency(time.perf_counter() - start)
+		TIMINGS.count("seeds")
+		return outcome
+
+	return pipelined(seeds, [score, finish], depth=depth)
+
+
+_WORKER_CTX: _SeedContext | None = None
+
+
+def _init_worker(args: argparse.Namespace, out_dir: Path) -> None:
+	global _WORKER_CTX
+	TIMINGS.enabled = args.timings
+	teams = load_teams(DATA)
+	table = load_matchup_table(DATA, teams)
+	_WORKER_CTX = _SeedContext(
+		args, out_dir, teams, table, _build_ensemble(args, teams, table), _build_cache(args)
+	)
+
+
+def _run_chunk(seeds: list[int]) -> tuple[list[tuple[dict, SignalReport, bytes, list[Path]]], dict]:
+	assert _WORKER_CTX is not None
+	outcomes = [_run_seed(seed_i, _WORKER_CTX) for seed_i in seeds]
+	# Hand this chunk's timings to the parent; the worker's ensemble build is sent once
+	snap = TIMINGS.snapshot()
+	TIMINGS.reset()
+	return outcomes, snap
+
+
+def _run_seeds_parallel(seeds: list[int], args: argparse.Namespace, out_dir: Path):
+	"""
+	Fans seeds out to worker processes in chunks and yields outcomes in seed order.
+	Every worker builds the same team table and reality ensemble, so results match a serial run.
+	"""
+	chunk = max(1, min(256, len(seeds) // (args.workers * 4)))
+	chunks = [seeds[i : i + chunk] for i in range(0, len(seeds), chunk)]
+	with ProcessPoolExecutor(
+		max_workers=args.workers, initializer=_init_worker, initargs=(args, out_dir)
+	) as pool:
+		for outcomes, snap in pool.map(_run_chunk, chunks):
+			TIMINGS.merge(snap)
+			yield from outcomes
+
+
+def build_sharepack(
+	out_dir: Path,
+	results_sorted: list[dict],
+	summary: dict,
+	duel_text: str,
+	leaderboard_text: str | None = None,
+	leaderboard_name: str = "leaderboard.json",
+) -> Path:
 	sharepack = out_dir / "sharepack"
 	top3_dir = sharepack / "top3"
 
@@ -103,7 +561,9 @@ def build_sharepack(out_dir: Path, results_sorted: list[dict], summary: dict, du
 	(sharepack / "superlatives_card.txt").write_text(render_superlatives_card(summary), encoding="utf-8")
 	(sharepack / "duel_card.txt").write_text(duel_text, encoding="utf-8")
 
-	(sharepack / "leaderboard.json").write_text(json.dumps(results_sorted, indent=2), encoding="utf-8")
+	if leaderboard_text is None:
+		leaderboard_text = json.dumps(results_sorted, indent=2)
+	(sharepack / leaderboard_name).write_text(leaderboard_text, encoding="utf-8")
 
 	top3 = summary["top3"]
 	for i, r in enumerate(top3, start=1):
@@ -122,7 +582,10 @@ def build_sharepack(out_dir: Path, results_sorted: list[dict], summary: dict, du
 	readme.append("- pool_card.txt")
 	readme.append("- superlatives_card.txt")
 	readme.append("- duel_card.txt")
-	readme.append("- leaderboard.json")
+	if leaderboard_name == "leaderboard.json":
+		readme.append("- leaderboard.json")
+	else:
+		readme.append(f"- {leaderboard_name} (top rows only; full leaderboards are in the shards)")
 	readme.append("- top3/ (top 3 share cards)")
 	readme.append("")
 	readme.append("Tip: paste pool_card.txt + superlatives_card.txt in Slack.")
@@ -131,36 +594,453 @@ def build_sharepack(out_dir: Path, results_sorted: list[dict], summary: dict, du
 	return sharepack
 
 
-def pool_archetype(scores: dict[str, float], t: dict[str, float]) -> str:
-	oc = float(scores.get("overconfidence", 0.0))
-	chaos = float(scores.get("chaos_addiction", 0.0))
-	brand = float(scores.get("brand_bias", 0.0))
-	narr = float(scores.get("narrative_bias", 0.0))
-	collapse = float(scores.get("collapse_risk", 0.0))
+def _render_top_cards(
+	archive: PoolArchive, results_sorted: list[dict], out_dir: Path, roast: str
+) -> None:
+	for r in results_sorted[:3]:
+		report = archive.report(r["seed"])
+		roast_lines = select_roast_lines(report.reasons, roast)
+		card = render_share_card(report.archetype, report.scores, roast_lines)
+		(out_dir / f"share_card_{r['seed']}.txt").write_text(card, encoding="utf-8")
+
+
+def finalize_pool(
+	out_dir: Path,
+	results_sorted: list[dict],
+	duel: str = "superlatives",
+	metric: str = "euclidean",
+	popularity: PoolPicks | None = None,
+) -> str:
+	"""
+	Pool artifacts from leaderboard rows alone: summary, pool/superlatives/duel cards,
+	sharepack/ and POST.txt. Relabels each row's archetype relative to the pool. With the
+	pool's `popularity` the summary also gets pick popularity and leverage superlatives,
+	each row its leverage_bits, and pick_popularity.json is written.
+	Returns the leaderboard JSON, so the root copy need not serialize it again.
+	"""
+	if popularity is not None:
+		_add_leverage(results_sorted, popularity)
+		_write_popularity(out_dir, popularity.popularity)
+	with TIMINGS.stage("pool_summary"):
+		summary = aggregate_pool(results_sorted, popularity)
+
+	with TIMINGS.stage("duel"):
+		left, right, headline = _duel_rows(summary, results_sorted, duel, metric)
+	with TIMINGS.stage("sharepack"):
+		text = json.dumps(results_sorted, indent=2)
+		_write_pool_artifacts(out_dir, summary, left, right, results_sorted, text, headline)
+	return text
+
+
+def _add_leverage(rows: list[dict], popularity: PoolPicks) -> None:
+	# Stored in the rows, so a rebuild from leaderboard.json keeps Most Unique / Most Chalk
+	for row in rows:
+		if row["seed"] in popularity.leverage:
+			row["leverage_bits"] = popularity.leverage[row["seed"]]
+
+
+def _write_popularity(out_dir: Path, counts: PickPopularity) -> None:
+	path = out_dir / POPULARITY_NAME
+	path.write_text(json.dumps(counts.to_record()), encoding="utf-8")
+	print(f"- {path}")
+
+
+def _saved_popularity(source: Path, results_sorted: list[dict]) -> PoolPicks | None:
+	"""
+	Pick popularity for a rebuild from leaderboard.json: the counts from the
+	pick_popularity.json next to it, leverage from the rows. None (with a warning) when
+	the counts are missing or were taken over another pool.
+	"""
+	path = source.parent / POPULARITY_NAME
+	if not path.exists():
+		print(f"[Signal] No {path}: the summary leaves out pick popularity")
+		return None
+	teams = tuple(load_teams(DATA))
+	record = json.loads(path.read_text(encoding="utf-8"))
+	counts = PickPopularity.from_record(teams, field_from_teams(teams), record)
+	if counts is None or counts.brackets != len(results_sorted):
+		print(f"[Signal] {path} is from another pool: the summary leaves out pick popularity")
+		return None
+	leverage = {r["seed"]: r["leverage_bits"] for r in results_sorted if "leverage_bits" in r}
+	if len(leverage) != len(results_sorted):
+		print(f"[Signal] {source} has no leverage scores: Most Unique / Most Chalk are left out")
+		leverage = {}
+	return PoolPicks(counts, leverage)
+
+
+def _duel_rows(
+	summary: dict, results_sorted: list[dict], duel: str = "superlatives", metric: str = "euclidean"
+) -> tuple[dict, dict, str]:
+	"""
+	(left, right, card headline) of the pool duel. "superlatives": Safest-but-Dead vs the
+	Brand Worshipper. "contrast": the two brackets farthest apart on the duel axes; the
+	runner-up pairs are listed in the summary under "contrast_pairs".
+	"""
+	if duel == "contrast" and len(results_sorted) > 1:
+		pairs = contrast_rows(results_sorted, CONTRAST_PAIRS_LISTED, metric)
+		vectors = {r["seed"]: duel_vector(r["scores"]) for _d, a, b in pairs for r in (a, b)}
+		summary["contrast_pairs"] = _contrast_listing(
+			[(d, a["seed"], b["seed"]) for d, a, b in pairs], vectors, metric
+		)
+		left, right = _safer_first(pairs[0][1], pairs[0][2])
+		return left, right, CONTRAST_DUEL_HEADLINE
+
+	sup = summary["superlatives"]
+	seed_left = sup["safest_but_dead"]["seed"]
+	seed_right = sup["most_brand"]["seed"]
+
+	def _find(seed: int):
+		return next(r for r in results_sorted if r["seed"] == seed)
+
+	return _find(seed_left), _find(seed_right), DEFAULT_DUEL_HEADLINE
+
+
+def _contrast_listing(
+	pairs: list[tuple[float, int, int]], vectors: dict[int, tuple], metric: str
+) -> list[dict]:
+	# vectors: seed -> duel vector, for every seed in `pairs`
+	listing = []
+	for d, seed_a, seed_b in pairs:
+		if _safer_key(vectors[seed_b], seed_b) < _safer_key(vectors[seed_a], seed_a):
+			seed_a, seed_b = seed_b, seed_a
+		listing.append({"left": seed_a, "right": seed_b, "metric": metric, "distance": round(d, 6)})
+	return listing
+
+
+def _safer_key(vector: tuple, seed: int) -> tuple[float, int]:
+	# The safer bracket (higher SURVIVE) goes left, as in the superlatives duel
+	return -vector[2], seed
+
+
+def _safer_first(a: dict, b: dict) -> tuple[dict, dict]:
+	key_a = _safer_key(duel_vector(a["scores"]), a["seed"])
+	key_b = _safer_key(duel_vector(b["scores"]), b["seed"])
+	return (a, b) if key_a <= key_b else (b, a)
+
+
+def _pool_texts(
+	summary: dict, left: dict, right: dict, headline: str = DEFAULT_DUEL_HEADLINE
+) -> dict[str, str]:
+	"""
+	Text of each pool artifact: pool_summary.json, the three cards and POST.txt.
+	"""
+	pool_text = render_office_summary_card(summary)
+	sup_text = render_superlatives_card(summary)
+	duel_text = render_duel_card(left, right, headline)
+	post = build_post(summary, duel_text, summary["top3"])
+	post = post.replace("(POOL)", pool_text)
+	post = post.replace("(SUPERLATIVES)", sup_text)
+	post = post.replace("(DUEL)", duel_text)
+	return {
+		"summary": json.dumps(summary, indent=2),
+		"pool_card": pool_text,
+		"superlatives": sup_text,
+		"duel": duel_text,
+		"post": post,
+	}
+
+
+def _write_pool_artifacts(
+	out_dir: Path,
+	summary: dict,
+	left: dict,
+	right: dict,
+	leaderboard: list[dict],
+	leaderboard_text: str | None = None,
+	headline: str = DEFAULT_DUEL_HEADLINE,
+	leaderboard_name: str = "leaderboard.json",
+) -> None:
+	pool_json = out_dir / "pool_summary.json"
+	pool_card = out_dir / "pool_card.txt"
+	sup_path = out_dir / "superlatives_card.txt"
+	duel_path = out_dir / "duel_card.txt"
+	texts = _pool_texts(summary, left, right, headline)
+	pool_text = texts["pool_card"]
+	sup_text = texts["superlatives"]
+	duel_text = texts["duel"]
+	post = texts["post"]
+	pool_json.write_text(texts["summary"], encoding="utf-8")
+	pool_card.write_text(pool_text, encoding="utf-8")
+	sup_path.write_text(sup_text, encoding="utf-8")
+	duel_path.write_text(duel_text, encoding="utf-8")
+
+	print("\n" + render_office_summary_card(summary))
+	print("\n" + sup_text)
+	print("\n" + duel_text)
+	sharepack_path = build_sharepack(
+		out_dir, leaderboard, summary, duel_text, leaderboard_text, leaderboard_name
+	)
+	post_path = sharepack_path / "POST.txt"
+	post_path.write_text(post, encoding="utf-8")
+	print("\n📣 POST (copy/paste)\n")
+	print(post)
+	print(f"- {pool_json}")
+	print(f"- {pool_card}")
+	print(f"- {sup_path}")
+	print(f"- {duel_path}")
+	print(f"- {post_path}")
+	print(f"- {sharepack_path}")
+
+
+def _parse_shard(spec: str) -> tuple[int, int]:
+	try:
+		i, n = (int(x) for x in spec.split("/"))
+	except ValueError:
+		raise ValueError(f"--shard must look like i/N, got: {spec}")
+	if n < 1 or not 1 <= i <= n:
+		raise ValueError(f"--shard needs 1 <= i <= N, got: {spec}")
+	return i, n
+
+
+def _shard_seeds(seeds: list[int], spec: str) -> list[int]:
+	# Contiguous seed ranges, so merged leaderboards keep seed order within equal scores
+	i, n = _parse_shard(spec)
+	size = -(-len(seeds) // n)
+	return seeds[(i - 1) * size : i * size]
+
+
+def _write_shard_state(
+	out_dir: Path, spec: str, results: list[dict], picks: PickMatrix | None = None
+) -> Path:
+	acc = PoolAccumulator()
+	for r in results:
+		acc.add(r)
+	path = out_dir / "pool_shard.json"
+	seeds = [r["seed"] for r in results]
+	state = {
+		"shard": spec,
+		"seeds": [min(seeds), max(seeds)],
+		"accumulator": acc.to_dict(),
+	}
+	if picks is not None:
+		# Only pool runs keep their picks (through the journal)
+		state["pick_counts"] = PickPopularity.from_picks(picks).to_dict()
+	path.write_text(json.dumps(state), encoding="utf-8")
+	return path
+
+
+def merge_shards(
+	shard_dirs: list[Path], out_dir: Path, duel: str = "superlatives", metric: str = "euclidean"
+) -> None:
+	"""
+	Combines `--shard i/N` runs into one pool: merges their accumulators, then makes a
+	second pass over each shard's leaderboard.json to count pool-relative archetypes.
+	Only one shard's rows are in memory at a time; sharepack/leaderboard_top.json lists
+	the pool's top rows. Pick counts merge too; leverage needs every shard's pool archive.
+	"""
+	acc = PoolAccumulator()
+	shard_counts = []
+	for d in shard_dirs:
+		state = json.loads((d / "pool_shard.json").read_text(encoding="utf-8"))
+		acc.merge(PoolAccumulator.from_dict(state["accumulator"]))
+		shard_counts.append(state.get("pick_counts"))
+	if acc.n == 0:
+		raise SystemExit("No shard results to merge")
+
+	popularity = None
+	if all(c is not None for c in shard_counts):
+		teams = tuple(load_teams(DATA))
+		field = field_from_teams(teams)
+		counts = PickPopularity.empty(teams, field)
+		for c in shard_counts:
+			counts.merge(PickPopularity.from_dict(teams, field, c))
+		popularity = PoolPicks(counts)
+		archives = [d / "pool_archive.smm" for d in shard_dirs]
+		if all(a.exists() for a in archives):
+			for a in archives:
+				with PoolArchive(a) as archive:
+					picks = archive.pick_matrix()
+				popularity.leverage.update(zip(picks.seeds, counts.leverage(picks)))
+	holders = set()
+	if popularity is not None:
+		holders = {popularity.most_unique(), popularity.most_chalk()} - {None}
+
+	t = acc.thresholds()
+	relabeled = RelabelCounts(t)
+	# --duel contrast: only the duel vectors of every row are kept
+	vecs: list[tuple[float, float, float, float]] = []
+	seeds: list[int] = []
+	holder_rows = []
+	for d in shard_dirs:
+		for row in json.loads((d / "leaderboard.json").read_text(encoding="utf-8")):
+			relabeled.add(row)
+			if duel == "contrast":
+				vecs.append(duel_vector(row["scores"]))
+				seeds.append(row["seed"])
+			if row["seed"] in holders:
+				holder_rows.append(relabel_row(row, t))
+	summary = acc.summary(relabeled)
+	if popularity is not None:
+		add_popularity(summary, popularity, holder_rows)
+		_add_leverage(summary["top3"], popularity)
+		_write_popularity(out_dir, popularity.popularity)
 
-	# Standout archetypes relative to pool
-	if chaos >= t["chaos_p75"]:
-		return "Chaos Goblin"
-	if narr >= t["narr_p75"]:
-		return "Narrative Romantic"
-	if brand >= t["brand_p75"]:
-		return "Brand Worshipper"
+	# Top share cards were rendered in the shard directories
+	for r in summary["top3"]:
+		name = f"share_card_{r['seed']}.txt"
+		for d in shard_dirs:
+			if (d / name).exists() and d.resolve() != out_dir.resolve():
+				shutil.copyfile(d / name, out_dir / name)
+				break
 
-	# Paradox archetype: high OC + low chaos (relative)
-	if oc >= t["oc_p75"] and chaos <= t["chaos_p25"]:
-		return "Spreadsheet Liar"
+	headline = DEFAULT_DUEL_HEADLINE
+	left = acc.holder("safest_but_dead", t)
+	right = acc.holder("most_brand", t)
+	if len(seeds) > 1:
+		found_pairs = contrast_pairs(vecs, seeds, CONTRAST_PAIRS_LISTED, metric)
+		pairs = [(dist, seeds[i], seeds[j]) for dist, i, j in found_pairs]
+		vectors = {seeds[k]: vecs[k] for _dist, i, j in found_pairs for k in (i, j)}
+		summary["contrast_pairs"] = _contrast_listing(pairs, vectors, metric)
+		wanted = {pairs[0][1], pairs[0][2]}
+		found = {}
+		for d in shard_dirs:
+			for row in json.loads((d / "leaderboard.json").read_text(encoding="utf-8")):
+				if row["seed"] in wanted:
+					found[row["seed"]] = relabel_row(row, t)
+		left, right = _safer_first(found[pairs[0][1]], found[pairs[0][2]])
+		headline = CONTRAST_DUEL_HEADLINE
+	top_rows = acc.top_rows()
+	if popularity is not None:
+		_add_leverage(top_rows, popularity)
+	_write_pool_artifacts(
+		out_dir,
+		summary,
+		left,
+		right,
+		top_rows,
+		headline=headline,
+		leaderboard_name=MERGED_LEADERBOARD_NAME,
+	)
 
-	# Stability archetype: low collapse (relative)
-	if collapse <= t["collapse_p25"]:
-		return "Quiet Assassin"
 
-	return "Social Copycat"
+def _write_leaderboard(out_dir: Path, results_sorted: list[dict], text: str | None = None) -> None:
+	leaderboard_path = out_dir / "leaderboard.json"
+	if text is None:
+		text = json.dumps(results_sorted, indent=2)
+	leaderboard_path.write_text(text, encoding="utf-8")
 
+	print("\nTOP 3 SHARE CARDS")
+	for i, r in enumerate(results_sorted[:3], start=1):
+		print(
+			f"{i}) seed {r['seed']} - {r['archetype']} - "
+			f"{r['shareability_score']:.2f} - {r['headline']}"
+		)
+	print(f"- {leaderboard_path}")
 
-def parse_args() -> argparse.Namespace:
+
+def _write_store(out_dir: Path, results_sorted: list[dict]) -> None:
+	store_path = out_dir / STORE_NAME
+	with ResultsStore(store_path) as store:
+		# Archetypes are relative to one pool's thresholds: never mix rows of two runs
+		store.clear()
+		store.add_rows(results_sorted)
+	print(f"- {store_path}")
+
+
+def load_results(path: Path, roast: str) -> list[dict]:
+	"""
+	Leaderboard rows of an earlier run, from its leaderboard.json or its pool archive.
+	Nothing is simulated: archive rows are rebuilt from the stored picks and scores.
+	"""
+	if path.suffix == ".smm":
+		rows = []
+		with PoolArchive(path) as archive:
+			for rec in archive:
+				report = report_from_scores(rec.packed, rec.scores)
+				roast_lines = select_roast_lines(report.reasons, roast)
+				headline = get_headline(report.archetype, report.scores)
+				rank = score_shareability(report.archetype, report.scores, headline, roast_lines)
+				rows.append(
+					{
+						"seed": rec.seed,
+						"archetype": report.archetype,
+						"headline": headline,
+						"shareability_score": rank["score"],
+						"breakdown": rank["breakdown"],
+						"scores": report.scores,
+					}
+				)
+	else:
+		rows = json.loads(path.read_text(encoding="utf-8"))
+	return sorted(rows, key=lambda r: r["shareability_score"], reverse=True)
+
+
+def _post_only(args: argparse.Namespace, out_dir: Path) -> None:
+	source = Path(args.from_results) if args.from_results else out_dir / "leaderboard.json"
+	if not source.exists():
+		raise SystemExit(f"No results to rebuild from: {source} (run a pool first)")
+	results_sorted = load_results(source, args.roast)
+	if source.suffix == ".smm":
+		with PoolArchive(source) as archive:
+			_render_top_cards(archive, results_sorted, out_dir, args.roast)
+			popularity = pool_picks(archive.pick_matrix())
+	else:
+		popularity = _saved_popularity(source, results_sorted)
+	text = finalize_pool(out_dir, results_sorted, args.duel, args.duel_metric, popularity)
+	_write_leaderboard(out_dir, results_sorted, text)
+	if args.sqlite:
+		_write_store(out_dir, results_sorted)
+
+
+def _write_timings(out_dir: Path, wall: float, workers: int) -> None:
+	report = TIMINGS.report(wall=wall, workers=workers)
+	path = out_dir / "timings.json"
+	path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+	lat = report["seed_latency_ms"]
+	print(f"\nTIMINGS (wall {wall:.3f}s, {lat['count']} seeds, workers {workers})")
+	for name, st in report["stages"].items():
+		print(
+			f"  {name:<15} {st['seconds']:>9.3f}s {st['calls']:>8} calls "
+			f"{st['mean_ms']:>10.3f} ms/call"
+		)
+	print(
+		f"  seed latency    p50 {lat['p50']:.2f} ms  p95 {lat['p95']:.2f} ms  "
+		f"max {lat['max']:.2f} ms"
+	)
+	for name, rate in report["rates"].items():
+		print(f"  {name:<22} {rate:,.1f}")
+	print(f"- {path}")
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
 	p = argparse.ArgumentParser(description="Signal March Madness Madness - bracket personality test.")
 	p.add_argument("--seed", type=str, default="42", help="Seed for bracket generation (integer or 'random').")
-	p.add_argument("--sims", type=int, default=400, help="Monte Carlo sims for collapse risk.")
+	p.add_argument(
+		"--sims",
+		type=int,
+		default=400,
+		help="Monte Carlo sims for collapse risk (cap for adaptive).",
+	)
+	p.add_argument(
+		"--collapse",
+		type=str,
+		default="mc",
+		choices=["mc", "exact", "adaptive"],
+		help=(
+			"Collapse risk estimator: Monte Carlo (mc), exact DP (exact) "
+			"or early-stopping MC (adaptive)."
+		),
+	)
+	p.add_argument(
+		"--collapse-tol",
+		type=float,
+		default=0.01,
+		help="Adaptive collapse: stop once the 95%% CI half-width is below this.",
+	)
+	p.add_argument(
+		"--collapse-budget-ms",
+		type=float,
+		default=0.0,
+		help="Adaptive collapse: per-bracket time budget in ms (0 = no limit).",
+	)
+	p.add_argument(
+		"--variance",
+		type=str,
+		default="plain",
+		choices=["plain", "antithetic", "stratified", "qmc"],
+		help="Variance reduction for the shared reality ensemble (see python -m engine.variance).",
+	)
 	p.add_argument(
 		"--roast",
 		type=str,
@@ -173,11 +1053,345 @@ def parse_args() -> argparse.Namespace:
 	p.add_argument("--out", type=str, default="output", help="Output directory (default: output).")
 	p.add_argument("--force", action="store_true", help="Regenerate bracket even if output/bracket.json exists.")
 	p.add_argument("--load", action="store_true", help="Load existing bracket from output/bracket.json (default).")
-	return p.parse_args()
+	p.add_argument(
+		"--archive",
+		action="store_true",
+		help=(
+			"Store brackets and scores in one pool archive (pool_archive.smm) "
+			"instead of per-seed files."
+		),
+	)
+	p.add_argument(
+		"--workers", type=int, default=1, help="Worker processes for per-seed generation/scoring."
+	)
+	p.add_argument(
+		"--pipeline",
+		action="store_true",
+		help="Overlap scoring, rendering and file writes in bounded stage queues (same output).",
+	)
+	p.add_argument(
+		"--resume",
+		action="store_true",
+		help=(
+			"Pool runs: skip seeds already recorded in <out>/run_journal.jsonl "
+			"by an interrupted run."
+		),
+	)
+	p.add_argument("--queue-depth", type=int, default=64, help="--pipeline: items between stages.")
+	p.add_argument("--write-queue", type=int, default=256, help="--pipeline: pending file writes.")
+	p.add_argument(
+		"--post-only",
+		action="store_true",
+		help="Rebuild pool summary, cards, sharepack and POST.txt from <out>/leaderboard.json.",
+	)
+	p.add_argument(
+		"--from-results",
+		type=str,
+		default="",
+		help="Like --post-only, reading a leaderboard.json or pool_archive.smm from this path.",
+	)
+	p.add_argument(
+		"--duel",
+		type=str,
+		default="superlatives",
+		choices=["superlatives", "contrast"],
+		help="Pool duel: Safest-but-Dead vs Brand Worshipper, or the most contrasting pair.",
+	)
+	p.add_argument(
+		"--duel-metric",
+		type=str,
+		default="euclidean",
+		choices=list(CONTRAST_METRICS),
+		help="--duel contrast: distance over the four duel axes.",
+	)
+	p.add_argument(
+		"--sqlite",
+		action="store_true",
+		help="Also store the leaderboard rows in <out>/results.sqlite (see `run.py query`).",
+	)
+	p.add_argument(
+		"--timings",
+		action="store_true",
+		help="Print per-stage timings and per-seed latency percentiles; writes <out>/timings.json.",
+	)
+	p.add_argument(
+		"--profile",
+		type=str,
+		default="",
+		choices=["cpu", "mem"],
+		help="cProfile (cpu) or tracemalloc per stage (mem); reports go to <out>/profile/.",
+	)
+	p.add_argument(
+		"--shard",
+		type=str,
+		default="",
+		help="Run only shard i/N of the seed range and write pool_shard.json for --merge-shards.",
+	)
+	p.add_argument(
+		"--merge-shards",
+		type=str,
+		nargs="+",
+		default=[],
+		metavar="DIR",
+		help="Build the pool summary, cards and POST.txt from the output dirs of --shard runs.",
+	)
+	p.add_argument(
+		"--cache",
+		action="store_true",
+		help="Reuse brackets, reports and cards from the artifact cache when inputs are unchanged.",
+	)
+	p.add_argument(
+		"--cache-dir", type=str, default=".signal_cache", help="Artifact cache directory."
+	)
+	p.add_argument(
+		"--cache-max-mb",
+		type=float,
+		default=512,
+		help="Evict oldest cache entries above this size.",
+	)
+	p.add_argument(
+		"--cache-max-age-days", type=float, default=30, help="Evict cache entries older than this."
+	)
+	return p.parse_args(argv)
+
+
+class _ServeBackend:
+	"""
+	Warm engine behind `run.py serve`: the team table, matchup caches and reality
+	ensemble are built once; scored seeds are kept in an LRU. Every response is the
+	text of the artifact the CLI would write for the same settings.
+	"""
+
+	def __init__(self, args: argparse.Namespace, seed_cache: int, max_pool: int) -> None:
+		self.args = args
+		self.max_pool = max_pool
+		teams = load_teams(DATA)
+		table = load_matchup_table(DATA, teams)
+		ensemble = _build_ensemble(args, teams, table)
+		self.ctx = _SeedContext(args, ROOT / args.out, teams, table, ensemble)
+		self.seeds = LRUCache(seed_cache)
+
+	def _seed(self, seed_i: int, roast: str) -> tuple[dict, SignalReport, dict, bytes]:
+		key = (seed_i, roast)
+		hit = self.seeds.get(key)
+		if hit is not None:
+			return hit
+		# archive mode: generate in memory, no per-seed files
+		bracket = _bracket_stage(seed_i, self.ctx, Path(os.devnull))
+		report = _score_stage(bracket, self.ctx)
+		staged = _roast_stage(report, roast)
+		winners = pack_bracket(bracket, self.ctx.table.teams).winners
+		out = (_leaderboard_row(seed_i, report, staged), report, staged, winners)
+		self.seeds.put(key, out)
+		return out
+
+	@staticmethod
+	def _int(params: dict[str, str], name: str, default: int | None = None) -> int:
+		raw = params.get(name)
+		if raw is None:
+			if default is None:
+				raise ValueError(f"Missing ?{name}=")
+			return default
+		try:
+			return int(raw)
+		except ValueError:
+			raise ValueError(f"?{name}= must be an integer, got: {raw}")
+
+	def _roast(self, params: dict[str, str]) -> str:
+		roast = params.get("roast", self.args.roast)
+		if roast not in ("friendly", "normal", "unhinged"):
+			raise ValueError(f"?roast= must be friendly, normal or unhinged, got: {roast}")
+		return roast
+
+	def card(self, params: dict[str, str]) -> tuple[str, str]:
+		"""share_card_<seed>.txt"""
+		_row, _report, staged, _winners = self._seed(self._int(params, "seed"), self._roast(params))
+		return "text/plain; charset=utf-8", staged["card"]
+
+	def report(self, params: dict[str, str]) -> tuple[str, str]:
+		"""signal_report_<seed>.json, or .md with ?format=md"""
+		_row, report, staged, _winners = self._seed(self._int(params, "seed"), self._roast(params))
+		if params.get("format", "json") == "md":
+			text = _report_md_text(report.archetype, report.scores, staged["roast_lines"])
+			return "text/markdown; charset=utf-8", text
+		return "application/json", _report_json_text(report)
+
+	def pool(self, params: dict[str, str]) -> tuple[str, str]:
+		"""
+		Pool of seeds start..start+n-1, like `run.py --seed start --pool n`:
+		?part=summary (pool_summary.json), pool_card, superlatives, duel, post or leaderboard.
+		"""
+		start = self._int(params, "start", 42)
+		n = self._int(params, "n", 24)
+		if not 1 <= n <= self.max_pool:
+			raise ValueError(f"?n= must be between 1 and {self.max_pool}")
+		roast = self._roast(params)
+		part = params.get("part", "summary")
+
+		# Copies: relabeling must not touch the cached rows
+		outs = [self._seed(start + i, roast) for i in range(n)]
+		rows = [dict(out[0]) for out in outs]
+		results_sorted = sorted(rows, key=lambda r: r["shareability_score"], reverse=True)
+		teams = self.ctx.table.teams
+		picks = PickMatrix(
+			teams,
+			field_from_teams(teams),
+			[start + i for i in range(n)],
+			bytearray(b"".join(out[3] for out in outs)),
+		)
+		popularity = pool_picks(picks)
+		_add_leverage(results_sorted, popularity)
+		summary = aggregate_pool(results_sorted, popularity)
+		if part == "leaderboard":
+			return "application/json", json.dumps(results_sorted, indent=2)
+		duel = _duel_rows(summary, results_sorted, self.args.duel, self.args.duel_metric)
+		texts = _pool_texts(summary, *duel)
+		if part not in texts:
+			parts = ", ".join([*texts, "leaderboard"])
+			raise ValueError(f"Unknown ?part={part} (one of: {parts})")
+		ctype = "application/json" if part == "summary" else "text/plain; charset=utf-8"
+		return ctype, texts[part]
+
+	def metrics(self) -> dict:
+		ensemble = self.ctx.ensemble
+		return {
+			"seed_cache": self.seeds.stats(),
+			"engine": {
+				"sims": self.args.sims,
+				"collapse": self.args.collapse,
+				"variance": self.args.variance,
+				"ensemble_rows": len(ensemble) if ensemble is not None else 0,
+			},
+		}
+
+
+def serve(argv: list[str]) -> None:
+	p = argparse.ArgumentParser(
+		prog="run.py serve", description="Local scoring server, bound to 127.0.0.1 only."
+	)
+	p.add_argument("--port", type=int, default=8765, help="Port on 127.0.0.1.")
+	p.add_argument("--cache-size", type=int, default=4096, help="Cached responses (LRU).")
+	p.add_argument("--seed-cache", type=int, default=100_000, help="Cached scored seeds (LRU).")
+	p.add_argument("--max-pool", type=int, default=5000, help="Largest ?n= accepted by /pool.")
+	p.add_argument("--verbose", action="store_true", help="Log every request.")
+	serve_args, engine_argv = p.parse_known_args(argv)
+
+	# Everything else (--sims, --collapse, --variance, --roast, ...) is read as for a normal run
+	args = parse_args(engine_argv + ["--archive"])
+	backend = _ServeBackend(args, serve_args.seed_cache, serve_args.max_pool)
+	routes = {"/card": backend.card, "/report": backend.report, "/pool": backend.pool}
+	server = make_server(
+		routes,
+		serve_args.port,
+		cache_size=serve_args.cache_size,
+		extra_metrics=backend.metrics,
+		quiet=not serve_args.verbose,
+	)
+	print(f"[Signal] Serving on http://127.0.0.1:{server.server_address[1]} (Ctrl+C to stop)")
+	print("[Signal] /card?seed=  /report?seed=[&format=md]  /pool?start=&n=[&part=]  /metrics")
+	try:
+		server.serve_forever()
+	except KeyboardInterrupt:
+		pass
+	finally:
+		server.server_close()
+
+
+def query(argv: list[str]) -> None:
+	p = argparse.ArgumentParser(
+		prog="run.py query", description="Leaderboard queries against a results.sqlite store."
+	)
+	p.add_argument(
+		"--db", type=str, default=f"output/{STORE_NAME}", help="Store written by --sqlite."
+	)
+	p.add_argument("--top", type=int, default=10, help="Number of rows.")
+	p.add_argument("--archetype", type=str, default=None, help="Only this archetype.")
+	p.add_argument(
+		"--by",
+		type=str,
+		default="shareability",
+		choices=ORDER_COLUMNS,
+		help="Order by this column.",
+	)
+	p.add_argument("--asc", action="store_true", help="Lowest first.")
+	p.add_argument("--seed", type=int, default=None, help="Look up one seed.")
+	p.add_argument("--stats", action="store_true", help="Row count per archetype.")
+	p.add_argument("--json", action="store_true", help="Print rows as leaderboard.json rows.")
+	args = p.parse_args(argv)
+
+	db = Path(args.db)
+	if not db.is_absolute():
+		db = ROOT / db
+	try:
+		store = ResultsStore(db, readonly=True)
+	except FileNotFoundError as exc:
+		raise SystemExit(f"{exc} (run a pool with --sqlite first)")
+
+	with store:
+		if args.stats:
+			counts = store.archetypes()
+			if args.json:
+				print(json.dumps({"total": sum(counts.values()), "archetypes": counts}, indent=2))
+				return
+			print(f"{sum(counts.values())} brackets")
+			for name, n in counts.items():
+				print(f"  {name:<24} {n}")
+			return
+
+		if args.seed is not None:
+			row = store.by_seed(args.seed)
+			if row is None:
+				raise SystemExit(f"Seed {args.seed} is not in {db}")
+			rows = [row]
+		else:
+			rows = store.top(args.top, archetype=args.archetype, by=args.by, ascending=args.asc)
+
+	if args.json:
+		print(json.dumps(rows, indent=2))
+		return
+	for i, r in enumerate(rows, start=1):
+		line = (
+			f"{i}) seed {r['seed']} - {r['archetype']} - {r['shareability_score']:.2f}"
+			f" - {r['headline']}"
+		)
+		if args.by != "shareability":
+			line += f" - {args.by} {r['scores'][args.by]:.3f}"
+		print(line)
 
 
 def main() -> None:
+	if len(sys.argv) > 1 and sys.argv[1] == "serve":
+		serve(sys.argv[2:])
+		return
+	if len(sys.argv) > 1 and sys.argv[1] == "query":
+		query(sys.argv[2:])
+		return
+
 	args = parse_args()
+	if not args.profile:
+		_main(args)
+		return
+
+	if args.profile == "mem" and args.pipeline:
+		# Stage threads would interleave the nested stage peaks
+		raise SystemExit("--profile mem needs the serial seed loop; drop --pipeline")
+	profile = start_profile(args.profile)
+	if args.profile == "mem":
+		TIMINGS.memory = profile
+	with profile:
+		_main(args)
+	TIMINGS.memory = None
+
+	print(f"\nPROFILE ({args.profile})")
+	if args.workers > 1:
+		print("(worker processes are not profiled; use --workers 1 for a full profile)")
+	elif args.pipeline:
+		print("(pipeline stage threads are not profiled; drop --pipeline for a full profile)")
+	for path in profile.write(ROOT / args.out / "profile"):
+		print(f"- {path}")
+
+
+def _main(args: argparse.Namespace) -> None:
 	
 	# Resolve seed: support "random" or integer
 	if args.seed == "random":
@@ -191,130 +1405,139 @@ def main() -> None:
 			raise ValueError(f"--seed must be an integer or 'random', got: {args.seed}")
 	
 	out_dir = ROOT / args.out
+	if args.post_only or args.from_results:
+		out_dir.mkdir(parents=True, exist_ok=True)
+		_post_only(args, out_dir)
+		return
+	if args.merge_shards:
+		out_dir.mkdir(parents=True, exist_ok=True)
+		merge_shards([Path(d) for d in args.merge_shards], out_dir, args.duel, args.duel_metric)
+		return
+
 	if args.pool and args.pool > 0:
 		args.count = args.pool
-	teams = load_teams(DATA)
+	TIMINGS.enabled = args.timings or args.profile == "mem"
+	wall_start = time.perf_counter()
+	with TIMINGS.stage("teams_load"):
+		teams = load_teams(DATA)
+		table = load_matchup_table(DATA, teams)
 	out_dir.mkdir(parents=True, exist_ok=True)
 
-	results = []
-	print("Generated:")
-	for i in range(max(1, args.count)):
-		seed_i = resolved_seed + i
-		bracket_path = out_dir / f"bracket_{seed_i}.json"
-		report_json = out_dir / f"signal_report_{seed_i}.json"
-		report_md = out_dir / f"signal_report_{seed_i}.md"
-		share_card = out_dir / f"share_card_{seed_i}.txt"
-
-		if args.force or not bracket_path.exists():
-			bracket = build_empty_bracket(teams)
-			_complete_bracket(bracket, seed=seed_i)
-			write_bracket(bracket, bracket_path)
-		else:
-			try:
-				bracket = load_bracket(bracket_path, teams)
-			except (json.JSONDecodeError, KeyError, ValueError):
-				bracket = build_empty_bracket(teams)
-				_complete_bracket(bracket, seed=seed_i)
-				write_bracket(bracket, bracket_path)
-			else:
-				rounds_present = {g.round for g in bracket.games if g.winner is not None}
-				if 6 not in rounds_present:
-					_complete_bracket(bracket, seed=seed_i)
-					write_bracket(bracket, bracket_path)
-
-		report = score_bracket(bracket, rng=random.Random(1337), sims=args.sims)
-		roast_lines = select_roast_lines(report.reasons, args.roast)
-		headline = get_headline(report.archetype, report.scores)
-		rank = score_shareability(report.archetype, report.scores, headline, roast_lines)
+	ensemble = None
+	if args.workers <= 1:
+		ensemble = _build_ensemble(args, teams, table)
 
-		report_json.write_text(
-			json.dumps(
-				{"archetype": report.archetype, "scores": report.scores, "reasons": report.reasons},
-				indent=2,
-			),
-			encoding="utf-8",
-		)
-		_write_report_md(report_md, report.archetype, report.scores, roast_lines)
+	archive_path = out_dir / "pool_archive.smm"
+	writer = None
+	if args.archive:
+		writer = PoolArchiveWriter(archive_path, table.teams, field_from_teams(table.teams))
 
-		share_card.write_text(
-			render_share_card(report.archetype, report.scores, roast_lines),
-			encoding="utf-8",
-		)
+	seeds = [resolved_seed + i for i in range(max(1, args.count))]
+	if args.shard:
+		seeds = _shard_seeds(seeds, args.shard)
+		if not seeds:
+			raise SystemExit(f"Shard {args.shard} has no seeds (only {args.count} in the range)")
+	# Pool runs journal every finished seed; the pool is finalized from the journal
+	journal = None
+	journal_path = out_dir / JOURNAL_NAME
+	done: dict = {}
+	pending = seeds
+	if args.pool and args.pool > 0:
+		settings = _journal_settings(args, resolved_seed)
+		done = _resumable(args, out_dir, journal_path, settings)
+		if done:
+			print(f"[Signal] Resuming: {len(done)} of {len(seeds)} seeds already done")
+			pending = [seed_i for seed_i in seeds if seed_i not in done]
+		journal = RunJournal(journal_path, settings, resume=bool(done))
 
-		results.append(
-			{
-				"seed": seed_i,
-				"archetype": report.archetype,
-				"headline": headline,
-				"shareability_score": rank["score"],
-				"breakdown": rank["breakdown"],
-				"scores": report.scores,
-			}
-		)
+	file_writer = None
+	if args.workers > 1:
+		outcomes = _run_seeds_parallel(pending, args, out_dir)
+		if args.pipeline:
+			# Workers write their own files; overlap their results with the archive writes here
+			outcomes = pipelined(outcomes, [], depth=args.queue_depth)
+	else:
+		ctx = _SeedContext(args, out_dir, teams, table, ensemble, _build_cache(args))
+		if args.pipeline:
+			file_writer = ctx.writer = BatchWriter(depth=args.write_queue)
+			outcomes = _run_seeds_pipelined(pending, ctx, args.queue_depth)
+		else:
+			outcomes = (_run_seed(seed_i, ctx) for seed_i in pending)
+	if done:
+		outcomes = _with_replayed(seeds, done, iter(outcomes), out_dir, args.archive)
 
-		print(f"- {bracket_path}")
-		print(f"- {report_json}")
-		print(f"- {report_md}")
-		print(f"- {share_card}")
+	results = []
+	print("Generated:")
+	try:
+		with TIMINGS.stage("seeds"):
+			for row, report, winners, paths in outcomes:
+				if journal is None:
+					results.append(row)
+				elif row["seed"] not in done:
+					with TIMINGS.stage("journal"):
+						journal.append(_journal_record(row, report, winners, args.archive))
+				if writer is not None:
+					with TIMINGS.stage("archive_write"):
+						packed = PackedBracket(table.teams, writer.field, winners)
+						writer.add(row["seed"], packed, report, row["shareability_score"])
+				for path in paths:
+					print(f"- {path}")
+	finally:
+		if file_writer is not None:
+			# The sharepack below copies share cards: every queued write must land first
+			with TIMINGS.stage("write_drain"):
+				file_writer.close()
+			TIMINGS.count("bytes_written", file_writer.bytes_written)
+		if journal is not None:
+			journal.close()
 
-	results_sorted = sorted(results, key=lambda r: r["shareability_score"], reverse=True)
+	picks = None
+	if journal is not None:
+		with TIMINGS.stage("journal_read"):
+			latest = latest_by_seed(read_journal(journal_path))
+		results = [latest[seed_i]["row"] for seed_i in seeds]
+		data = bytearray()
+		for seed_i in seeds:
+			data += bytes.fromhex(latest[seed_i]["winners"])
+		picks = PickMatrix(table.teams, field_from_teams(table.teams), seeds, data)
 
-	if args.pool and args.pool > 0:
-		summary = summarize_pool(results_sorted)
-		t = summary["thresholds"]
-		for r in results_sorted:
-			r["archetype"] = pool_archetype(r["scores"], t)
-			summary = summarize_pool(results_sorted)
-		pool_json = out_dir / "pool_summary.json"
-		pool_card = out_dir / "pool_card.txt"
-		sup_path = out_dir / "superlatives_card.txt"
-		duel_path = out_dir / "duel_card.txt"
-		pool_text = render_office_summary_card(summary)
-		sup_text = render_superlatives_card(summary)
-		pool_json.write_text(json.dumps(summary, indent=2), encoding="utf-8")
-		pool_card.write_text(pool_text, encoding="utf-8")
-		sup_path.write_text(sup_text, encoding="utf-8")
-
-		sup = summary["superlatives"]
-		seed_left = sup["safest_but_dead"]["seed"]
-		seed_right = sup["most_brand"]["seed"]
-
-		def _find(seed: int):
-			return next(r for r in results_sorted if r["seed"] == seed)
-
-		left = _find(seed_left)
-		right = _find(seed_right)
-		duel_text = render_duel_card(left, right)
-		duel_path.write_text(duel_text, encoding="utf-8")
-		post = build_post(summary, duel_text, summary["top3"])
-		post = post.replace("(POOL)", pool_text)
-		post = post.replace("(SUPERLATIVES)", sup_text)
-		post = post.replace("(DUEL)", duel_text)
-
-		print("\n" + render_office_summary_card(summary))
-		print("\n" + sup_text)
-		print("\n" + duel_text)
-		sharepack_path = build_sharepack(out_dir, results_sorted, summary, duel_text)
-		post_path = sharepack_path / "POST.txt"
-		post_path.write_text(post, encoding="utf-8")
-		print("\n📣 POST (copy/paste)\n")
-		print(post)
-		print(f"- {pool_json}")
-		print(f"- {pool_card}")
-		print(f"- {sup_path}")
-		print(f"- {duel_path}")
-		print(f"- {post_path}")
-		print(f"- {sharepack_path}")
+	results_sorted = sorted(results, key=lambda r: r["shareability_score"], reverse=True)
 
-	leaderboard_path = out_dir / "leaderboard.json"
-	leaderboard_path.write_text(json.dumps(results_sorted, indent=2), encoding="utf-8")
+	if writer is not None:
+		writer.close()
+		TIMINGS.count("bytes_written", archive_path.stat().st_size)
+		print(f"- {archive_path}")
+		# Per-seed files are skipped in archive mode; only the top cards are rendered
+		# (for sharepack/).
+		with PoolArchive(archive_path) as archive:
+			_render_top_cards(archive, results_sorted, out_dir, args.roast)
 
-	print("\nTOP 3 SHARE CARDS")
-	for i, r in enumerate(results_sorted[:3], start=1):
-		print(
-			f"{i}) seed {r['seed']} - {r['archetype']} - {r['shareability_score']:.2f} - {r['headline']}"
+	leaderboard_text = None
+	if args.shard:
+		print(f"- {_write_shard_state(out_dir, args.shard, results, picks)}")
+	elif args.pool and args.pool > 0:
+		# Pool runs read their picks back from the journal
+		with TIMINGS.stage("popularity"):
+			popularity = pool_picks(picks)
+		leaderboard_text = finalize_pool(
+			out_dir, results_sorted, args.duel, args.duel_metric, popularity
 		)
-	print(f"- {leaderboard_path}")
+
+	cache = _build_cache(args)
+	if cache is not None:
+		cache.prune()
+
+	with TIMINGS.stage("write"):
+		_write_leaderboard(out_dir, results_sorted, leaderboard_text)
+	if args.sqlite:
+		with TIMINGS.stage("sqlite"):
+			_write_store(out_dir, results_sorted)
+	if journal is not None:
+		# Finished: nothing left to resume
+		journal_path.unlink()
+
+	if args.timings:
+		_write_timings(out_dir, time.perf_counter() - wall_start, args.workers)
 
 
 if __name__ == "__main__":